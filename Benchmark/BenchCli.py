@@ -0,0 +1,95 @@
+# 命令行入口冷启动预算检查：导入耗时、list 命令端到端耗时，且全程不导入 PySide6 和 winreg
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import subprocess
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Benchmark.Fixture import CreateFixture, FixtureOptions
+
+
+ROOT_DIR = Path(__file__).parent.parent
+
+# 命令行入口不允许导入的模块
+FORBIDDEN_MODULES = ("PySide6", "shiboken6", "winreg")
+
+# 在子进程中导入并执行命令行入口，输出导入耗时和已导入的禁用模块（命令结果丢弃）
+PROBE_SCRIPT = """
+import sys, json, time, io, contextlib
+Start = time.perf_counter()
+sys.path.insert(0, {Root!r})
+import Cli
+ImportTime = time.perf_counter() - Start
+sys.argv = ["Cli.py"] + {Argv!r}
+with contextlib.redirect_stdout(io.StringIO()):
+    Code = Cli.Main()
+Loaded = sorted(M for M in sys.modules if M.split(".")[0] in {Forbidden!r})
+print(json.dumps({{"Import": ImportTime, "Code": Code, "Loaded": Loaded}}))
+"""
+
+
+def RunProbe(Argv: list[str], Env: dict) -> dict:
+    """在新进程中导入并执行命令行入口"""
+    Script = PROBE_SCRIPT.format(Root=str(ROOT_DIR), Argv=Argv, Forbidden=FORBIDDEN_MODULES)
+    Output = subprocess.run([sys.executable, "-c", Script], env=Env, capture_output=True, text=True, check=True)
+    return json.loads(Output.stdout.strip().splitlines()[-1])
+
+
+def RunCli(Argv: list[str], Env: dict) -> float:
+    """以独立进程执行命令行入口，返回进程启动到退出的耗时（秒）"""
+    Start = time.perf_counter()
+    subprocess.run([sys.executable, str(ROOT_DIR / "Cli.py")] + Argv, env=Env,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - Start
+
+
+def Main() -> int:
+    Parser = argparse.ArgumentParser(description="检查命令行入口的冷启动耗时预算")
+    Parser.add_argument("--project-plugins", type=int, default=100, help="项目插件数量")
+    Parser.add_argument("--engine-plugins", type=int, default=1000, help="引擎插件数量")
+    Parser.add_argument("--repeat", type=int, default=5, help="重复次数（取最短）")
+    Parser.add_argument("--import-budget", type=float, default=300, help="导入耗时预算（毫秒）")
+    Parser.add_argument("--list-budget", type=float, default=1500, help="缓存命中时 list 命令的耗时预算（毫秒）")
+    Args = Parser.parse_args()
+
+    Data = CreateFixture(FixtureOptions(ProjectPlugins=Args.project_plugins, EnginePlugins=Args.engine_plugins))
+    try:
+        # 缓存写入模拟目录，不影响本机的缓存
+        Env = dict(os.environ, LOCALAPPDATA=str(Data.Root))
+        Env.pop("UEPM_TRACE", None)
+        Argv = ["--project", str(Data.ProjectPath), "--engine", str(Data.EnginePath), "list", "--json"]
+
+        Cold = RunCli(Argv, Env)
+        Probes = [RunProbe(Argv, Env) for _ in range(Args.repeat)]
+        Warm = min(RunCli(Argv, Env) for _ in range(Args.repeat))
+    finally:
+        shutil.rmtree(Data.Root, ignore_errors=True)
+
+    ImportTime = min(Probe["Import"] for Probe in Probes) * 1000
+    Loaded = sorted({Name for Probe in Probes for Name in Probe["Loaded"]})
+    Failures = []
+    if any(Probe["Code"] != 0 for Probe in Probes):
+        Failures.append("list 命令执行失败")
+    if Loaded:
+        Failures.append(f"导入了禁用的模块: {', '.join(Loaded)}")
+    if ImportTime > Args.import_budget:
+        Failures.append(f"导入耗时 {ImportTime:.0f} ms 超出预算 {Args.import_budget:.0f} ms")
+    if Warm * 1000 > Args.list_budget:
+        Failures.append(f"list 耗时 {Warm * 1000:.0f} ms 超出预算 {Args.list_budget:.0f} ms")
+
+    print(f"插件数: {Args.project_plugins + Args.engine_plugins}，单位: 毫秒")
+    print(f"导入 Cli:        {ImportTime:8.1f}  (预算 {Args.import_budget:.0f})")
+    print(f"list（无缓存）:  {Cold * 1000:8.1f}")
+    print(f"list（缓存命中）:{Warm * 1000:8.1f}  (预算 {Args.list_budget:.0f})")
+    for Failure in Failures:
+        print(f"失败: {Failure}")
+    return 1 if Failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -0,0 +1,107 @@
+# 插件描述文件解析性能对比：正则去尾随逗号 + json.loads 与描述文件解析器
+import re
+import sys
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import Source.Data.DescriptorParser as DescriptorModule
+from Source.Data.DescriptorParser import DescriptorParser, LoadDescriptor
+from Source.Data.PluginReader import DESCRIPTOR_KEYS
+
+
+def MakeDescriptor(Index: int, Relaxed: bool) -> bytes:
+    """生成一个模拟的 .uplugin 内容，Relaxed 时带尾随逗号"""
+    Data = {
+        "FileVersion": 3,
+        "Version": Index,
+        "VersionName": f"1.{Index}",
+        "FriendlyName": f"Plugin {Index}",
+        # 每十个插件有一个描述包含 ",]"，原实现会改写这类字符串
+        "Description": "示例插件描述 [A, B,] 以及转义 \"引号\"" if Index % 10 == 0 else "示例插件描述，包含 \"引号\"",
+        "Category": random.choice(["Rendering", "Editor", "Gameplay", "Audio"]),
+        "CreatedBy": "Epic Games, Inc.",
+        "CreatedByURL": "https://epicgames.com",
+        "DocsURL": "",
+        "MarketplaceURL": "",
+        "SupportURL": "",
+        "EnabledByDefault": Index % 3 == 0,
+        "CanContainContent": True,
+        "IsBetaVersion": False,
+        "Installed": False,
+        "Modules": [
+            {"Name": f"Module{Index}_{i}", "Type": "Runtime", "LoadingPhase": "Default",
+             "PlatformAllowList": ["Win64", "Mac", "Linux"]}
+            for i in range(random.randint(1, 4))
+        ],
+        "Plugins": [{"Name": f"Dep{j}", "Enabled": True} for j in range(random.randint(0, 5))]
+    }
+    Text = json.dumps(Data, indent="\t", ensure_ascii=False)
+    if Relaxed:
+        Text = Text.replace("\n\t}", ",\n\t}").replace("\n\t]", ",\n\t]")
+    return ("\ufeff" + Text).encode("utf-8")
+
+
+def ParseOld(Content: bytes) -> dict:
+    """原实现：整体正则替换后再 json.loads"""
+    Text = Content.decode("utf-8-sig")
+    Text = re.sub(r',(\s*[\]\}])', r'\1', Text)
+    return json.loads(Text)
+
+
+def ParseLenient(Content: bytes) -> dict:
+    """直接使用宽松解析器（不先尝试标准 JSON）"""
+    return DescriptorParser(Content.decode("utf-8-sig")).Parse(DESCRIPTOR_KEYS)
+
+
+def ParseNew(Content: bytes) -> dict:
+    """新实现：标准/快速 JSON 优先，失败时宽松解析"""
+    return LoadDescriptor(Content, DESCRIPTOR_KEYS)
+
+
+def TimeIt(Func, Items: list, Repeat: int) -> float:
+    """执行多次取最短耗时，返回每个文件的微秒数"""
+    Best = float("inf")
+    for _ in range(Repeat):
+        Start = time.perf_counter()
+        for Item in Items:
+            Func(Item)
+        Best = min(Best, time.perf_counter() - Start)
+    return Best / len(Items) * 1e6
+
+
+def Main():
+    Parser = argparse.ArgumentParser(description="对比插件描述文件的解析耗时")
+    Parser.add_argument("--files", type=int, default=2000, help="描述文件数量")
+    Parser.add_argument("--repeat", type=int, default=5, help="重复次数（取最短）")
+    Parser.add_argument("--stdlib", action="store_true", help="不使用快速 JSON 后端")
+    Args = Parser.parse_args()
+    if Args.stdlib:
+        DescriptorModule.FastJson = None
+
+    random.seed(0)
+    Sets = {
+        "标准 JSON": [MakeDescriptor(i, False) for i in range(Args.files)],
+        "尾随逗号": [MakeDescriptor(i, True) for i in range(Args.files)],
+    }
+
+    # 正则方式会把字符串中的 ",]" 改成 "]"
+    Sample = Sets["尾随逗号"][0]
+    print(f"正则方式描述字段是否被改写: {ParseOld(Sample)['Description'] != ParseNew(Sample)['Description']}")
+    FastJson = DescriptorModule.FastJson
+    print(f"快速 JSON 后端: {FastJson.__name__ if FastJson else '未使用（标准库 json）'}")
+    print(f"文件数: {Args.files}，单位: 微秒/文件")
+    print(f"{'':10}{'正则+json':>12}{'宽松解析':>12}{'新实现':>12}")
+    for Name, Items in Sets.items():
+        Old = TimeIt(ParseOld, Items, Args.repeat)
+        Lenient = TimeIt(ParseLenient, Items, Args.repeat)
+        New = TimeIt(ParseNew, Items, Args.repeat)
+        print(f"{Name:10}{Old:12.1f}{Lenient:12.1f}{New:12.1f}")
+
+
+if __name__ == "__main__":
+    Main()
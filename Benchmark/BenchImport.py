@@ -0,0 +1,103 @@
+# 导入耗时分析：用 python -X importtime 统计各入口模块的导入耗时，列出最慢的模块和已加载的按需模块
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).parent.parent
+
+# 默认分析的入口模块（未安装 PySide6 时界面模块会被跳过）
+DEFAULT_MODULES = ["Source.Logic.PluginManager", "Cli", "Source.UI.MainWindow", "Main"]
+
+# 应按需导入的模块，启动阶段不应出现
+DEFERRED_MODULES = ("shutil", "subprocess", "send2trash", "winreg", "multiprocessing", "concurrent.futures.process")
+
+# -X importtime 的输出行：import time: 自身(us) | 累计(us) | 缩进的模块名
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+# 在子进程中导入入口模块，输出已加载的按需模块
+PROBE_SCRIPT = """
+import sys, json
+sys.path.insert(0, {Root!r})
+import {Module}
+print(json.dumps(sorted(M for M in {Deferred!r} if M in sys.modules)))
+"""
+
+
+def ProfileModule(Module: str) -> dict:
+    """在新进程中导入模块并解析 -X importtime 输出，返回 {Total, Modules, Deferred}，导入失败时返回 {Error}"""
+    Script = PROBE_SCRIPT.format(Root=str(ROOT_DIR), Module=Module, Deferred=DEFERRED_MODULES)
+    Env = dict(os.environ)
+    Env.pop("UEPM_TRACE", None)
+    Output = subprocess.run([sys.executable, "-X", "importtime", "-c", Script],
+                            env=Env, capture_output=True, text=True)
+    if Output.returncode != 0:
+        return {"Error": Output.stderr.strip().splitlines()[-1]}
+
+    Modules = {}
+    Total = 0
+    for Line in Output.stderr.splitlines():
+        Match = IMPORT_LINE.match(Line)
+        if not Match:
+            continue
+        Self, Cumulative, Indent, Name = Match.groups()
+        Modules[Name] = {"Self": int(Self) / 1000, "Cumulative": int(Cumulative) / 1000}
+        # 顶层导入（缩进为 1）的累计耗时之和为全部导入耗时
+        if len(Indent) == 1:
+            Total += int(Cumulative) / 1000
+    return {"Total": Total, "Modules": Modules, "Deferred": json.loads(Output.stdout.strip().splitlines()[-1])}
+
+
+def PrintProfile(Module: str, Profile: dict, Top: int):
+    """打印单个入口模块的分析结果"""
+    if "Error" in Profile:
+        print(f"\n{Module}: 跳过（{Profile['Error']}）")
+        return
+    print(f"\n{Module}: 共 {Profile['Total']:.1f} ms")
+    Slowest = sorted(Profile["Modules"].items(), key=lambda Item: Item[1]["Cumulative"], reverse=True)
+    for Name, Item in Slowest[:Top]:
+        print(f"  {Name:40}{Item['Cumulative']:10.1f}{Item['Self']:10.1f}")
+    print(f"  已加载的按需模块: {', '.join(Profile['Deferred']) or '无'}")
+
+
+def Main() -> int:
+    Parser = argparse.ArgumentParser(description="分析入口模块的导入耗时")
+    Parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="入口模块")
+    Parser.add_argument("--repeat", type=int, default=5, help="重复次数（取总耗时最短的一次）")
+    Parser.add_argument("--top", type=int, default=15, help="列出累计耗时最长的模块数")
+    Parser.add_argument("--output", type=Path, help="结果保存路径（JSON）")
+    Parser.add_argument("--baseline", type=Path, help="对比的基线结果（JSON）")
+    Args = Parser.parse_args()
+
+    Results = {}
+    print(f"{'':42}{'累计(ms)':>10}{'自身(ms)':>10}")
+    for Module in Args.modules:
+        Profiles = [ProfileModule(Module) for _ in range(Args.repeat)]
+        Valid = [P for P in Profiles if "Error" not in P]
+        Results[Module] = min(Valid, key=lambda P: P["Total"]) if Valid else Profiles[0]
+        PrintProfile(Module, Results[Module], Args.top)
+
+    if Args.output:
+        Args.output.write_text(json.dumps(Results, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"\n结果已保存: {Args.output}")
+
+    if Args.baseline:
+        Baseline = json.loads(Args.baseline.read_text(encoding="utf-8"))
+        print(f"\n与基线对比：\n{'':42}{'基线(ms)':>10}{'当前(ms)':>10}")
+        for Module, Profile in Results.items():
+            Old = Baseline.get(Module, {})
+            if "Total" not in Profile or "Total" not in Old:
+                continue
+            print(f"{Module:42}{Old['Total']:10.1f}{Profile['Total']:10.1f}")
+            Removed = sorted(set(Old["Deferred"]) - set(Profile["Deferred"]))
+            if Removed:
+                print(f"  不再在启动时加载: {', '.join(Removed)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
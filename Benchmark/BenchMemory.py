@@ -0,0 +1,96 @@
+# 插件记录内存占用对比：原 dataclass 记录与紧凑记录（字符串驻留 + 详情按需读取）
+import gc
+import sys
+import shutil
+import argparse
+import tracemalloc
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Benchmark.Fixture import CreateFixture, FixtureOptions
+from Source.Data.PluginCache import PluginCache
+from Source.Data.PluginReader import PluginInfo, PluginSource, ReadPluginFields
+from Source.Data.PluginScanner import IterPluginFiles
+from Source.Logic.PluginManager import PluginManager
+
+
+@dataclass
+class LegacyPluginInfo:
+    """原实现的插件记录（常驻全部字段）"""
+    Name: str
+    Path: Path
+    Source: PluginSource
+    Version: str = ""
+    Description: str = ""
+    Category: str = ""
+    CreatedBy: str = ""
+    DocsURL: str = ""
+    EnabledByDefault: bool = False
+    CanContainContent: bool = False
+    IsBetaVersion: bool = False
+    Modules: list = field(default_factory=list)
+    Plugins: list = field(default_factory=list)
+    EnabledInProject: Optional[bool] = None
+
+
+def MeasureRecords(Files: list[Path], Compact: bool) -> int:
+    """解析全部文件并构建记录，返回记录常驻的字节数"""
+    gc.collect()
+    tracemalloc.start()
+    Records = []
+    for UPluginFile in Files:
+        Fields = ReadPluginFields(UPluginFile)
+        if Compact:
+            Plugin = PluginInfo(Name=UPluginFile.stem, Path=UPluginFile.parent, Source=PluginSource.Project, **Fields)
+            Plugin.ReleaseDetails()
+        else:
+            Plugin = LegacyPluginInfo(Name=UPluginFile.stem, Path=UPluginFile.parent, Source=PluginSource.Project, **Fields)
+        Records.append(Plugin)
+    gc.collect()
+    Size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return Size
+
+
+def MeasureManager(ProjectPath: Path, EnginePath: Path, CachePath: Path) -> int:
+    """加载整个项目（含缓存和搜索索引），返回管理器常驻的字节数"""
+    gc.collect()
+    tracemalloc.start()
+    Manager = PluginManager(Cache=PluginCache(CachePath))
+    Manager.LoadProject(ProjectPath, EnginePath)
+    gc.collect()
+    Size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return Size
+
+
+def Main():
+    Parser = argparse.ArgumentParser(description="对比插件记录的内存占用")
+    Parser.add_argument("--plugins", type=int, default=5000, help="插件数量")
+    Args = Parser.parse_args()
+
+    Fixture = CreateFixture(FixtureOptions(ProjectPlugins=Args.plugins, EnginePlugins=0, MarketplacePlugins=0))
+    try:
+        Files = list(IterPluginFiles(Fixture.ProjectPath / "Plugins"))
+        Legacy = MeasureRecords(Files, False)
+        Compact = MeasureRecords(Files, True)
+
+        # 第一次加载解析并写入缓存，第二次为命中缓存的热启动
+        CachePath = Fixture.Root / "PluginCache.json"
+        Cold = MeasureManager(Fixture.ProjectPath, Fixture.EnginePath, CachePath)
+        Warm = MeasureManager(Fixture.ProjectPath, Fixture.EnginePath, CachePath)
+
+        print(f"插件数: {Args.plugins}，单位: 字节/插件")
+        print(f"原记录:       {Legacy / Args.plugins:8.0f}")
+        print(f"紧凑记录:     {Compact / Args.plugins:8.0f}  ({Compact / Legacy:.0%})")
+        print(f"管理器(冷):   {Cold / Args.plugins:8.0f}")
+        print(f"管理器(热):   {Warm / Args.plugins:8.0f}")
+    finally:
+        shutil.rmtree(Fixture.Root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    Main()
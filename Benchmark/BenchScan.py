@@ -0,0 +1,59 @@
+# 插件目录扫描性能对比：rglob 与剪枝遍历
+import sys
+import time
+import shutil
+import tempfile
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Benchmark.Fixture import BuildFixture, FixtureOptions
+from Source.Data.PluginScanner import IterPluginFiles
+
+
+def BuildTree(Root: Path, PluginCount: int, FillerCount: int) -> Path:
+    """生成模拟引擎插件目录（每十个插件带一个嵌套子插件），返回引擎 Plugins 目录"""
+    Options = FixtureOptions(
+        ProjectPlugins=0, EnginePlugins=PluginCount, MarketplacePlugins=0,
+        Depth=1, FillerFiles=FillerCount, NestedEvery=10
+    )
+    return BuildFixture(Root, Options).EnginePath / "Engine" / "Plugins"
+
+
+def TimeIt(Func, Repeat: int) -> tuple[float, int]:
+    """执行多次取最短耗时，返回 (秒, 结果数)"""
+    Best = float("inf")
+    Count = 0
+    for _ in range(Repeat):
+        Start = time.perf_counter()
+        Count = len(list(Func()))
+        Best = min(Best, time.perf_counter() - Start)
+    return Best, Count
+
+
+def Main():
+    Parser = argparse.ArgumentParser(description="对比 rglob 与剪枝遍历的插件扫描耗时")
+    Parser.add_argument("--plugins", type=int, default=500, help="插件数量")
+    Parser.add_argument("--filler", type=int, default=40, help="每个大体积目录中的填充文件数")
+    Parser.add_argument("--repeat", type=int, default=3, help="重复次数（取最短）")
+    Args = Parser.parse_args()
+
+    Root = Path(tempfile.mkdtemp(prefix="UEPluginScan_"))
+    try:
+        PluginsDir = BuildTree(Root, Args.plugins, Args.filler)
+
+        RglobTime, RglobCount = TimeIt(lambda: PluginsDir.rglob("*.uplugin"), Args.repeat)
+        WalkTime, WalkCount = TimeIt(lambda: IterPluginFiles(PluginsDir), Args.repeat)
+
+        print(f"插件数: {Args.plugins}, 每目录填充文件: {Args.filler}")
+        print(f"rglob:    {RglobTime * 1000:8.1f} ms  ({RglobCount} 个)")
+        print(f"剪枝遍历: {WalkTime * 1000:8.1f} ms  ({WalkCount} 个)")
+        if WalkTime > 0:
+            print(f"加速比:   {RglobTime / WalkTime:8.1f}x")
+    finally:
+        shutil.rmtree(Root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    Main()
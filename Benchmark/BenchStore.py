@@ -0,0 +1,81 @@
+# 插件统计和过滤性能对比：对象列表逐个遍历与列式存储的掩码运算
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Source.Data.PluginReader import PluginInfo, PluginSource
+from Source.Logic.PluginStore import PluginStore, AndMasks, MaskRows
+
+
+def MakePlugins(Count: int) -> list[PluginInfo]:
+    """生成模拟插件（不读取文件）"""
+    Categories = ["Rendering", "Editor", "Gameplay", "Audio", "Animation", "Networking"]
+    Plugins = []
+    for i in range(Count):
+        Plugins.append(PluginInfo(
+            Name=f"Plugin{i}",
+            Path=Path(f"Plugins/Plugin{i}"),
+            Source=random.choice(list(PluginSource)),
+            Category=random.choice(Categories),
+            CreatedBy=random.choice(["Epic Games, Inc.", "Studio A", "Studio B"]),
+            EnabledByDefault=random.random() < 0.3,
+            Plugins=[f"Plugin{random.randrange(Count)}" for _ in range(random.randint(0, 3))],
+            EnabledInProject=random.choice([None, None, None, True, False])
+        ))
+    return Plugins
+
+
+def TimeIt(Func, Repeat: int) -> float:
+    """执行多次取最短耗时，返回毫秒数"""
+    Best = float("inf")
+    for _ in range(Repeat):
+        Start = time.perf_counter()
+        Func()
+        Best = min(Best, time.perf_counter() - Start)
+    return Best * 1000
+
+
+def Main():
+    Parser = argparse.ArgumentParser(description="对比对象列表与列式存储的统计和过滤耗时")
+    Parser.add_argument("--plugins", type=int, default=50000, help="插件数量")
+    Parser.add_argument("--repeat", type=int, default=20, help="重复次数（取最短）")
+    Args = Parser.parse_args()
+
+    random.seed(0)
+    Plugins = MakePlugins(Args.plugins)
+    Lists = {Source: [P for P in Plugins if P.Source == Source] for Source in PluginSource}
+    Store = PluginStore()
+    for Plugin in Plugins:
+        Store.Add(Plugin)
+    Engine = PluginSource.Engine
+
+    Cases = [
+        ("启用数统计",
+         lambda: sum(P.IsEnabled() for Items in Lists.values() for P in Items),
+         lambda: Store.CountEnabled()),
+        ("单来源启用数",
+         lambda: sum(P.IsEnabled() for P in Lists[Engine]),
+         lambda: Store.CountEnabled(Engine)),
+        ("空搜索结果",
+         lambda: {Source: Items.copy() for Source, Items in Lists.items()},
+         lambda: {Source: Store.GetView(Source).Copy() for Source in PluginSource}),
+        ("分类列表",
+         lambda: sorted({P.Category for P in Lists[Engine] if P.Category}),
+         lambda: Store.GetCategories(Engine)),
+        ("启用的引擎插件",
+         lambda: [P for P in Lists[Engine] if P.IsEnabled()],
+         lambda: MaskRows(AndMasks(Store.GetEnabledMask(), Store.GetSourceMask(Engine)))),
+    ]
+
+    print(f"插件数: {Args.plugins}，单位: 毫秒")
+    print(f"{'':14}{'对象列表':>10}{'列式存储':>10}")
+    for Name, ListFunc, StoreFunc in Cases:
+        print(f"{Name:14}{TimeIt(ListFunc, Args.repeat):10.2f}{TimeIt(StoreFunc, Args.repeat):10.2f}")
+
+
+if __name__ == "__main__":
+    Main()
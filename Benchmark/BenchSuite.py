@@ -0,0 +1,211 @@
+# 基准测试套件：在模拟项目和引擎目录上测量扫描、搜索、依赖连锁和统计，结果保存为 JSON 并与基线对比
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+from pathlib import Path
+from dataclasses import asdict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Benchmark.Fixture import Fixture, FixtureOptions, CreateFixture
+from Source.Data.PluginCache import PluginCache
+from Source.Data.PluginReader import PluginSource
+from Source.Logic.PluginManager import PluginManager
+
+
+# 结果文件格式版本
+RESULT_VERSION = 1
+
+# 各搜索字段模拟逐字输入的查询：0名称 1作者 2分类 3描述 4依赖 5被依赖
+SEARCH_QUERIES = {
+    0: "engineplugin12",
+    1: "epic games",
+    2: "rendering",
+    3: "support runtime",
+    4: "engineplugin3",
+    5: "projectplugin1",
+}
+
+
+def Summarize(Samples: list[float]) -> dict:
+    """汇总多次测量（秒）"""
+    return {
+        "Best": min(Samples),
+        "Mean": sum(Samples) / len(Samples),
+        "Max": max(Samples),
+        "Runs": len(Samples),
+    }
+
+
+def LoadManager(Data: Fixture, CachePath: Path) -> PluginManager:
+    """加载模拟项目"""
+    Manager = PluginManager(Cache=PluginCache(CachePath))
+    Manager.LoadProject(Data.ProjectPath, Data.EnginePath)
+    return Manager
+
+
+def BenchScan(Data: Fixture, Repeat: int) -> dict:
+    """冷扫描（无解析缓存）和热扫描（缓存全部命中）"""
+    CachePath = Data.Root / "PluginCache.json"
+    Cold = []
+    Warm = []
+    for _ in range(Repeat):
+        CachePath.unlink(missing_ok=True)
+        Start = time.perf_counter()
+        LoadManager(Data, CachePath)
+        Cold.append(time.perf_counter() - Start)
+
+        Start = time.perf_counter()
+        LoadManager(Data, CachePath)
+        Warm.append(time.perf_counter() - Start)
+    return {"ColdScan": Summarize(Cold), "WarmScan": Summarize(Warm)}
+
+
+def BenchSearch(Manager: PluginManager, Repeat: int) -> dict:
+    """各字段逐字输入时每次按键的搜索耗时"""
+    Results = {}
+    for Field, Query in SEARCH_QUERIES.items():
+        Samples = []
+        for _ in range(Repeat):
+            Manager.Search("", Field)
+            for i in range(1, len(Query) + 1):
+                Start = time.perf_counter()
+                Manager.Search(Query[:i], Field)
+                Samples.append(time.perf_counter() - Start)
+        Manager.Search("", 0)
+        Results[f"SearchField{Field}"] = Summarize(Samples)
+    return Results
+
+
+def BenchCascade(Manager: PluginManager, Repeat: int, Samples: int) -> dict:
+    """依赖连锁：首次查询（含依赖图构建）和之后的单个插件查询"""
+    Rng = random.Random(0)
+    Plugins = [P for Source in PluginSource for P in Manager.Plugins[Source]]
+    Targets = Rng.sample(Plugins, min(Samples, len(Plugins)))
+
+    Build = []
+    Query = []
+    for _ in range(Repeat):
+        Manager.Graph = None
+        Start = time.perf_counter()
+        Manager.GetGraph()
+        Build.append(time.perf_counter() - Start)
+
+        for Plugin in Targets:
+            Start = time.perf_counter()
+            Manager.GetDisabledDependencies(Plugin.Name, Plugin.Source)
+            Manager.GetDisabledDependents(Plugin.Name, Plugin.Source)
+            Manager.GetImpactSet(Plugin.Name, Plugin.Source)
+            Query.append(time.perf_counter() - Start)
+    return {"CascadeBuild": Summarize(Build), "CascadeQuery": Summarize(Query)}
+
+
+def BenchStats(Manager: PluginManager, Repeat: int) -> dict:
+    """状态栏统计"""
+    Samples = []
+    for _ in range(Repeat * 10):
+        Start = time.perf_counter()
+        Manager.GetStats()
+        Samples.append(time.perf_counter() - Start)
+    return {"Stats": Summarize(Samples)}
+
+
+def Compare(Results: dict, Baseline: dict, Threshold: float, Metric: str) -> list[str]:
+    """按指定指标（Best/Mean）与基线对比并打印，返回变慢超过阈值的项目"""
+    Regressions = []
+    print(f"\n与基线对比（指标 {Metric}，阈值 {Threshold:.0%}）：")
+    print(f"{'':16}{'基线(ms)':>12}{'当前(ms)':>12}{'比值':>8}")
+    for Name, Current in Results.items():
+        Old = Baseline.get("Results", {}).get(Name)
+        if not Old or not Old[Metric]:
+            print(f"{Name:16}{'-':>12}{Current[Metric] * 1000:12.3f}{'-':>8}")
+            continue
+        Ratio = Current[Metric] / Old[Metric]
+        Mark = ""
+        if Ratio > 1 + Threshold:
+            Mark = "  变慢"
+            Regressions.append(Name)
+        elif Ratio < 1 - Threshold:
+            Mark = "  变快"
+        print(f"{Name:16}{Old[Metric] * 1000:12.3f}{Current[Metric] * 1000:12.3f}{Ratio:8.2f}{Mark}")
+    return Regressions
+
+
+def Main() -> int:
+    Parser = argparse.ArgumentParser(description="在模拟 UE 项目和引擎目录上运行基准测试")
+    Parser.add_argument("--project-plugins", type=int, default=200, help="项目插件数量")
+    Parser.add_argument("--engine-plugins", type=int, default=2000, help="引擎插件数量")
+    Parser.add_argument("--fab-plugins", type=int, default=200, help="商城插件数量")
+    Parser.add_argument("--fanout", type=int, default=3, help="每个插件最多依赖的插件数")
+    Parser.add_argument("--depth", type=int, default=2, help="分类目录层数")
+    Parser.add_argument("--trailing-comma", type=float, default=0.2, help="带尾随逗号的描述文件比例")
+    Parser.add_argument("--bom", type=float, default=0.2, help="带 BOM 的描述文件比例")
+    Parser.add_argument("--filler", type=int, default=5, help="每个插件大体积目录中的填充文件数")
+    Parser.add_argument("--conflicts", type=int, default=10, help="与引擎插件同名的项目插件数")
+    Parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    Parser.add_argument("--repeat", type=int, default=3, help="重复次数")
+    Parser.add_argument("--cascade-samples", type=int, default=200, help="依赖连锁查询的插件数")
+    Parser.add_argument("--output", type=Path, help="结果保存路径（JSON）")
+    Parser.add_argument("--baseline", type=Path, help="对比的基线结果（JSON）")
+    Parser.add_argument("--threshold", type=float, default=0.2, help="判定变慢的比例阈值")
+    Parser.add_argument("--metric", choices=["Best", "Mean"], default="Mean", help="与基线对比的指标")
+    Parser.add_argument("--keep", action="store_true", help="保留生成的模拟目录")
+    Args = Parser.parse_args()
+
+    Options = FixtureOptions(
+        ProjectPlugins=Args.project_plugins,
+        EnginePlugins=Args.engine_plugins,
+        MarketplacePlugins=Args.fab_plugins,
+        FanOut=Args.fanout,
+        Depth=Args.depth,
+        TrailingCommaRatio=Args.trailing_comma,
+        BomRatio=Args.bom,
+        FillerFiles=Args.filler,
+        ConflictCount=Args.conflicts,
+        Seed=Args.seed
+    )
+    Data = CreateFixture(Options)
+    try:
+        print(f"模拟目录: {Data.Root}")
+        Results = BenchScan(Data, Args.repeat)
+        Manager = LoadManager(Data, Data.Root / "PluginCache.json")
+        Results.update(BenchSearch(Manager, Args.repeat))
+        Results.update(BenchCascade(Manager, Args.repeat, Args.cascade_samples))
+        Results.update(BenchStats(Manager, Args.repeat))
+    finally:
+        if not Args.keep:
+            shutil.rmtree(Data.Root, ignore_errors=True)
+
+    print(f"{'':16}{'最短(ms)':>12}{'平均(ms)':>12}{'最长(ms)':>12}")
+    for Name, Item in Results.items():
+        print(f"{Name:16}{Item['Best'] * 1000:12.3f}{Item['Mean'] * 1000:12.3f}{Item['Max'] * 1000:12.3f}")
+
+    Report = {
+        "Version": RESULT_VERSION,
+        "Meta": {
+            "Time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "Python": platform.python_version(),
+            "Platform": platform.platform(),
+            "Options": asdict(Options),
+        },
+        "Results": Results,
+    }
+    if Args.output:
+        Args.output.write_text(json.dumps(Report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"\n结果已保存: {Args.output}")
+
+    if Args.baseline:
+        Baseline = json.loads(Args.baseline.read_text(encoding="utf-8"))
+        if Baseline.get("Meta", {}).get("Options") != Report["Meta"]["Options"]:
+            print("\n注意：基线的模拟目录参数与本次不同，对比结果仅供参考")
+        if Compare(Results, Baseline, Args.threshold, Args.metric):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
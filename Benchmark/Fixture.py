@@ -0,0 +1,153 @@
+# 基准测试用的模拟 UE 项目和引擎目录生成器
+import sys
+import json
+import random
+import tempfile
+from pathlib import Path
+from dataclasses import dataclass, field
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Source.Data.PluginReader import PluginSource
+
+
+# 每个插件下生成填充文件的目录（剪枝遍历应跳过这些目录）
+FILLER_DIRS = ("Content", "Binaries/Win64", "Intermediate/Build", "Source/Private", "Resources")
+CATEGORIES = ["Rendering", "Editor", "Gameplay", "Audio", "Animation", "Networking", "Other"]
+AUTHORS = ["Epic Games, Inc.", "Studio A", "Studio B", "Independent"]
+WORDS = ["fast", "editor", "tools", "render", "mesh", "audio", "support", "runtime", "network", "engine"]
+
+
+@dataclass
+class FixtureOptions:
+    """模拟目录的规模和格式参数"""
+    ProjectPlugins: int = 100
+    EnginePlugins: int = 1000
+    MarketplacePlugins: int = 100  # 引擎 Plugins/Marketplace 下的商城插件
+    FanOut: int = 3  # 每个插件最多依赖的插件数
+    Depth: int = 2  # 插件根目录之上的分类目录层数
+    TrailingCommaRatio: float = 0.2  # 带尾随逗号的描述文件比例
+    BomRatio: float = 0.2  # 带 UTF-8 BOM 的描述文件比例
+    FillerFiles: int = 0  # 每个插件每个大体积目录中的填充文件数
+    NestedEvery: int = 0  # 每隔多少个插件带一个嵌套子插件，0 表示不生成
+    ConflictCount: int = 0  # 与引擎插件同名的项目插件数
+    EnabledRatio: float = 0.1  # 在 .uproject 中显式配置的引擎插件比例
+    Seed: int = 0
+
+
+@dataclass
+class Fixture:
+    """生成的模拟目录"""
+    Root: Path
+    ProjectPath: Path
+    EnginePath: Path
+    Names: dict = field(default_factory=dict)  # 来源 -> 插件名列表
+
+
+def MakeDescriptor(Rng: random.Random, Index: int, Dependencies: list[str],
+                   Relaxed: bool, Bom: bool) -> bytes:
+    """生成描述文件内容，Relaxed 时带尾随逗号"""
+    Data = {
+        "FileVersion": 3,
+        "Version": Index,
+        "VersionName": f"1.{Index}",
+        "FriendlyName": f"Plugin {Index}",
+        "Description": " ".join(Rng.choice(WORDS) for _ in range(20)),
+        "Category": Rng.choice(CATEGORIES),
+        "CreatedBy": Rng.choice(AUTHORS),
+        "CreatedByURL": "https://example.com",
+        "DocsURL": f"https://docs.example.com/plugins/{Index}",
+        "EnabledByDefault": Rng.random() < 0.3,
+        "CanContainContent": True,
+        "IsBetaVersion": False,
+        "Installed": False,
+        "Modules": [
+            {"Name": f"Module{Index}_{i}", "Type": "Runtime", "LoadingPhase": "Default",
+             "PlatformAllowList": ["Win64", "Mac", "Linux"]}
+            for i in range(Rng.randint(1, 3))
+        ],
+        "Plugins": [{"Name": Name, "Enabled": True} for Name in Dependencies]
+    }
+    Text = json.dumps(Data, indent="\t")
+    if Relaxed:
+        Text = Text.replace("\n\t}", ",\n\t}").replace("\n\t]", ",\n\t]")
+    return (("\ufeff" if Bom else "") + Text).encode("utf-8")
+
+
+def GetCategoryDir(Rng: random.Random, Depth: int) -> Path:
+    """生成插件根目录之上的分类目录"""
+    if Depth <= 0:
+        return Path()
+    return Path(Rng.choice(CATEGORIES), *(f"Group{Rng.randrange(8)}" for _ in range(Depth - 1)))
+
+
+def WritePlugin(Rng: random.Random, Options: FixtureOptions, PluginsDir: Path,
+                Name: str, Index: int, Dependencies: list[str]):
+    """写入一个插件目录（描述文件、填充文件和可选的嵌套子插件）"""
+    PluginDir = PluginsDir / GetCategoryDir(Rng, Options.Depth) / Name
+    PluginDir.mkdir(parents=True, exist_ok=True)
+    Relaxed = Rng.random() < Options.TrailingCommaRatio
+    Bom = Rng.random() < Options.BomRatio
+    (PluginDir / f"{Name}.uplugin").write_bytes(MakeDescriptor(Rng, Index, Dependencies, Relaxed, Bom))
+
+    if Options.FillerFiles:
+        for FillerDir in FILLER_DIRS:
+            Dir = PluginDir / FillerDir
+            Dir.mkdir(parents=True, exist_ok=True)
+            for i in range(Options.FillerFiles):
+                (Dir / f"File{i}.bin").touch()
+
+    if Options.NestedEvery and Index % Options.NestedEvery == 0:
+        NestedDir = PluginDir / "Plugins" / f"{Name}Nested"
+        NestedDir.mkdir(parents=True)
+        (NestedDir / f"{Name}Nested.uplugin").write_bytes(MakeDescriptor(Rng, Index, [], False, False))
+
+
+def BuildFixture(Root: Path, Options: FixtureOptions) -> Fixture:
+    """在 Root 下生成模拟项目（Project）和引擎（Engine），引擎目录需显式传给加载函数"""
+    Rng = random.Random(Options.Seed)
+    ProjectPath = Root / "Project"
+    EnginePath = Root / "Engine"
+    ProjectPath.mkdir(parents=True, exist_ok=True)
+
+    EngineNames = [f"EnginePlugin{i}" for i in range(Options.EnginePlugins)]
+    FabNames = [f"FabPlugin{i}" for i in range(Options.MarketplacePlugins)]
+    ProjectNames = [f"ProjectPlugin{i}" for i in range(Options.ProjectPlugins - Options.ConflictCount)]
+    ProjectNames += Rng.sample(EngineNames, min(Options.ConflictCount, len(EngineNames)))
+
+    # 引擎插件只依赖引擎插件，商城和项目插件可以依赖引擎插件及同来源插件；
+    # 只依赖候选列表中排在自己之前的插件，保证没有循环依赖
+    EnginePluginsDir = EnginePath / "Engine" / "Plugins"
+    Layout = [
+        (EnginePluginsDir, EngineNames, []),
+        (EnginePluginsDir / "Marketplace", FabNames, EngineNames),
+        (ProjectPath / "Plugins", ProjectNames, EngineNames),
+    ]
+    for PluginsDir, Names, Base in Layout:
+        Candidates = Base + Names
+        for i, Name in enumerate(Names):
+            Limit = len(Base) + i
+            Count = min(Rng.randint(0, Options.FanOut), Limit)
+            Dependencies = [Dep for Dep in Rng.sample(Candidates[:Limit], Count) if Dep != Name]
+            WritePlugin(Rng, Options, PluginsDir, Name, i, Dependencies)
+
+    Configured = Rng.sample(EngineNames, int(len(EngineNames) * Options.EnabledRatio))
+    Project = {
+        "FileVersion": 3,
+        "EngineAssociation": "5.3",
+        "Category": "",
+        "Description": "",
+        "Plugins": [{"Name": Name, "Enabled": Rng.random() < 0.5} for Name in Configured]
+    }
+    (ProjectPath / "Bench.uproject").write_text(json.dumps(Project, indent="\t"), encoding="utf-8")
+
+    return Fixture(Root, ProjectPath, EnginePath, {
+        PluginSource.Project: ProjectNames,
+        PluginSource.Engine: EngineNames,
+        PluginSource.Fab: FabNames
+    })
+
+
+def CreateFixture(Options: FixtureOptions) -> Fixture:
+    """在新的临时目录中生成模拟目录（由调用方删除 Fixture.Root）"""
+    return BuildFixture(Path(tempfile.mkdtemp(prefix="UEPluginBench_")), Options)
@@ -0,0 +1,390 @@
+# UE Plugin Manager 命令行入口（不依赖 PySide6，供构建机和 CI 批量处理项目）
+import sys
+import json
+import argparse
+import unicodedata
+from pathlib import Path
+from typing import Optional
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+
+# 添加项目根目录到 sys.path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from Source.Data.PluginReader import PluginInfo, PluginSource
+from Source.Data.Tracing import TRACER, TRACE_ENV
+from Source.Logic.PluginManager import PluginManager, ProjectChanges
+
+
+# 命令行中的来源名称
+SOURCE_ARGS = {"project": PluginSource.Project, "fab": PluginSource.Fab, "engine": PluginSource.Engine}
+SOURCE_NAMES = {PluginSource.Project: "项目", PluginSource.Engine: "引擎", PluginSource.Fab: "商城"}
+
+# 未指定来源时按名称查找插件的顺序
+LOOKUP_ORDER = (PluginSource.Project, PluginSource.Fab, PluginSource.Engine)
+
+# 搜索字段，与界面的搜索字段下拉框一致
+SEARCH_FIELDS = {"name": 0, "author": 1, "category": 2, "description": 3, "deps": 4, "rdeps": 5}
+
+
+@dataclass
+class CommandResult:
+    """命令执行结果：Data 为 JSON 输出，Lines 为文本输出，Error 非空时表示失败"""
+    Data: object = None
+    Lines: list = field(default_factory=list)
+    Error: str = ""
+
+
+def FindPlugin(Manager: PluginManager, Name: str, Source: Optional[PluginSource]) -> Optional[PluginInfo]:
+    """按名称查找插件，未指定来源时依次查找项目、商城、引擎"""
+    if Source is not None:
+        return Manager.GetPluginByName(Name, Source)
+    for S in LOOKUP_ORDER:
+        Plugin = Manager.GetPluginByName(Name, S)
+        if Plugin:
+            return Plugin
+    return None
+
+
+def FormatNode(Name: str, Source: Optional[PluginSource]) -> dict:
+    """依赖节点的 JSON 表示（Source 为 None 表示插件不存在）"""
+    return {"Name": Name, "Source": Source.value if Source else None}
+
+
+def PluginToDict(Manager: PluginManager, Plugin: PluginInfo, Details: bool = False) -> dict:
+    """插件的 JSON 表示，Details 时包含描述、模块和被依赖"""
+    Data = {
+        "Name": Plugin.Name,
+        "Source": Plugin.Source.value,
+        "Path": str(Plugin.Path),
+        "Version": Plugin.Version,
+        "Category": Plugin.Category,
+        "CreatedBy": Plugin.CreatedBy,
+        "EnabledByDefault": Plugin.EnabledByDefault,
+        "EnabledInProject": Plugin.EnabledInProject,
+        "Enabled": Manager.IsPluginEnabled(Plugin.Name, Plugin.Source),
+        "Conflict": Manager.HasConflict(Plugin.Name),
+        "Dependencies": list(Plugin.Plugins)
+    }
+    if Details:
+        Data["Description"] = Plugin.Description
+        Data["DocsURL"] = Plugin.DocsURL
+        Data["Modules"] = [Module.get("Name", "") for Module in Plugin.Modules if isinstance(Module, dict)]
+        Data["Dependents"] = [FormatNode(Name, S) for Name, S in Manager.GetAllDependents(Plugin.Name)]
+    return Data
+
+
+def GetTextWidth(Text: str) -> int:
+    """文本在终端中的显示宽度（全角字符占两列）"""
+    return sum(2 if unicodedata.east_asian_width(Char) in "WF" else 1 for Char in Text)
+
+
+def FormatTable(Rows: list[list[str]]) -> list[str]:
+    """按列宽对齐的文本表格（首行为表头）"""
+    Widths = [max(GetTextWidth(Row[i]) for Row in Rows) for i in range(len(Rows[0]))]
+    return [
+        "  ".join(Cell + " " * (Width - GetTextWidth(Cell)) for Cell, Width in zip(Row, Widths)).rstrip()
+        for Row in Rows
+    ]
+
+
+def ResolveDependencies(Manager: PluginManager, Plugin: PluginInfo) -> list[tuple[str, Optional[PluginSource]]]:
+    """插件的直接依赖及其所在来源（与界面一致跨来源查找，找不到时来源为 None）"""
+    Found = dict(Manager.GetAllDependencies(Plugin.Name, Plugin.Source))
+    return [(Name, Found.get(Name)) for Name in Plugin.Plugins]
+
+
+def CmdList(Manager: PluginManager, Args) -> CommandResult:
+    """列出插件"""
+    # 状态列需要检查同名冲突（涉及全部来源），一次遍历加载全部来源
+    Manager.EnsureLoaded()
+    if Args.search:
+        Manager.Search(Args.search, SEARCH_FIELDS[Args.field])
+    Sources = [SOURCE_ARGS[Args.source]] if Args.source else list(LOOKUP_ORDER)
+
+    Plugins = []
+    for Source in Sources:
+        for Plugin in sorted(Manager.GetPlugins(Source), key=lambda P: P.Name.lower()):
+            if Args.enabled and not Manager.IsPluginEnabled(Plugin.Name, Source):
+                continue
+            if Args.disabled and Manager.IsPluginEnabled(Plugin.Name, Source):
+                continue
+            Plugins.append(Plugin)
+
+    if Args.json:
+        return CommandResult([PluginToDict(Manager, P) for P in Plugins])
+
+    Rows = [["名称", "来源", "状态", "分类", "作者"]]
+    for Plugin in Plugins:
+        Rows.append([Plugin.Name, SOURCE_NAMES[Plugin.Source], Manager.GetStatusText(Plugin),
+                     Plugin.Category or "-", Plugin.CreatedBy or "-"])
+    return CommandResult(Lines=FormatTable(Rows) + [f"共 {len(Plugins)} 个插件"])
+
+
+def CmdShow(Manager: PluginManager, Args) -> CommandResult:
+    """显示插件详情"""
+    Plugin = FindPlugin(Manager, Args.name, SOURCE_ARGS.get(Args.source))
+    if not Plugin:
+        return CommandResult(Error=f"插件不存在: {Args.name}")
+
+    Data = PluginToDict(Manager, Plugin, Details=True)
+    Dependencies = [Name if S else f"{Name}(缺失)" for Name, S in ResolveDependencies(Manager, Plugin)]
+    Lines = [
+        f"名称: {Plugin.Name}",
+        f"来源: {SOURCE_NAMES[Plugin.Source]}",
+        f"目录: {Plugin.Path}",
+        f"版本: {Plugin.Version or '-'}",
+        f"状态: {Manager.GetStatusText(Plugin)}",
+        f"作者: {Plugin.CreatedBy or '-'}",
+        f"分类: {Plugin.Category or '-'}",
+        f"文档: {Plugin.DocsURL or '-'}",
+        f"模块: {', '.join(Data['Modules']) or '-'}",
+        f"依赖: {', '.join(Dependencies) or '无'}",
+        f"被依赖: {', '.join(Item['Name'] for Item in Data['Dependents']) or '无'}",
+        f"描述: {Plugin.Description or '无描述'}"
+    ]
+    return CommandResult(Data, Lines)
+
+
+def CollectChanges(Manager: PluginManager, Args, Enabled: Optional[bool]) -> tuple[Optional[ProjectChanges], list, str]:
+    """收集启用/禁用/恢复默认的修改（含依赖连锁），返回 (修改, [(插件名, 来源)], 错误信息)"""
+    Changes = ProjectChanges()
+    Targets = []
+    for Name in Args.names:
+        Plugin = FindPlugin(Manager, Name, SOURCE_ARGS.get(Args.source))
+        if not Plugin:
+            return None, [], f"插件不存在: {Name}"
+        Source = Plugin.Source
+
+        Related = []
+        if Enabled is True:
+            # 与界面一致：同名冲突的插件不能启用
+            Conflict = Manager.GetConflictingPlugin(Name, Source)
+            if Conflict:
+                return None, [], (f"插件 {Name} 在 {SOURCE_NAMES[Source]} 和 {SOURCE_NAMES[Conflict[1]]} 中都存在，"
+                                  f"UE 不支持同名插件，请手动删除其中一个后再启用")
+            Related = Manager.GetDisabledDependencies(Name, Source)
+            Message = f"插件 {Name} 依赖以下未启用的插件（含间接依赖）"
+        elif Enabled is False:
+            Related = Manager.GetDisabledDependents(Name, Source)
+            Message = f"以下插件直接或间接依赖 {Name}"
+
+        if Related and not Args.force:
+            if not Args.cascade:
+                Names = "\n".join(f"  - {N}" for N, _ in Related)
+                return None, [], f"{Message}：\n{Names}\n使用 --cascade 一并修改，或 --force 只修改指定插件"
+            Targets.extend(Related)
+        Targets.append((Name, Source))
+
+    # 依赖在前，去除重复
+    Targets = list(dict.fromkeys(Targets))
+    for Name, _ in Targets:
+        if Enabled is None:
+            Changes.Reset(Name)
+        else:
+            Changes.SetEnabled(Name, Enabled)
+    return Changes, Targets, ""
+
+
+def RunChanges(Manager: PluginManager, Args, Enabled: Optional[bool]) -> CommandResult:
+    """修改插件状态并写入项目文件（只写入一次）"""
+    Changes, Targets, Error = CollectChanges(Manager, Args, Enabled)
+    if Changes is None:
+        return CommandResult(Error=Error)
+    if Args.dry_run:
+        Success, Error = True, ""
+    else:
+        Success, Error = Manager.ApplyChanges(Changes)
+    if not Success:
+        return CommandResult(Error=f"修改失败: {Error}")
+
+    Action = {True: "启用", False: "禁用", None: "恢复默认"}[Enabled]
+    Prefix = "将" if Args.dry_run else "已"
+    Data = {"Action": Action, "DryRun": Args.dry_run, "Plugins": [FormatNode(N, S) for N, S in Targets]}
+    Lines = [f"{Prefix}{Action}: {Name} ({SOURCE_NAMES[S]})" for Name, S in Targets]
+    return CommandResult(Data, Lines)
+
+
+def CmdEnable(Manager: PluginManager, Args) -> CommandResult:
+    """启用插件"""
+    return RunChanges(Manager, Args, True)
+
+
+def CmdDisable(Manager: PluginManager, Args) -> CommandResult:
+    """禁用插件"""
+    return RunChanges(Manager, Args, False)
+
+
+def CmdReset(Manager: PluginManager, Args) -> CommandResult:
+    """恢复插件默认状态"""
+    return RunChanges(Manager, Args, None)
+
+
+def CmdDeps(Manager: PluginManager, Args) -> CommandResult:
+    """列出插件依赖，--recursive 时包含间接依赖（依赖在前）"""
+    Plugin = FindPlugin(Manager, Args.name, SOURCE_ARGS.get(Args.source))
+    if not Plugin:
+        return CommandResult(Error=f"插件不存在: {Args.name}")
+
+    if Args.recursive:
+        Nodes = Manager.GetDependencyClosure(Plugin.Name, Plugin.Source)
+    else:
+        Nodes = ResolveDependencies(Manager, Plugin)
+    return FormatNodes(Manager, Nodes, "无依赖")
+
+
+def CmdRDeps(Manager: PluginManager, Args) -> CommandResult:
+    """列出依赖此插件的插件，--recursive 时包含间接依赖者（依赖者在前）"""
+    Plugin = FindPlugin(Manager, Args.name, SOURCE_ARGS.get(Args.source))
+    if Args.recursive:
+        Nodes = Manager.GetDependentClosure(Args.name, Plugin.Source if Plugin else None)
+    else:
+        Nodes = Manager.GetAllDependents(Args.name)
+    return FormatNodes(Manager, Nodes, "无被依赖")
+
+
+def FormatNodes(Manager: PluginManager, Nodes: list, Empty: str) -> CommandResult:
+    """依赖列表的输出，附带启用状态"""
+    Data = []
+    Lines = []
+    for Name, Source in Nodes:
+        Node = FormatNode(Name, Source)
+        if Source is None or not Manager.GetPluginByName(Name, Source):
+            Node["Source"] = None
+            Node["Enabled"] = None
+            Lines.append(f"{Name}  (缺失)")
+        else:
+            Node["Enabled"] = Manager.IsPluginEnabled(Name, Source)
+            Lines.append(f"{Name}  ({SOURCE_NAMES[Source]}, {'启用' if Node['Enabled'] else '未启用'})")
+        Data.append(Node)
+    return CommandResult(Data, Lines or [Empty])
+
+
+def CmdConflicts(Manager: PluginManager, Args) -> CommandResult:
+    """列出同名冲突插件"""
+    Manager.EnsureLoaded()
+    Data = []
+    Lines = []
+    for Name in sorted(Manager.NameIndex, key=str.lower):
+        if not Manager.HasConflict(Name):
+            continue
+        Entry = Manager.NameIndex[Name]
+        Data.append({"Name": Name, "Plugins": [
+            {"Source": S.value, "Path": str(Entry[S].Path)} for S in LOOKUP_ORDER if S in Entry
+        ]})
+        Lines.append(Name)
+        Lines.extend(f"  {SOURCE_NAMES[S]}: {Entry[S].Path}" for S in LOOKUP_ORDER if S in Entry)
+    return CommandResult(Data, Lines or ["没有同名冲突的插件"])
+
+
+def AddNamesArgs(Parser: argparse.ArgumentParser, Cascade: bool):
+    """启用/禁用/恢复默认命令的公共参数"""
+    Parser.add_argument("names", nargs="+", metavar="NAME", help="插件名")
+    Parser.add_argument("--source", choices=SOURCE_ARGS, help="插件来源（默认依次查找项目、商城、引擎）")
+    Parser.add_argument("--dry-run", action="store_true", help="只显示将要修改的插件，不写入项目文件")
+    if Cascade:
+        Group = Parser.add_mutually_exclusive_group()
+        Group.add_argument("--cascade", action="store_true", help="连带修改依赖（启用）或依赖者（禁用）")
+        Group.add_argument("--force", action="store_true", help="只修改指定插件，忽略依赖连锁")
+    else:
+        Parser.set_defaults(cascade=False, force=True)
+
+
+def AddCommonArgs(Parser: argparse.ArgumentParser, Defaults: bool):
+    """公共参数，可写在子命令之前或之后（子命令中不设默认值，避免覆盖写在前面的参数）"""
+    def Default(Value):
+        return Value if Defaults else argparse.SUPPRESS
+
+    Parser.add_argument("--project", type=Path, default=Default(Path.cwd()),
+                        help="UE 项目目录或 .uproject 文件（默认当前目录）")
+    Parser.add_argument("--engine", type=Path, default=Default(None),
+                        help="引擎根目录（包含 Engine/Plugins），指定时不按引擎关联查找注册表")
+    Parser.add_argument("--json", action="store_true", default=Default(False), help="以 JSON 输出")
+    Parser.add_argument("--workers", type=int, default=Default(None), help="解析线程数（1 为单线程）")
+    Parser.add_argument("--trace", type=Path, metavar="PATH", default=Default(None),
+                        help=f"记录性能追踪，退出时写入 Chrome 追踪格式 JSON（也可设置环境变量 {TRACE_ENV}）")
+
+
+def BuildParser() -> argparse.ArgumentParser:
+    """命令行参数"""
+    Parser = argparse.ArgumentParser(description="UE 插件管理工具（命令行）")
+    AddCommonArgs(Parser, True)
+    Common = argparse.ArgumentParser(add_help=False)
+    AddCommonArgs(Common, False)
+    Commands = Parser.add_subparsers(dest="command", required=True)
+
+    Sub = Commands.add_parser("list", help="列出插件", parents=[Common])
+    Sub.add_argument("--source", choices=SOURCE_ARGS, help="只列出指定来源")
+    State = Sub.add_mutually_exclusive_group()
+    State.add_argument("--enabled", action="store_true", help="只列出启用的插件")
+    State.add_argument("--disabled", action="store_true", help="只列出未启用的插件")
+    Sub.add_argument("--search", help="搜索关键词（空格分隔多关键词）")
+    Sub.add_argument("--field", choices=SEARCH_FIELDS, default="name", help="搜索字段")
+    Sub.set_defaults(Func=CmdList)
+
+    Sub = Commands.add_parser("show", help="显示插件详情", parents=[Common])
+    Sub.add_argument("name", help="插件名")
+    Sub.add_argument("--source", choices=SOURCE_ARGS, help="插件来源")
+    Sub.set_defaults(Func=CmdShow)
+
+    Sub = Commands.add_parser("enable", help="启用插件", parents=[Common])
+    AddNamesArgs(Sub, True)
+    Sub.set_defaults(Func=CmdEnable)
+
+    Sub = Commands.add_parser("disable", help="禁用插件", parents=[Common])
+    AddNamesArgs(Sub, True)
+    Sub.set_defaults(Func=CmdDisable)
+
+    Sub = Commands.add_parser("reset", help="恢复插件默认状态（从项目文件移除配置）", parents=[Common])
+    AddNamesArgs(Sub, False)
+    Sub.set_defaults(Func=CmdReset)
+
+    for Name, Func, Help in (("deps", CmdDeps, "列出插件依赖"), ("rdeps", CmdRDeps, "列出依赖此插件的插件")):
+        Sub = Commands.add_parser(Name, help=Help, parents=[Common])
+        Sub.add_argument("name", help="插件名")
+        Sub.add_argument("--source", choices=SOURCE_ARGS, help="插件来源")
+        Sub.add_argument("--recursive", "-r", action="store_true", help="包含间接关系")
+        Sub.set_defaults(Func=Func)
+
+    Sub = Commands.add_parser("conflicts", help="列出同名冲突插件", parents=[Common])
+    Sub.set_defaults(Func=CmdConflicts)
+    return Parser
+
+
+def Run(Args) -> CommandResult:
+    """加载项目并执行命令（插件按来源在命令首次查询到时加载，如恢复默认项目插件时不扫描引擎目录）"""
+    ProjectPath = Args.project.parent if Args.project.suffix == ".uproject" else Args.project
+    Manager = PluginManager(Workers=Args.workers)
+    if not Manager.LoadProject(ProjectPath, Args.engine, Sources=()):
+        return CommandResult(Error=f"未找到 .uproject 文件或项目文件无效: {ProjectPath}")
+    if Args.engine is None and not Manager.ProjectInfo.EnginePath:
+        print(f"未找到引擎路径（{Manager.ProjectInfo.EngineVersion}），只加载项目插件，可使用 --engine 指定")
+    return Args.Func(Manager, Args)
+
+
+def Main() -> int:
+    Args = BuildParser().parse_args()
+    if Args.trace:
+        TRACER.Enable(Args.trace)
+
+    # 加载和修改过程中的提示输出到标准错误，标准输出只包含命令结果
+    Output = sys.stdout
+    with redirect_stdout(sys.stderr):
+        Result = Run(Args)
+
+    if Result.Error:
+        if Args.json:
+            Output.write(json.dumps({"Error": Result.Error}, ensure_ascii=False, indent=2) + "\n")
+        print(f"错误: {Result.Error}", file=sys.stderr)
+        return 1
+
+    if Args.json:
+        # 一次序列化后写入，逐块写入大列表时较慢
+        Output.write(json.dumps(Result.Data, ensure_ascii=False, indent=2) + "\n")
+    else:
+        Output.write("\n".join(Result.Lines) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
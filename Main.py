@@ -1,13 +1,17 @@
 # UE Plugin Manager 启动文件
+import time
+
+# 启动计时起点（启动耗时报告的各阶段相对此时间）
+START_NS = time.perf_counter_ns()
+
 import sys
+import argparse
 from pathlib import Path
 
 # 添加项目根目录到 sys.path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtGui import QFont
-from Source.UI.MainWindow import MainWindow
+from Source.Data.Tracing import TRACER, TRACE_ENV, STARTUP
 
 
 def CheckProject() -> bool:
@@ -17,18 +21,51 @@ def CheckProject() -> bool:
     return len(UProjectFiles) > 0
 
 
+def ParseArgs() -> argparse.Namespace:
+    """解析命令行参数（未识别的参数交给 Qt）"""
+    Parser = argparse.ArgumentParser(description="UE 插件管理工具")
+    Parser.add_argument("--trace", type=Path, metavar="PATH",
+                        help=f"记录性能追踪，退出时写入 Chrome 追踪格式 JSON（也可设置环境变量 {TRACE_ENV}）")
+    Parser.add_argument("--startup-report", type=Path, nargs="?", const=Path("-"), metavar="PATH",
+                        help="首次加载完成后输出各启动阶段的耗时（不指定路径时输出到标准输出）")
+    Args, _ = Parser.parse_known_args()
+    return Args
+
+
 def Main():
+    STARTUP.Begin(START_NS)
+    Args = ParseArgs()
+    if Args.trace:
+        TRACER.Enable(Args.trace)
+    if Args.startup_report:
+        STARTUP.Enable(None if str(Args.startup_report) == "-" else Args.startup_report)
+
+    # 错误提示框只需要 QtWidgets，主窗口模块在确认项目有效后再导入
+    from PySide6.QtWidgets import QApplication, QMessageBox
+    from PySide6.QtGui import QFont
+    STARTUP.Mark("导入 Qt")
+
     App = QApplication(sys.argv)
     App.setFont(QFont("Microsoft YaHei", 9))
+    STARTUP.Mark("创建 QApplication")
 
     if not CheckProject():
         QMessageBox.critical(None, "错误", "当前目录未找到 .uproject 文件\n请在 UE 项目根目录下运行本程序")
         sys.exit(1)
 
+    from Source.UI.MainWindow import MainWindow
+    STARTUP.Mark("导入主窗口")
+
+    # 窗口显示并绘制后才开始加载项目（见 MainWindow.StartLoading）
     Window = MainWindow()
+    STARTUP.Mark("创建主窗口")
     Window.show()
     sys.exit(App.exec())
 
 
 if __name__ == "__main__":
+    # 打包后使用进程池解析时需要（multiprocessing 导入较慢，只在打包后导入）
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+        multiprocessing.freeze_support()
     Main()
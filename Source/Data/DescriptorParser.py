@@ -0,0 +1,198 @@
+# UE 描述文件（.uplugin）解析
+import codecs
+import json
+import re
+from json.decoder import scanstring
+from typing import Iterable, Optional, Union
+
+from Source.Data.ProjectFile import UTF8_BOM
+
+# 可选的快速 JSON 后端，未安装时使用标准库
+try:
+    import orjson as FastJson
+except ImportError:
+    FastJson = None
+
+
+WHITESPACE_RE = re.compile(r"[ \t\r\n]*")
+NUMBER_RE = re.compile(r"-?(?:0|[1-9]\d*)(\.\d+)?([eE][-+]?\d+)?")
+STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+# 跳过值时一次越过与括号、字符串和注释无关的字符
+SKIP_RE = re.compile(r'[^"{}\[\]/]*')
+LITERALS = (("true", True), ("false", False), ("null", None))
+
+
+def LoadDescriptor(Content: Union[bytes, str], Keys: Optional[Iterable[str]] = None) -> dict:
+    """解析描述文件内容：先按标准 JSON 解析（有快速后端时使用快速后端），失败时（尾随逗号、注释）
+    使用 DescriptorParser 一遍解析。Keys 为需要的顶层字段，仅宽松解析时用于跳过其余字段"""
+    Loads = FastJson.loads if FastJson else json.loads
+    if isinstance(Content, bytes):
+        Content = Content.removeprefix(codecs.BOM_UTF8)
+        if not FastJson:
+            Content = Content.decode("utf-8")
+    else:
+        Content = Content.removeprefix(UTF8_BOM)
+
+    try:
+        Data = Loads(Content)
+    except ValueError:
+        if isinstance(Content, bytes):
+            Content = Content.decode("utf-8")
+        Data = DescriptorParser(Content).Parse(set(Keys) if Keys is not None else None)
+
+    if not isinstance(Data, dict):
+        raise ValueError("描述文件根节点不是对象")
+    return Data
+
+
+class DescriptorParser:
+    """UE 宽松 JSON 解析器：一遍解析，允许尾随逗号和注释
+
+    只需要部分顶层字段时，其余字段只做括号匹配跳过，不构建对象。
+    """
+
+    def __init__(self, Text: str, AllowComments: bool = True):
+        self.Text = Text.removeprefix(UTF8_BOM)
+        self.Pos = 0
+        self.AllowComments = AllowComments
+
+    def Parse(self, Keys: Optional[set] = None):
+        """解析全部文本，Keys 不为 None 时顶层对象只保留这些字段"""
+        self.SkipSpace()
+        if Keys is not None and self.Peek() == "{":
+            Value = self.ParseObject(Keys)
+        else:
+            Value = self.ParseValue()
+        self.SkipSpace()
+        if self.Pos != len(self.Text):
+            self.Fail("多余的内容")
+        return Value
+
+    def Fail(self, Message: str):
+        """抛出带行列号的解析错误"""
+        raise json.JSONDecodeError(Message, self.Text, self.Pos)
+
+    def Peek(self) -> str:
+        """当前字符，到达末尾时为空字符串"""
+        return self.Text[self.Pos:self.Pos + 1]
+
+    def SkipSpace(self):
+        """跳过空白和注释"""
+        Text = self.Text
+        while True:
+            self.Pos = WHITESPACE_RE.match(Text, self.Pos).end()
+            if not self.AllowComments or Text[self.Pos:self.Pos + 1] != "/":
+                return
+            Next = Text[self.Pos + 1:self.Pos + 2]
+            if Next == "/":
+                End = Text.find("\n", self.Pos)
+                self.Pos = len(Text) if End < 0 else End + 1
+            elif Next == "*":
+                End = Text.find("*/", self.Pos + 2)
+                if End < 0:
+                    self.Fail("注释没有结束")
+                self.Pos = End + 2
+            else:
+                return
+
+    def ParseValue(self):
+        """解析一个值"""
+        Char = self.Peek()
+        if Char == "{":
+            return self.ParseObject()
+        if Char == "[":
+            return self.ParseArray()
+        if Char == '"':
+            return self.ParseString()
+        for Literal, Value in LITERALS:
+            if self.Text.startswith(Literal, self.Pos):
+                self.Pos += len(Literal)
+                return Value
+
+        Match = NUMBER_RE.match(self.Text, self.Pos)
+        if not Match or not Match.group():
+            self.Fail("无法识别的值")
+        self.Pos = Match.end()
+        if Match.group(1) or Match.group(2):
+            return float(Match.group())
+        return int(Match.group())
+
+    def ParseString(self) -> str:
+        """解析字符串（使用标准库的 C 实现处理转义）"""
+        Value, self.Pos = scanstring(self.Text, self.Pos + 1)
+        return Value
+
+    def ParseObject(self, Keys: Optional[set] = None) -> dict:
+        """解析对象，允许尾随逗号"""
+        Result = {}
+        self.Pos += 1
+        self.SkipSpace()
+        while self.Peek() != "}":
+            if self.Peek() != '"':
+                self.Fail("应为字段名或 }")
+            Key = self.ParseString()
+            self.SkipSpace()
+            if self.Peek() != ":":
+                self.Fail("应为冒号")
+            self.Pos += 1
+            self.SkipSpace()
+            if Keys is None or Key in Keys:
+                Result[Key] = self.ParseValue()
+            else:
+                self.SkipValue()
+            self.SkipSpace()
+            if self.Peek() == ",":
+                self.Pos += 1
+                self.SkipSpace()
+            elif self.Peek() != "}":
+                self.Fail("应为逗号或 }")
+        self.Pos += 1
+        return Result
+
+    def ParseArray(self) -> list:
+        """解析数组，允许尾随逗号"""
+        Result = []
+        self.Pos += 1
+        self.SkipSpace()
+        while self.Peek() != "]":
+            if not self.Peek():
+                self.Fail("应为值或 ]")
+            Result.append(self.ParseValue())
+            self.SkipSpace()
+            if self.Peek() == ",":
+                self.Pos += 1
+                self.SkipSpace()
+            elif self.Peek() != "]":
+                self.Fail("应为逗号或 ]")
+        self.Pos += 1
+        return Result
+
+    def SkipValue(self):
+        """跳过一个值，对象和数组只做括号匹配（不检查内部语法）"""
+        Char = self.Peek()
+        if not Char or Char not in "{[":
+            self.ParseValue()
+            return
+
+        Text = self.Text
+        Depth = 0
+        while True:
+            self.Pos = SKIP_RE.match(Text, self.Pos).end()
+            Char = self.Peek()
+            if not Char:
+                self.Fail("括号没有闭合")
+            if Char == '"':
+                Match = STRING_RE.match(Text, self.Pos)
+                if not Match:
+                    self.Fail("字符串没有结束")
+                self.Pos = Match.end()
+            elif Char == "/":
+                Start = self.Pos
+                self.SkipSpace()
+                if self.Pos == Start:
+                    self.Pos += 1
+            else:
+                Depth += 1 if Char in "{[" else -1
+                self.Pos += 1
+                if Depth == 0:
+                    return
@@ -0,0 +1,139 @@
+# 插件描述文件解析缓存
+import os
+import json
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+# 缓存结构版本，字段或解析方式变化时递增，旧版本缓存整体作废
+CACHE_VERSION = 3
+
+# 默认最大缓存条目数
+DEFAULT_MAX_ENTRIES = 20000
+
+
+def GetDefaultCachePath() -> Path:
+    """获取默认缓存文件路径"""
+    BaseDir = os.environ.get("LOCALAPPDATA")
+    if BaseDir:
+        return Path(BaseDir) / "UEPluginManager" / "PluginCache.json"
+    return Path.home() / ".cache" / "UEPluginManager" / "PluginCache.json"
+
+
+class PluginCache:
+    """插件解析缓存，以 (路径, 大小, 修改时间) 为键保存已解析的插件字段"""
+
+    def __init__(self, CachePath: Optional[Path] = None, MaxEntries: int = DEFAULT_MAX_ENTRIES):
+        self.CachePath = CachePath or GetDefaultCachePath()
+        self.MaxEntries = MaxEntries
+        self.Entries: dict[str, dict] = {}
+        self.Touched: set[str] = set()  # 本次会话命中或写入的条目
+        self.Loaded = False
+        self.Dirty = False
+
+    def Load(self):
+        """从磁盘加载缓存（版本不符时丢弃）"""
+        self.Entries = {}
+        self.Touched.clear()
+        self.Loaded = True
+        self.Dirty = False
+        if not self.CachePath.exists():
+            return
+
+        try:
+            with open(self.CachePath, "r", encoding="utf-8") as F:
+                Data = json.load(F)
+        except (json.JSONDecodeError, IOError) as E:
+            print(f"加载插件缓存失败: {self.CachePath} - {E}")
+            self.Dirty = True
+            return
+
+        if not isinstance(Data, dict) or Data.get("Version") != CACHE_VERSION:
+            self.Dirty = True
+            return
+        self.Entries = Data.get("Entries", {})
+
+    def Get(self, UPluginFile: Path, St: os.stat_result) -> Optional[dict]:
+        """获取缓存的插件字段，文件大小或修改时间不一致时返回 None"""
+        if not self.Loaded:
+            self.Load()
+
+        Key = str(UPluginFile)
+        Entry = self.Entries.get(Key)
+        if not Entry:
+            return None
+        if Entry.get("Size") != St.st_size or Entry.get("MTime") != St.st_mtime_ns:
+            return None
+
+        # 使用时间按天刷新，避免每次热启动都重写缓存文件
+        Now = int(time.time())
+        if Now - Entry.get("LastUsed", 0) > 86400:
+            Entry["LastUsed"] = Now
+            self.Dirty = True
+        self.Touched.add(Key)
+        return Entry.get("Fields")
+
+    def Put(self, UPluginFile: Path, St: os.stat_result, Fields: dict):
+        """写入插件字段"""
+        if not self.Loaded:
+            self.Load()
+
+        Key = str(UPluginFile)
+        self.Entries[Key] = {
+            "Size": St.st_size,
+            "MTime": St.st_mtime_ns,
+            "LastUsed": int(time.time()),
+            "Fields": Fields
+        }
+        self.Touched.add(Key)
+        self.Dirty = True
+
+    def Prune(self, Roots: Iterable[Path] = ()):
+        """淘汰本次扫描的根目录下已不存在的路径（缓存为所有项目和引擎共用，其他目录的条目不检查），
+        超出上限时按最近使用时间淘汰"""
+        Prefixes = tuple(os.path.join(str(Root), "") for Root in Roots)
+        if Prefixes:
+            for Key in list(self.Entries.keys()):
+                if Key not in self.Touched and Key.startswith(Prefixes) and not os.path.exists(Key):
+                    del self.Entries[Key]
+                    self.Dirty = True
+
+        if len(self.Entries) > self.MaxEntries:
+            Keys = sorted(self.Entries.keys(), key=lambda K: self.Entries[K].get("LastUsed", 0))
+            for Key in Keys[:len(self.Entries) - self.MaxEntries]:
+                del self.Entries[Key]
+            self.Dirty = True
+
+    def Save(self, Roots: Iterable[Path] = ()):
+        """保存缓存到磁盘（先写临时文件再替换），Roots 为本次扫描过的插件根目录"""
+        if not self.Loaded:
+            return
+        self.Prune(Roots)
+        if not self.Dirty:
+            return
+
+        try:
+            self.CachePath.parent.mkdir(parents=True, exist_ok=True)
+            TempPath = self.CachePath.with_name(self.CachePath.name + ".tmp")
+            with open(TempPath, "w", encoding="utf-8") as F:
+                json.dump({"Version": CACHE_VERSION, "Entries": self.Entries}, F, ensure_ascii=False)
+            os.replace(TempPath, self.CachePath)
+            self.Dirty = False
+        except OSError as E:
+            print(f"保存插件缓存失败: {self.CachePath} - {E}")
+
+    def Unload(self):
+        """释放内存中的条目（有未保存的修改时保留），下次使用时重新从磁盘加载"""
+        if self.Dirty:
+            return
+        self.Entries = {}
+        self.Touched.clear()
+        self.Loaded = False
+
+    def Clear(self):
+        """清空缓存"""
+        self.Entries = {}
+        self.Touched.clear()
+        self.Loaded = True
+        self.Dirty = True
@@ -1,10 +1,18 @@
 # 插件数据读取模块
-import re
+import os
+import sys
 import json
+import time
+import threading
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
+from itertools import islice
 from enum import Enum
+from Source.Data.PluginCache import PluginCache
+from Source.Data.PluginScanner import IterPluginFiles, DEFAULT_EXCLUDE_DIRS
+from Source.Data.DescriptorParser import LoadDescriptor
+from Source.Data.Tracing import TRACER, PARSE_CATEGORY, TraceSpan, Traced
 
 
 class PluginSource(Enum):
@@ -14,25 +22,98 @@ class PluginSource(Enum):
     Fab = "Fab"          # Fab 商城插件
 
 
-@dataclass
+# 按需读取的详情字段及默认值（列表只用到名称、作者、分类和状态）
+DETAIL_FIELDS = (("Description", str), ("DocsURL", str), ("Modules", list))
+
+
 class PluginInfo:
-    """插件信息"""
-    Name: str
-    Path: Path
-    Source: PluginSource
-    Version: str = ""
-    Description: str = ""
-    Category: str = ""
-    CreatedBy: str = ""
-    DocsURL: str = ""
-    EnabledByDefault: bool = False
-    CanContainContent: bool = False
-    IsBetaVersion: bool = False
-    Modules: list = field(default_factory=list)
-    Plugins: list = field(default_factory=list)  # 依赖的插件
-
-    # 项目中的启用状态（仅对引擎插件有效）
-    EnabledInProject: Optional[bool] = None
+    """插件信息（紧凑记录：重复出现的字符串驻留共享，详情字段可释放并按需从描述文件读取）"""
+    __slots__ = (
+        "Name", "Path", "Source", "Version", "Category", "CreatedBy",
+        "EnabledByDefault", "CanContainContent", "IsBetaVersion", "Plugins",
+        "EnabledInProject", "Details"
+    )
+
+    def __init__(self, Name: str, Path: Path, Source: "PluginSource", Version: str = "",
+                 Description: str = "", Category: str = "", CreatedBy: str = "", DocsURL: str = "",
+                 EnabledByDefault: bool = False, CanContainContent: bool = False, IsBetaVersion: bool = False,
+                 Modules: Optional[list] = None, Plugins: Optional[list] = None,
+                 EnabledInProject: Optional[bool] = None):
+        self.Name = sys.intern(Name)
+        self.Path = Path
+        self.Source = Source
+        self.Version = Version
+        self.Category = sys.intern(Category)
+        self.CreatedBy = sys.intern(CreatedBy)
+        self.EnabledByDefault = EnabledByDefault
+        self.CanContainContent = CanContainContent
+        self.IsBetaVersion = IsBetaVersion
+        self.Plugins = [sys.intern(DepName) for DepName in Plugins] if Plugins else []  # 依赖的插件
+        # 项目中的启用状态（仅对引擎插件有效）
+        self.EnabledInProject = EnabledInProject
+        # 详情字段：Description / DocsURL / Modules，None 表示已释放，访问时重新读取
+        self.Details: Optional[dict] = {
+            "Description": Description,
+            "DocsURL": DocsURL,
+            "Modules": Modules if Modules is not None else []
+        }
+
+    def __repr__(self) -> str:
+        return f"PluginInfo(Name={self.Name!r}, Source={self.Source}, Path={str(self.Path)!r})"
+
+    @property
+    def Description(self) -> str:
+        """描述（按需读取）"""
+        return self.GetDetails()["Description"]
+
+    @Description.setter
+    def Description(self, Value: str):
+        self.GetDetails()["Description"] = Value
+
+    @property
+    def DocsURL(self) -> str:
+        """文档链接（按需读取）"""
+        return self.GetDetails()["DocsURL"]
+
+    @DocsURL.setter
+    def DocsURL(self, Value: str):
+        self.GetDetails()["DocsURL"] = Value
+
+    @property
+    def Modules(self) -> list:
+        """模块列表（按需读取）"""
+        return self.GetDetails()["Modules"]
+
+    @Modules.setter
+    def Modules(self, Value: list):
+        self.GetDetails()["Modules"] = Value
+
+    def IsEnabled(self) -> bool:
+        """实际启用状态：项目中显式配置优先，否则为默认状态"""
+        if self.EnabledInProject is None:
+            return self.EnabledByDefault
+        return self.EnabledInProject
+
+    def GetDetails(self) -> dict:
+        """获取详情字段，已释放时从描述文件重新读取（读取失败时为默认值）"""
+        if self.Details is None:
+            UPluginFile = self.Path / f"{self.Name}.uplugin"
+            try:
+                Fields = ReadPluginFields(UPluginFile)
+            except Exception as E:
+                print(f"读取插件详情失败: {UPluginFile} - {E}")
+                Fields = {}
+            self.Details = {Name: Fields.get(Name, Default()) for Name, Default in DETAIL_FIELDS}
+        return self.Details
+
+    def ReleaseDetails(self):
+        """释放详情字段，之后访问时按需重新读取"""
+        self.Details = None
+
+    def CopyFrom(self, Other: "PluginInfo"):
+        """原地复制另一条记录的全部字段（保持对象不变）"""
+        for Name in self.__slots__:
+            setattr(self, Name, getattr(Other, Name))
 
 
 @dataclass
@@ -42,15 +123,104 @@ class ProjectInfo:
     Path: Path
     EngineVersion: str
     EnginePath: Optional[Path] = None
-    EnabledPlugins: list = field(default_factory=list)
-    DisabledPlugins: list = field(default_factory=list)
+    PluginStates: dict = field(default_factory=dict)  # 项目中显式配置的插件：插件名 -> 是否启用
+
+
+# PluginInfo 用到的描述文件顶层字段，宽松解析时其余字段直接跳过
+DESCRIPTOR_KEYS = frozenset({
+    "Version", "VersionName", "Description", "Category", "CreatedBy", "DocsURL",
+    "EnabledByDefault", "CanContainContent", "IsBetaVersion", "Modules", "Plugins"
+})
+
+
+def ReadPluginFields(UPluginFile: Path) -> dict:
+    """读取插件文件，返回 PluginInfo 所需字段"""
+    with open(UPluginFile, "rb") as F:
+        Content = F.read()
+    # UE 的 JSON 允许尾随逗号，由描述文件解析器处理
+    Data = LoadDescriptor(Content, DESCRIPTOR_KEYS)
+
+    # 解析依赖插件（跳过格式不正确的条目）
+    Dependencies = []
+    Plugins = Data.get("Plugins")
+    for Plugin in Plugins if isinstance(Plugins, list) else ():
+        if isinstance(Plugin, dict) and isinstance(Plugin.get("Name"), str) and Plugin.get("Enabled", True):
+            Dependencies.append(Plugin["Name"])
+
+    # 字段为 null 或类型不对时按缺省处理，避免一个插件中断整批解析
+    Version = Data.get("Version", Data.get("VersionName"))
+    Modules = Data.get("Modules")
+    return {
+        "Version": str(Version) if Version is not None else "",
+        "Description": GetStringField(Data, "Description"),
+        "Category": GetStringField(Data, "Category"),
+        "CreatedBy": GetStringField(Data, "CreatedBy"),
+        "DocsURL": GetStringField(Data, "DocsURL"),
+        "EnabledByDefault": bool(Data.get("EnabledByDefault")),
+        "CanContainContent": bool(Data.get("CanContainContent")),
+        "IsBetaVersion": bool(Data.get("IsBetaVersion")),
+        "Modules": Modules if isinstance(Modules, list) else [],
+        "Plugins": Dependencies
+    }
+
+
+def GetStringField(Data: dict, Key: str) -> str:
+    """获取字符串字段，缺失、为 null 或不是字符串时返回空字符串"""
+    Value = Data.get(Key)
+    return Value if isinstance(Value, str) else ""
+
+
+def TryReadPluginFields(UPluginFile: Path) -> tuple[Optional[dict], str]:
+    """读取插件文件，返回 (字段, 错误信息)，供工作池调用"""
+    try:
+        return ReadPluginFields(UPluginFile), ""
+    except Exception as E:
+        return None, str(E)
+
+
+def TimedReadPluginFields(UPluginFile: Path) -> tuple[Optional[dict], str, int, int, int, int]:
+    """读取插件文件并计时，返回 (字段, 错误信息, 开始, 结束, 进程号, 线程号)，开启追踪时供工作池调用"""
+    StartNs = time.perf_counter_ns()
+    Fields, Error = TryReadPluginFields(UPluginFile)
+    return Fields, Error, StartNs, time.perf_counter_ns(), os.getpid(), threading.get_ident()
+
+
+# 渐进加载时每批解析的文件数
+BATCH_SIZE = 200
+
+
+def GetPluginSource(UPluginFile: Path, RootSource: PluginSource) -> PluginSource:
+    """根据插件路径确定来源（Marketplace 目录下为 Fab 商城插件）"""
+    if "Marketplace" in UPluginFile.parts:
+        return PluginSource.Fab
+    return RootSource
+
+
+def GetDefaultWorkers() -> int:
+    """默认解析线程数"""
+    return min(8, os.cpu_count() or 1)
 
 
 class PluginReader:
     """插件读取器"""
 
-    def __init__(self, ProjectPath: Path):
+    def __init__(self, ProjectPath: Path, Cache: Optional[PluginCache] = None,
+                 ExcludeDirs: Optional[frozenset] = None,
+                 Workers: Optional[int] = None, UseProcesses: bool = False,
+                 EnginePath: Optional[Path] = None):
         self.ProjectPath = ProjectPath
+        self.EnginePath = EnginePath  # 显式指定的引擎目录，指定时不再按引擎关联查找（不访问注册表）
+        self.Cache = Cache
+        self.ExcludeDirs = ExcludeDirs  # 插件内扫描时跳过的目录名，None 使用默认列表
+        self.Workers = Workers if Workers is not None else GetDefaultWorkers()  # 1 为单线程
+        self.UseProcesses = UseProcesses  # 使用进程池代替线程池
+        self.Pool = None  # 一次扫描内各批共用的解析工作池，扫描结束时关闭
+        self.ScannedRoots: list[Path] = []  # 本次扫描已遍历的根目录，结束时只淘汰其下的缓存条目
+        self.Errors: list[tuple[Path, str]] = []  # 解析失败的文件及原因
+        self.ScannedCount = 0  # 已处理的插件文件数
+        self.CancelRequested = False
+        self.FileStats: dict[Path, tuple[int, int]] = {}  # 已解析插件文件的 (大小, 修改时间)
+        self.UProjectFile: Optional[Path] = None
         self.ProjectInfo: Optional[ProjectInfo] = None
         self.Plugins: dict[PluginSource, list[PluginInfo]] = {
             PluginSource.Project: [],
@@ -58,6 +228,7 @@ class PluginReader:
             PluginSource.Fab: []
         }
 
+    @Traced("Reader")
     def LoadProject(self) -> Optional[ProjectInfo]:
         """加载项目信息"""
         UProjectFiles = list(self.ProjectPath.glob("*.uproject"))
@@ -65,6 +236,23 @@ class PluginReader:
             return None
 
         UProjectFile = UProjectFiles[0]
+        Data = self.ReadProjectFile(UProjectFile)
+        if Data is None:
+            return None
+
+        self.UProjectFile = UProjectFile
+        EngineAssociation = Data["EngineAssociation"]
+        self.ProjectInfo = ProjectInfo(
+            Name=UProjectFile.stem,
+            Path=self.ProjectPath,
+            EngineVersion=EngineAssociation,
+            EnginePath=self.EnginePath or self.FindEnginePath(EngineAssociation),
+            PluginStates=Data["PluginStates"]
+        )
+        return self.ProjectInfo
+
+    def ReadProjectFile(self, UProjectFile: Path) -> Optional[dict]:
+        """读取项目文件中的引擎版本和插件启用状态"""
         try:
             with open(UProjectFile, "r", encoding="utf-8-sig") as F:
                 Data = json.load(F)
@@ -72,28 +260,16 @@ class PluginReader:
             print(f"加载项目文件失败: {UProjectFile} - {E}")
             return None
 
-        # 解析引擎版本
-        EngineAssociation = Data.get("EngineAssociation", "")
-
-        # 解析插件启用状态
-        EnabledPlugins = []
-        DisabledPlugins = []
+        # 解析插件启用状态（未写 Enabled 视为启用，重复配置时启用优先）
+        PluginStates = {}
         for Plugin in Data.get("Plugins", []):
             PluginName = Plugin.get("Name", "")
-            if Plugin.get("Enabled", True):
-                EnabledPlugins.append(PluginName)
-            else:
-                DisabledPlugins.append(PluginName)
+            PluginStates[PluginName] = PluginStates.get(PluginName, False) or bool(Plugin.get("Enabled", True))
 
-        self.ProjectInfo = ProjectInfo(
-            Name=UProjectFile.stem,
-            Path=self.ProjectPath,
-            EngineVersion=EngineAssociation,
-            EnginePath=self.FindEnginePath(EngineAssociation),
-            EnabledPlugins=EnabledPlugins,
-            DisabledPlugins=DisabledPlugins
-        )
-        return self.ProjectInfo
+        return {
+            "EngineAssociation": Data.get("EngineAssociation", ""),
+            "PluginStates": PluginStates
+        }
 
     def FindEnginePath(self, EngineVersion: str) -> Optional[Path]:
         """查找引擎路径"""
@@ -109,9 +285,9 @@ class PluginReader:
 
     def FindEngineByGUID(self, GUID: str) -> Optional[Path]:
         """通过 GUID 查找源码版引擎"""
-        # Windows 注册表路径
-        import winreg
+        # Windows 注册表路径（非 Windows 平台没有 winreg，视为未找到）
         try:
+            import winreg
             Key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
                 r"Software\Epic Games\Unreal Engine\Builds"
@@ -119,13 +295,13 @@ class PluginReader:
             EnginePath, _ = winreg.QueryValueEx(Key, GUID)
             winreg.CloseKey(Key)
             return Path(EnginePath)
-        except (OSError, FileNotFoundError):
+        except (ImportError, OSError):
             return None
 
     def FindEngineByVersion(self, Version: str) -> Optional[Path]:
         """通过版本号查找安装版引擎"""
-        import winreg
         try:
+            import winreg
             Key = winreg.OpenKey(
                 winreg.HKEY_LOCAL_MACHINE,
                 rf"SOFTWARE\EpicGames\Unreal Engine\{Version}"
@@ -133,90 +309,255 @@ class PluginReader:
             InstallDir, _ = winreg.QueryValueEx(Key, "InstalledDirectory")
             winreg.CloseKey(Key)
             return Path(InstallDir)
-        except (OSError, FileNotFoundError):
+        except (ImportError, OSError):
             # 尝试默认路径
             DefaultPath = Path(f"C:/Program Files/Epic Games/UE_{Version}")
             if DefaultPath.exists():
                 return DefaultPath
             return None
 
-    def LoadAllPlugins(self) -> dict[PluginSource, list[PluginInfo]]:
-        """加载所有插件"""
+    @Traced("Reader")
+    def LoadAllPlugins(self, OnBatch: Optional[Callable[[list[PluginInfo]], None]] = None) -> dict[PluginSource, list[PluginInfo]]:
+        """加载所有插件，OnBatch 在每批插件解析完成后调用（项目插件先于引擎插件）"""
+        self.Errors.clear()
+        self.ScannedCount = 0
         for Source in PluginSource:
             self.Plugins[Source].clear()
 
+        for Batch in self.IterPluginBatches():
+            for Plugin in Batch:
+                self.Plugins[Plugin.Source].append(Plugin)
+            if OnBatch:
+                OnBatch(Batch)
+
+        return self.Plugins
+
+    def IterPlugins(self, Sources: Optional[Iterable[PluginSource]] = None,
+                    Names: Optional[Iterable[str]] = None) -> Iterator[PluginInfo]:
+        """逐个产出插件，可提前终止；Sources/Names 过滤在遍历阶段生效，不匹配的文件不会被解析"""
+        for Batch in self.IterPluginBatches(Sources, Names):
+            yield from Batch
+
+    def IterPluginBatches(self, Sources: Optional[Iterable[PluginSource]] = None,
+                          Names: Optional[Iterable[str]] = None) -> Iterator[list[PluginInfo]]:
+        """分批产出插件（项目插件先于引擎插件），结束或提前终止时保存缓存；
+        解析错误和已处理文件数在多次调用间累计（按来源分次加载）"""
         if not self.ProjectInfo:
             self.LoadProject()
 
         if not self.ProjectInfo:
-            return self.Plugins
+            return
 
-        # 加载项目插件
-        self.LoadPluginsFromDir(
-            self.ProjectPath / "Plugins",
-            PluginSource.Project
-        )
+        Sources = set(Sources) if Sources is not None else set(PluginSource)
+        Names = set(Names) if Names is not None else None
+
+        try:
+            for PluginsDir, Source in self.GetRoots(Sources):
+                if self.CancelRequested:
+                    return
+                yield from self.IterRootBatches(PluginsDir, Source, Sources, Names)
+        finally:
+            self.FinishScan()
+
+    def IterRootBatches(self, PluginsDir: Path, Source: PluginSource, Sources: set,
+                        Names: Optional[set] = None) -> Iterator[list[PluginInfo]]:
+        """分批产出一个根目录下属于 Sources 的插件（一次遍历），扫描结束后需调用 FinishScan"""
+        self.ScannedRoots.append(PluginsDir)
+        # 区间包含调用方处理各批结果的时间
+        with TraceSpan("ScanRoot", "Reader", Root=str(PluginsDir), Source=Source.value):
+            yield from self.IterDirBatches(PluginsDir, Source, Sources, Names)
+
+    def FinishScan(self):
+        """结束扫描：关闭解析工作池，保存并释放缓存"""
+        self.ShutdownPool()
+        Scanned, self.ScannedRoots = self.ScannedRoots, []
+        if self.Cache:
+            # 插件记录只保留列表所需字段，缓存条目不再常驻内存
+            with TraceSpan("SaveCache", "Reader"):
+                self.Cache.Save(Scanned)
+                self.Cache.Unload()
+
+    def GetRoots(self, Sources: set) -> list[tuple[Path, PluginSource]]:
+        """获取需要扫描的插件根目录及其来源"""
+        if not self.ProjectInfo:
+            return []
 
-        # 加载引擎插件
+        # 项目和引擎目录下都可能有 Marketplace 目录（商城插件）
+        Roots = []
+        if Sources & {PluginSource.Project, PluginSource.Fab}:
+            Roots.append((self.ProjectPath / "Plugins", PluginSource.Project))
         if self.ProjectInfo.EnginePath:
-            self.LoadPluginsFromDir(
-                self.ProjectInfo.EnginePath / "Engine" / "Plugins",
-                PluginSource.Engine
-            )
+            EnginePluginsDir = self.ProjectInfo.EnginePath / "Engine" / "Plugins"
+            if PluginSource.Engine in Sources:
+                Roots.append((EnginePluginsDir, PluginSource.Engine))
+            elif PluginSource.Fab in Sources:
+                # 只需要商城插件时不遍历整个引擎插件目录
+                Roots.append((EnginePluginsDir / "Marketplace", PluginSource.Engine))
+        return Roots
+
+    def GetRootSource(self, UPluginFile: Path) -> PluginSource:
+        """根据插件文件所在根目录确定基础来源（项目或引擎）"""
+        if UPluginFile.is_relative_to(self.ProjectPath / "Plugins"):
+            return PluginSource.Project
+        return PluginSource.Engine
+
+    @Traced("Reader")
+    def ScanFileStats(self, Sources: Optional[Iterable[PluginSource]] = None) -> dict[Path, tuple[int, int]]:
+        """遍历插件目录并获取插件文件的 (大小, 修改时间)，用于检测增删改"""
+        Sources = set(Sources) if Sources is not None else set(PluginSource)
+        ExcludeDirs = self.ExcludeDirs if self.ExcludeDirs is not None else DEFAULT_EXCLUDE_DIRS
+        SkipDirs = frozenset() if PluginSource.Fab in Sources else frozenset({"Marketplace"})
+
+        Stats = {}
+        for PluginsDir, Source in self.GetRoots(Sources):
+            if not PluginsDir.exists():
+                continue
+            for UPluginFile in IterPluginFiles(PluginsDir, ExcludeDirs, SkipDirs):
+                if GetPluginSource(UPluginFile, Source) not in Sources:
+                    continue
+                try:
+                    St = UPluginFile.stat()
+                except OSError:
+                    continue
+                Stats[UPluginFile] = (St.st_size, St.st_mtime_ns)
+        return Stats
+
+    def IterDirBatches(self, PluginsDir: Path, Source: PluginSource,
+                       Sources: set, Names: Optional[set]) -> Iterator[list[PluginInfo]]:
+        """遍历目录并分批解析插件，边遍历边解析"""
+        if not PluginsDir.exists():
+            return
 
-        # 更新启用状态
-        self.UpdateEnabledStatus()
+        ExcludeDirs = self.ExcludeDirs if self.ExcludeDirs is not None else DEFAULT_EXCLUDE_DIRS
+        SkipDirs = frozenset() if PluginSource.Fab in Sources else frozenset({"Marketplace"})
 
-        return self.Plugins
+        Files = (
+            F for F in IterPluginFiles(PluginsDir, ExcludeDirs, SkipDirs)
+            if GetPluginSource(F, Source) in Sources and (Names is None or F.stem in Names)
+        )
+        while not self.CancelRequested:
+            with TraceSpan("Walk", "Reader") as WalkSpan:
+                Chunk = list(islice(Files, BATCH_SIZE))
+                WalkSpan.SetArgs(Files=len(Chunk))
+            if not Chunk:
+                return
+            with TraceSpan("ParseBatch", "Reader", Files=len(Chunk)):
+                Batch = self.ParsePluginFiles(Chunk, Source)
+                self.ApplyEnabledStatus(Batch)
+            self.ScannedCount += len(Chunk)
+            yield Batch
+
+    def Cancel(self):
+        """请求取消正在进行的加载（在下一批开始前生效）"""
+        self.CancelRequested = True
 
     def LoadPluginsFromDir(self, PluginsDir: Path, Source: PluginSource):
         """从目录加载插件"""
-        if not PluginsDir.exists():
-            return
-
-        for UPluginFile in PluginsDir.rglob("*.uplugin"):
-            Plugin = self.ParsePluginFile(UPluginFile, Source)
-            if Plugin:
-                self.Plugins[Plugin.Source].append(Plugin)
+        try:
+            for Batch in self.IterDirBatches(PluginsDir, Source, set(PluginSource), None):
+                for Plugin in Batch:
+                    self.Plugins[Plugin.Source].append(Plugin)
+        finally:
+            self.ShutdownPool()
 
     def ParsePluginFile(self, UPluginFile: Path, Source: PluginSource) -> Optional[PluginInfo]:
         """解析插件文件"""
-        try:
-            with open(UPluginFile, "r", encoding="utf-8-sig") as F:
-                Content = F.read()
-            # 去除尾随逗号（UE 的 JSON 允许尾随逗号，标准 JSON 不允许）
-            Content = re.sub(r',(\s*[\]\}])', r'\1', Content)
-            Data = json.loads(Content)
-
-            # 解析依赖插件
-            Dependencies = []
-            for Plugin in Data.get("Plugins", []):
-                if Plugin.get("Enabled", True):
-                    Dependencies.append(Plugin.get("Name", ""))
-
-            # 检测是否为 Fab 商城插件
-            ActualSource = Source
-            if "Marketplace" in UPluginFile.parts:
-                ActualSource = PluginSource.Fab
-
-            return PluginInfo(
+        Results = self.ParsePluginFiles([UPluginFile], Source)
+        return Results[0] if Results else None
+
+    def ParsePluginFiles(self, Files: list[Path], Source: PluginSource,
+                         Errors: Optional[list[tuple[Path, str]]] = None) -> list[PluginInfo]:
+        """批量解析插件文件，结果顺序与输入一致，失败的文件记录到 Errors（默认为读取器的 Errors）"""
+        if Errors is None:
+            Errors = self.Errors
+        FieldsList: list[Optional[dict]] = [None] * len(Files)
+        StatList: list[Optional[os.stat_result]] = [None] * len(Files)
+
+        # 优先使用缓存，文件未变化时跳过读取和解析
+        Misses = []
+        LookupStart = time.perf_counter_ns() if TRACER.Enabled else 0
+        for i, UPluginFile in enumerate(Files):
+            try:
+                StatList[i] = UPluginFile.stat()
+            except OSError as E:
+                Errors.append((UPluginFile, str(E)))
+                continue
+            if self.Cache:
+                FieldsList[i] = self.Cache.Get(UPluginFile, StatList[i])
+            if FieldsList[i] is None:
+                Misses.append(i)
+
+        # 未命中的文件交给工作池解析
+        MissFiles = [Files[i] for i in Misses]
+        if TRACER.Enabled:
+            TRACER.AddComplete("CacheLookup", "Reader", LookupStart, time.perf_counter_ns(),
+                               {"Files": len(Files), "Misses": len(Misses)})
+        for i, (Fields, Error) in zip(Misses, self.RunParse(MissFiles)):
+            if Error:
+                Errors.append((Files[i], Error))
+                continue
+            FieldsList[i] = Fields
+            if self.Cache:
+                self.Cache.Put(Files[i], StatList[i], Fields)
+
+        Results = []
+        for UPluginFile, Fields, St in zip(Files, FieldsList, StatList):
+            if Fields is None:
+                continue
+
+            # 只记录解析成功的文件状态，用于之后检测修改（失败的文件在下次刷新时重试）
+            self.FileStats[UPluginFile] = (St.st_size, St.st_mtime_ns)
+            Results.append(PluginInfo(
                 Name=UPluginFile.stem,
                 Path=UPluginFile.parent,
-                Source=ActualSource,
-                Version=str(Data.get("Version", Data.get("VersionName", ""))),
-                Description=Data.get("Description", ""),
-                Category=Data.get("Category", ""),
-                CreatedBy=Data.get("CreatedBy", ""),
-                DocsURL=Data.get("DocsURL", ""),
-                EnabledByDefault=Data.get("EnabledByDefault", False),
-                CanContainContent=Data.get("CanContainContent", False),
-                IsBetaVersion=Data.get("IsBetaVersion", False),
-                Modules=Data.get("Modules", []),
-                Plugins=Dependencies
-            )
-        except Exception as E:
-            print(f"解析插件失败: {UPluginFile} - {E}")
-            return None
+                Source=GetPluginSource(UPluginFile, Source),
+                **Fields
+            ))
+        return Results
+
+    def RunParse(self, Files: list[Path]) -> list[tuple[Optional[dict], str]]:
+        """解析文件列表，Workers <= 1 时在当前线程顺序执行（便于调试）"""
+        if TRACER.Enabled:
+            return self.RunTimedParse(Files)
+        if self.Workers <= 1 or len(Files) < 2:
+            return [TryReadPluginFields(F) for F in Files]
+
+        # map 保证结果顺序与输入一致
+        return list(self.GetPool().map(TryReadPluginFields, Files, chunksize=32))
+
+    def GetPool(self):
+        """获取解析工作池，首次使用时创建，之后的批次复用（进程池每次创建都要启动工作进程）"""
+        if self.Pool is None:
+            self.Pool = self.CreatePool()
+        return self.Pool
+
+    def ShutdownPool(self):
+        """关闭解析工作池"""
+        if self.Pool is not None:
+            self.Pool.shutdown()
+            self.Pool = None
+
+    def CreatePool(self):
+        """创建解析工作池（按需导入，进程池会加载 multiprocessing，拖慢启动）"""
+        if self.UseProcesses:
+            from concurrent.futures import ProcessPoolExecutor
+            return ProcessPoolExecutor(max_workers=self.Workers)
+        from concurrent.futures import ThreadPoolExecutor
+        return ThreadPoolExecutor(max_workers=self.Workers)
+
+    def RunTimedParse(self, Files: list[Path]) -> list[tuple[Optional[dict], str]]:
+        """解析文件列表并记录每个文件的解析事件（工作进程中计时，由当前进程记录）"""
+        if self.Workers <= 1 or len(Files) < 2:
+            Results = [TimedReadPluginFields(F) for F in Files]
+        else:
+            Results = list(self.GetPool().map(TimedReadPluginFields, Files, chunksize=32))
+
+        for UPluginFile, (_, Error, StartNs, EndNs, Pid, Tid) in zip(Files, Results):
+            Args = {"Path": str(UPluginFile)}
+            if Error:
+                Args["Error"] = Error
+            TRACER.AddComplete(UPluginFile.name, PARSE_CATEGORY, StartNs, EndNs, Args, Pid, Tid)
+        return [(Fields, Error) for Fields, Error, *_ in Results]
 
     def UpdateEnabledStatus(self):
         """更新插件在项目中的启用状态"""
@@ -224,10 +565,13 @@ class PluginReader:
             return
 
         for Source in PluginSource:
-            for Plugin in self.Plugins[Source]:
-                if Plugin.Name in self.ProjectInfo.EnabledPlugins:
-                    Plugin.EnabledInProject = True
-                elif Plugin.Name in self.ProjectInfo.DisabledPlugins:
-                    Plugin.EnabledInProject = False
-                else:
-                    Plugin.EnabledInProject = None  # 未显式配置
+            self.ApplyEnabledStatus(self.Plugins[Source])
+
+    def ApplyEnabledStatus(self, Plugins: list[PluginInfo]):
+        """根据项目配置设置插件的启用状态（未显式配置为 None）"""
+        if not self.ProjectInfo:
+            return
+
+        States = self.ProjectInfo.PluginStates
+        for Plugin in Plugins:
+            Plugin.EnabledInProject = States.get(Plugin.Name)
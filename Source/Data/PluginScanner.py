@@ -0,0 +1,71 @@
+# 插件目录扫描模块
+import os
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+from Source.Data.Tracing import TRACER, SCAN_CATEGORY
+
+
+# 插件内默认不进入的目录（大体积目录，不会包含 .uplugin）；插件外的分组目录不受影响
+DEFAULT_EXCLUDE_DIRS = frozenset({
+    "Binaries", "Intermediate", "Content", "Resources", "Source",
+    "Saved", "Shaders", "Config", "DerivedDataCache", "Extras"
+})
+
+# 插件内允许嵌套子插件的目录
+NESTED_PLUGINS_DIR = "Plugins"
+
+
+def IterPluginFiles(RootDir: Path, ExcludeDirs: Optional[frozenset] = None,
+                    SkipDirs: frozenset = frozenset()) -> Iterator[Path]:
+    """遍历目录下的 .uplugin 文件
+
+    目录中存在 .uplugin 时视为插件根目录，不再向下遍历，
+    仅继续进入其 Plugins 子目录查找嵌套插件。ExcludeDirs 和以 . 开头的目录只在插件内跳过
+    （插件外同名的分组目录照常遍历），SkipDirs 在任何层级都跳过。结果按路径排序，保证顺序稳定。
+    开启追踪时记录每个目录的列举耗时（不含调用方处理结果的时间）。
+    """
+    if ExcludeDirs is None:
+        ExcludeDirs = DEFAULT_EXCLUDE_DIRS
+
+    Tracing = TRACER.Enabled
+    # (目录, 是否位于插件内)
+    Stack = [(str(RootDir), False)]
+    while Stack:
+        CurDir, InPlugin = Stack.pop()
+        StartNs = time.perf_counter_ns() if Tracing else 0
+        try:
+            with os.scandir(CurDir) as It:
+                Entries = sorted(It, key=lambda E: E.name)
+        except OSError:
+            continue
+
+        PluginFiles = []
+        SubDirs = []
+        for Entry in Entries:
+            try:
+                if Entry.is_dir():
+                    if Entry.name not in SkipDirs:
+                        SubDirs.append(Entry)
+                elif Entry.name.endswith(".uplugin"):
+                    PluginFiles.append(Entry)
+            except OSError:
+                continue
+
+        if Tracing:
+            TRACER.AddComplete("ScanDir", SCAN_CATEGORY, StartNs, time.perf_counter_ns(),
+                               {"Path": CurDir, "Entries": len(Entries)})
+
+        for Entry in PluginFiles:
+            yield Path(Entry.path)
+
+        # 插件根目录只继续查找嵌套插件，插件内跳过排除的目录
+        if PluginFiles:
+            SubDirs = [E for E in SubDirs if E.name == NESTED_PLUGINS_DIR]
+            InPlugin = True
+        elif InPlugin:
+            SubDirs = [E for E in SubDirs if E.name not in ExcludeDirs and not E.name.startswith(".")]
+
+        # 逆序入栈，使出栈顺序与名称顺序一致
+        for Entry in reversed(SubDirs):
+            Stack.append((Entry.path, InPlugin))
@@ -0,0 +1,292 @@
+# 项目文件（.uproject）读写
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+UTF8_BOM = "\ufeff"
+WHITESPACE = " \t\r\n"
+
+
+@dataclass
+class TextStyle:
+    """项目文件的排版风格，用于格式化新增的内容"""
+    Newline: str = "\n"  # 换行符，单行格式为空
+    Unit: str = "\t"  # 单级缩进
+    KeySep: str = ": "  # 键和值之间的分隔
+
+    def Indent(self, Level: int) -> str:
+        """换行并缩进到指定层级"""
+        if not self.Newline:
+            return ""
+        return self.Newline + self.Unit * Level
+
+
+def ReadProjectText(UProjectFile: Path) -> str:
+    """读取项目文件原文（保留 BOM 和换行符）"""
+    with open(UProjectFile, "r", encoding="utf-8", newline="") as F:
+        return F.read()
+
+
+def WriteProjectText(UProjectFile: Path, Text: str):
+    """写入项目文件原文（先写临时文件再替换）"""
+    TempPath = UProjectFile.with_name(UProjectFile.name + ".tmp")
+    try:
+        with open(TempPath, "w", encoding="utf-8", newline="") as F:
+            F.write(Text)
+        os.replace(TempPath, UProjectFile)
+    except OSError:
+        try:
+            TempPath.unlink(missing_ok=True)
+        except OSError:
+            pass
+        raise
+
+
+class ProjectDocument:
+    """缓存的项目文件，文件大小或修改时间变化后才重新读取"""
+
+    def __init__(self, UProjectFile: Path):
+        self.Path = UProjectFile
+        self.Text: Optional[str] = None
+        self.Data: Optional[dict] = None  # 按需解析
+        self.Stat: Optional[tuple[int, int]] = None  # 读取或写入时的 (大小, 修改时间)
+
+    def GetDiskStat(self) -> tuple[int, int]:
+        """获取磁盘上文件的 (大小, 修改时间)"""
+        St = self.Path.stat()
+        return St.st_size, St.st_mtime_ns
+
+    def IsModified(self) -> bool:
+        """文件是否在上次读取或写入后被修改"""
+        return self.Text is None or self.GetDiskStat() != self.Stat
+
+    def Load(self) -> bool:
+        """文件有变化时重新读取，返回是否重新读取"""
+        Stat = self.GetDiskStat()
+        if self.Text is not None and Stat == self.Stat:
+            return False
+        self.Text = ReadProjectText(self.Path)
+        self.Data = None
+        self.Stat = Stat
+        return True
+
+    def GetData(self) -> dict:
+        """获取解析后的内容"""
+        if self.Data is None:
+            self.Data = json.loads(self.Text.removeprefix(UTF8_BOM))
+        return self.Data
+
+    def GetPluginStates(self) -> dict[str, bool]:
+        """获取文件中配置的插件启用状态（与 PluginReader 一致：未写 Enabled 视为启用，启用优先）"""
+        States = {}
+        for Plugin in self.GetData().get("Plugins", []):
+            PluginName = Plugin.get("Name", "")
+            States[PluginName] = States.get(PluginName, False) or bool(Plugin.get("Enabled", True))
+        return States
+
+    def Write(self, Text: str):
+        """写入文件并更新缓存"""
+        WriteProjectText(self.Path, Text)
+        self.Text = Text
+        self.Data = None
+        self.Stat = self.GetDiskStat()
+
+
+def UpdatePluginStates(Text: str, States: dict[str, Optional[bool]]) -> str:
+    """修改项目文件中的插件配置（None 表示移除配置），只改动相关条目，其余内容保持原样"""
+    Bom = UTF8_BOM if Text.startswith(UTF8_BOM) else ""
+    Body = Text[len(Bom):]
+
+    # 先完整解析一次，确保文件合法，之后的扫描可以不做错误检查
+    if not isinstance(json.loads(Body), dict):
+        raise ValueError("项目文件根节点不是对象")
+
+    RootStart = SkipWhitespace(Body, 0)
+    RootMembers, RootEnd = ScanObject(Body, RootStart)
+    Style = GetTextStyle(Body, RootStart, RootMembers)
+
+    # json 解析重复键时取最后一个，这里保持一致
+    PluginsMember = None
+    for Member in RootMembers:
+        if Member[0] == "Plugins":
+            PluginsMember = Member
+
+    if PluginsMember is None:
+        Added = [(Name, Enabled) for Name, Enabled in States.items() if Enabled is not None]
+        if not Added:
+            return Text
+        Entries = [FormatEntry(Name, Enabled, Style.Indent(3), Style.Indent(2), Style.KeySep) for Name, Enabled in Added]
+        Array = "[" + Style.Indent(2) + ("," + Style.Indent(2)).join(Entries) + Style.Indent(1) + "]"
+        Member = '"Plugins"' + Style.KeySep + Array
+        if RootMembers:
+            InsertPos = RootMembers[-1][4]
+            return Bom + Body[:InsertPos] + "," + Style.Indent(1) + Member + Body[InsertPos:]
+        return Bom + Body[:RootStart + 1] + Style.Indent(1) + Member + Style.Indent(0) + Body[RootEnd - 1:]
+
+    _, _, _, ArrayStart, ArrayEnd = PluginsMember
+    if Body[ArrayStart] != "[":
+        raise ValueError("项目文件的 Plugins 不是数组")
+    NewArray = UpdatePluginArray(Body, ArrayStart, ArrayEnd, States, Style)
+    if NewArray is None:
+        return Text
+    return Bom + Body[:ArrayStart] + NewArray + Body[ArrayEnd:]
+
+
+def UpdatePluginArray(Text: str, ArrayStart: int, ArrayEnd: int,
+                      States: dict[str, Optional[bool]], Style: TextStyle) -> Optional[str]:
+    """生成修改后的 Plugins 数组文本，没有变化时返回 None"""
+    Items = ScanArray(Text, ArrayStart)
+    Changed = False
+    Found = set()
+    Pieces = []  # (与前一项之间的分隔, 条目文本)
+    Template = None  # 已有条目的排版：(成员缩进, 结尾缩进, 键值分隔)
+
+    for i, (Start, End) in enumerate(Items):
+        Separator = Text[Items[i - 1][1]:Start] if i else ""
+        ItemText = Text[Start:End]
+        if Text[Start] == "{":
+            Members, _ = ScanObject(Text, Start)
+            if Members and Template is None:
+                Template = (Text[Start + 1:Members[0][1]], Text[Members[-1][4]:End - 1],
+                            Text[Members[0][2]:Members[0][3]])
+            Name = None
+            for Key, _, _, ValueStart, ValueEnd in Members:
+                if Key == "Name":
+                    Name = json.loads(Text[ValueStart:ValueEnd])
+            if isinstance(Name, str) and Name in States:
+                Found.add(Name)
+                if States[Name] is None:
+                    Changed = True
+                    continue
+                NewText = SetEnabledMember(Text, Start, End, Members, States[Name])
+                if NewText != ItemText:
+                    Changed = True
+                    ItemText = NewText
+        Pieces.append((Separator, ItemText))
+
+    Added = [(Name, Enabled) for Name, Enabled in States.items() if Enabled is not None and Name not in Found]
+    if not Changed and not Added:
+        return None
+
+    if Items:
+        Lead = Text[ArrayStart + 1:Items[0][0]]
+        Trail = Text[Items[-1][1]:ArrayEnd - 1]
+    else:
+        Lead = Style.Indent(2)
+        Trail = Style.Indent(1)
+    if Template is None:
+        Template = (Style.Indent(3), Style.Indent(2), Style.KeySep)
+    for Name, Enabled in Added:
+        Pieces.append(("," + Lead, FormatEntry(Name, Enabled, *Template)))
+
+    if not Pieces:
+        return "[]"
+    # 第一项不需要分隔
+    Content = Pieces[0][1] + "".join(Separator + ItemText for Separator, ItemText in Pieces[1:])
+    return "[" + Lead + Content + Trail + "]"
+
+
+def SetEnabledMember(Text: str, Start: int, End: int, Members: list, Enabled: bool) -> str:
+    """设置插件条目的 Enabled 值，返回条目文本"""
+    Literal = "true" if Enabled else "false"
+    for Key, _, _, ValueStart, ValueEnd in reversed(Members):
+        if Key == "Enabled":
+            return Text[Start:ValueStart] + Literal + Text[ValueEnd:End]
+
+    # 没有 Enabled 成员时按已有成员的排版追加
+    MemberIndent = Text[Start + 1:Members[0][1]]
+    KeySep = Text[Members[0][2]:Members[0][3]]
+    LastEnd = Members[-1][4]
+    return Text[Start:LastEnd] + "," + MemberIndent + '"Enabled"' + KeySep + Literal + Text[LastEnd:End]
+
+
+def FormatEntry(Name: str, Enabled: bool, MemberIndent: str, Closing: str, KeySep: str) -> str:
+    """格式化新的插件条目"""
+    return (
+        "{" + MemberIndent + '"Name"' + KeySep + json.dumps(Name, ensure_ascii=False) + ","
+        + MemberIndent + '"Enabled"' + KeySep + ("true" if Enabled else "false") + Closing + "}"
+    )
+
+
+def GetTextStyle(Text: str, RootStart: int, RootMembers: list) -> TextStyle:
+    """根据根对象第一个成员推断换行、缩进和键值分隔"""
+    if not RootMembers:
+        return TextStyle()
+    Indent = Text[RootStart + 1:RootMembers[0][1]]
+    KeySep = Text[RootMembers[0][2]:RootMembers[0][3]]
+    if "\n" not in Indent:
+        return TextStyle(Newline="", Unit="", KeySep=KeySep)
+    Newline = "\r\n" if "\r\n" in Indent else "\n"
+    Unit = Indent[Indent.rindex("\n") + 1:] or "\t"
+    return TextStyle(Newline=Newline, Unit=Unit, KeySep=KeySep)
+
+
+def SkipWhitespace(Text: str, Pos: int) -> int:
+    """跳过空白字符"""
+    while Pos < len(Text) and Text[Pos] in WHITESPACE:
+        Pos += 1
+    return Pos
+
+
+def ScanString(Text: str, Pos: int) -> int:
+    """返回从 Pos（引号）开始的字符串的结束位置"""
+    Pos += 1
+    while Text[Pos] != '"':
+        Pos += 2 if Text[Pos] == "\\" else 1
+    return Pos + 1
+
+
+def ScanValue(Text: str, Pos: int) -> int:
+    """返回从 Pos 开始的值的结束位置"""
+    if Text[Pos] == '"':
+        return ScanString(Text, Pos)
+    if Text[Pos] in "{[":
+        Depth = 0
+        while True:
+            Char = Text[Pos]
+            if Char == '"':
+                Pos = ScanString(Text, Pos)
+                continue
+            if Char in "{[":
+                Depth += 1
+            elif Char in "}]":
+                Depth -= 1
+                if Depth == 0:
+                    return Pos + 1
+            Pos += 1
+    # 数字、true、false、null
+    while Pos < len(Text) and Text[Pos] not in ",}]" + WHITESPACE:
+        Pos += 1
+    return Pos
+
+
+def ScanObject(Text: str, Pos: int) -> tuple[list[tuple[str, int, int, int, int]], int]:
+    """扫描 Pos（左花括号）开始的对象，返回成员 (键, 键起始, 键结束, 值起始, 值结束) 和对象结束位置"""
+    Members = []
+    Pos = SkipWhitespace(Text, Pos + 1)
+    while Text[Pos] != "}":
+        KeyStart = Pos
+        KeyEnd = ScanString(Text, KeyStart)
+        ValueStart = SkipWhitespace(Text, SkipWhitespace(Text, KeyEnd) + 1)
+        ValueEnd = ScanValue(Text, ValueStart)
+        Members.append((json.loads(Text[KeyStart:KeyEnd]), KeyStart, KeyEnd, ValueStart, ValueEnd))
+        Pos = SkipWhitespace(Text, ValueEnd)
+        if Text[Pos] == ",":
+            Pos = SkipWhitespace(Text, Pos + 1)
+    return Members, Pos + 1
+
+
+def ScanArray(Text: str, Pos: int) -> list[tuple[int, int]]:
+    """扫描 Pos（左方括号）开始的数组，返回各元素的 (起始, 结束)"""
+    Items = []
+    Pos = SkipWhitespace(Text, Pos + 1)
+    while Text[Pos] != "]":
+        End = ScanValue(Text, Pos)
+        Items.append((Pos, End))
+        Pos = SkipWhitespace(Text, End)
+        if Text[Pos] == ",":
+            Pos = SkipWhitespace(Text, Pos + 1)
+    return Items
@@ -0,0 +1,260 @@
+# 性能追踪：记录耗时区间，导出为 Chrome 追踪格式（chrome://tracing 或 Perfetto 打开）
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+import functools
+from pathlib import Path
+from collections import defaultdict
+from typing import Optional
+
+
+# 设置为输出文件路径即开启追踪
+TRACE_ENV = "UEPM_TRACE"
+
+# 导出时汇总的最慢描述文件和目录数量
+SUMMARY_SIZE = 20
+
+# 单个描述文件解析的追踪分类，导出时按文件和目录汇总
+PARSE_CATEGORY = "Parse"
+
+# 单个目录列举的追踪分类，导出时汇总最慢的目录
+SCAN_CATEGORY = "Scan"
+
+
+class NullSpan:
+    """未开启追踪时使用的空区间，不做任何记录"""
+
+    def __enter__(self) -> "NullSpan":
+        return self
+
+    def __exit__(self, *Exc):
+        return False
+
+    def SetArgs(self, **Args):
+        pass
+
+
+NULL_SPAN = NullSpan()
+
+
+class Span:
+    """耗时区间，退出时记录一个完整事件"""
+    __slots__ = ("Name", "Category", "Args", "StartNs")
+
+    def __init__(self, Name: str, Category: str, Args: dict):
+        self.Name = Name
+        self.Category = Category
+        self.Args = Args
+        self.StartNs = 0
+
+    def __enter__(self) -> "Span":
+        self.StartNs = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *Exc):
+        TRACER.AddComplete(self.Name, self.Category, self.StartNs, time.perf_counter_ns(), self.Args)
+        return False
+
+    def SetArgs(self, **Args):
+        """补充事件参数（如区间内统计的数量）"""
+        self.Args.update(Args)
+
+
+class Tracer:
+    """追踪事件收集器（全局唯一实例 TRACER），开启前所有记录调用直接返回"""
+
+    def __init__(self):
+        self.Enabled = False
+        self.OutputPath: Optional[Path] = None
+        self.Events: list[dict] = []
+        self.ThreadNames: dict[tuple[int, int], str] = {}
+        self.Origin = time.perf_counter_ns()
+        self.Pid = os.getpid()
+
+    def Enable(self, OutputPath: Path):
+        """开启追踪，程序退出时写入 OutputPath"""
+        if not self.Enabled:
+            atexit.register(self.Save)
+        self.Enabled = True
+        self.OutputPath = Path(OutputPath)
+
+    def AddComplete(self, Name: str, Category: str, StartNs: int, EndNs: int,
+                    Args: Optional[dict] = None, Pid: Optional[int] = None, Tid: Optional[int] = None):
+        """记录完整事件，时间为 perf_counter_ns，Pid/Tid 为空时使用当前进程和线程"""
+        if not self.Enabled:
+            return
+        Pid = Pid if Pid is not None else self.Pid
+        if Tid is None:
+            Tid = threading.get_ident()
+            if (Pid, Tid) not in self.ThreadNames:
+                self.ThreadNames[(Pid, Tid)] = threading.current_thread().name
+        # 列表追加是原子操作，多个线程可同时记录
+        self.Events.append({
+            "name": Name,
+            "cat": Category,
+            "ph": "X",
+            "ts": (StartNs - self.Origin) / 1000,
+            "dur": (EndNs - StartNs) / 1000,
+            "pid": Pid,
+            "tid": Tid,
+            "args": Args or {}
+        })
+
+    def GetSummary(self) -> dict:
+        """汇总：解析最慢的描述文件、解析累计耗时最多的目录（插件所在的上级目录）、列举最慢的目录"""
+        Files = []
+        ScanDirs = []
+        Dirs: dict[str, list] = defaultdict(lambda: [0.0, 0])
+        for Event in list(self.Events):
+            EventPath = Event["args"].get("Path")
+            if EventPath is None:
+                continue
+            if Event["cat"] == SCAN_CATEGORY:
+                ScanDirs.append((Event["dur"], EventPath))
+            elif Event["cat"] == PARSE_CATEGORY:
+                Files.append((Event["dur"], EventPath))
+                Entry = Dirs[str(Path(EventPath).parent.parent)]
+                Entry[0] += Event["dur"]
+                Entry[1] += 1
+
+        Files.sort(reverse=True)
+        ScanDirs.sort(reverse=True)
+        ParseDirs = sorted(Dirs.items(), key=lambda Item: Item[1][0], reverse=True)
+        return {
+            "SlowestFiles": [{"Path": P, "Ms": Dur / 1000} for Dur, P in Files[:SUMMARY_SIZE]],
+            "SlowestParseDirs": [
+                {"Path": D, "Ms": Total / 1000, "Files": Count}
+                for D, (Total, Count) in ParseDirs[:SUMMARY_SIZE]
+            ],
+            "SlowestScanDirs": [{"Path": P, "Ms": Dur / 1000} for Dur, P in ScanDirs[:SUMMARY_SIZE]]
+        }
+
+    def Save(self, OutputPath: Optional[Path] = None) -> tuple[bool, str]:
+        """写入 Chrome 追踪格式 JSON，返回 (成功, 错误信息)"""
+        OutputPath = Path(OutputPath) if OutputPath else self.OutputPath
+        if not self.Enabled or not OutputPath:
+            return False, "未开启追踪"
+
+        Meta = [
+            {"name": "thread_name", "ph": "M", "pid": Pid, "tid": Tid, "args": {"name": Name}}
+            for (Pid, Tid), Name in list(self.ThreadNames.items())
+        ]
+        Meta.append({"name": "process_name", "ph": "M", "pid": self.Pid, "tid": 0,
+                     "args": {"name": "UEPluginManager"}})
+        Data = {
+            "traceEvents": Meta + list(self.Events),
+            "displayTimeUnit": "ms",
+            "otherData": self.GetSummary()
+        }
+        try:
+            OutputPath.parent.mkdir(parents=True, exist_ok=True)
+            with open(OutputPath, "w", encoding="utf-8") as F:
+                json.dump(Data, F, ensure_ascii=False)
+            return True, ""
+        except Exception as E:
+            print(f"保存追踪文件失败: {OutputPath} - {E}")
+            return False, str(E)
+
+
+TRACER = Tracer()
+
+
+def TraceSpan(Name: str, Category: str = "", **Args):
+    """追踪一段代码：with TraceSpan("名称", "分类", 参数=值): ...，未开启时返回空区间"""
+    if not TRACER.Enabled:
+        return NULL_SPAN
+    return Span(Name, Category, Args)
+
+
+def Traced(Category: str):
+    """追踪整个函数的装饰器，事件名为函数的限定名"""
+    def Decorator(Func):
+        Name = Func.__qualname__
+
+        @functools.wraps(Func)
+        def Wrapper(*Args, **Kwargs):
+            if not TRACER.Enabled:
+                return Func(*Args, **Kwargs)
+            StartNs = time.perf_counter_ns()
+            try:
+                return Func(*Args, **Kwargs)
+            finally:
+                TRACER.AddComplete(Name, Category, StartNs, time.perf_counter_ns())
+        return Wrapper
+    return Decorator
+
+
+class StartupReport:
+    """启动耗时报告（全局唯一实例 STARTUP）：记录各阶段相对启动的时间，首次加载完成后输出"""
+
+    def __init__(self):
+        self.Enabled = False
+        self.Finished = False
+        self.OutputPath: Optional[Path] = None  # None 输出到标准输出
+        self.StartNs = time.perf_counter_ns()
+        self.Marks: list[tuple[str, int]] = []
+
+    def Begin(self, StartNs: int):
+        """设置计时起点（启动文件开始执行的时间，perf_counter_ns）"""
+        self.StartNs = StartNs
+
+    def Enable(self, OutputPath: Optional[Path] = None):
+        """开启报告，OutputPath 为 None 时输出到标准输出"""
+        self.Enabled = True
+        self.OutputPath = OutputPath
+
+    def Mark(self, Name: str):
+        """记录一个阶段完成，开启追踪时同时记录为该阶段的区间（启动完成后不再记录）"""
+        if self.Finished or (not self.Enabled and not TRACER.Enabled):
+            return
+        Now = time.perf_counter_ns()
+        PrevNs = self.Marks[-1][1] if self.Marks else self.StartNs
+        self.Marks.append((Name, Now))
+        TRACER.AddComplete(Name, "Startup", PrevNs, Now)
+
+    def HasMark(self, Name: str) -> bool:
+        """阶段是否已记录"""
+        return any(MarkName == Name for MarkName, _ in self.Marks)
+
+    def Finish(self):
+        """启动完成，开启报告时输出（只输出一次）"""
+        if self.Finished:
+            return
+        self.Finished = True
+        if not self.Enabled:
+            return
+        Lines = [f"{'耗时(ms)':>10}{'累计(ms)':>10}  阶段"]
+        PrevNs = self.StartNs
+        for Name, Ns in self.Marks:
+            Lines.append(f"{(Ns - PrevNs) / 1e6:10.1f}{(Ns - self.StartNs) / 1e6:10.1f}  {Name}")
+            PrevNs = Ns
+        Text = "\n".join(Lines) + "\n"
+        if not self.OutputPath:
+            # 打包的窗口程序没有标准输出
+            if sys.stdout:
+                sys.stdout.write(Text)
+            return
+        try:
+            self.OutputPath.write_text(Text, encoding="utf-8")
+        except Exception as E:
+            print(f"保存启动耗时报告失败: {self.OutputPath} - {E}")
+
+
+STARTUP = StartupReport()
+
+
+def EnableFromEnv():
+    """环境变量 UEPM_TRACE 为输出路径时开启追踪（进程池的子进程不开启，由主进程记录）"""
+    OutputPath = os.environ.get(TRACE_ENV)
+    if not OutputPath:
+        return
+    # 只在开启追踪时导入，multiprocessing 导入较慢
+    import multiprocessing
+    if multiprocessing.parent_process() is None:
+        TRACER.Enable(Path(OutputPath))
+
+
+EnableFromEnv()
@@ -0,0 +1,144 @@
+# 插件依赖图
+from typing import Hashable, Iterable
+
+
+class DependencyGraph:
+    """插件依赖图，支持传递闭包、环检测和拓扑排序
+
+    Forward 为节点的直接依赖，Reverse 为直接依赖此节点的节点。
+    闭包和拓扑序会被缓存，图结构变化后需调用 Invalidate。
+    """
+
+    def __init__(self):
+        self.Forward: dict[Hashable, list] = {}
+        self.Reverse: dict[Hashable, list] = {}
+        self.TopoIndex: dict[Hashable, int] = {}
+        self.Cycles: list[list] = []
+        self.DependencyCache: dict[Hashable, tuple] = {}
+        self.DependentCache: dict[Hashable, tuple] = {}
+        self.Analyzed = False
+
+    def AddNode(self, Node: Hashable):
+        """添加节点"""
+        self.Forward.setdefault(Node, [])
+        self.Reverse.setdefault(Node, [])
+        self.Invalidate()
+
+    def SetDependencies(self, Node: Hashable, Dependencies: Iterable):
+        """设置节点的直接依赖"""
+        self.AddNode(Node)
+        self.Forward[Node] = list(Dependencies)
+
+    def SetDependents(self, Node: Hashable, Dependents: Iterable):
+        """设置直接依赖此节点的节点"""
+        self.AddNode(Node)
+        self.Reverse[Node] = list(Dependents)
+
+    def Invalidate(self):
+        """清除缓存的分析结果"""
+        self.TopoIndex = {}
+        self.Cycles = []
+        self.DependencyCache.clear()
+        self.DependentCache.clear()
+        self.Analyzed = False
+
+    def Analyze(self):
+        """用 Tarjan 算法计算强连通分量，得到拓扑序（依赖在前）和环"""
+        if self.Analyzed:
+            return
+
+        Index: dict[Hashable, int] = {}
+        LowLink: dict[Hashable, int] = {}
+        OnStack: set = set()
+        Stack: list = []
+        Order: list = []
+        Counter = 0
+
+        for Root in self.Forward:
+            if Root in Index:
+                continue
+            # 迭代实现，避免深依赖链递归过深
+            Work = [(Root, 0)]
+            while Work:
+                Node, EdgeIdx = Work.pop()
+                if EdgeIdx == 0:
+                    Index[Node] = LowLink[Node] = Counter
+                    Counter += 1
+                    Stack.append(Node)
+                    OnStack.add(Node)
+
+                Edges = self.Forward.get(Node, [])
+                Recurse = False
+                while EdgeIdx < len(Edges):
+                    Next = Edges[EdgeIdx]
+                    EdgeIdx += 1
+                    if Next not in Index:
+                        Work.append((Node, EdgeIdx))
+                        Work.append((Next, 0))
+                        Recurse = True
+                        break
+                    if Next in OnStack:
+                        LowLink[Node] = min(LowLink[Node], Index[Next])
+                if Recurse:
+                    continue
+
+                # 节点处理完毕，回传 LowLink
+                if Work:
+                    Parent = Work[-1][0]
+                    LowLink[Parent] = min(LowLink[Parent], LowLink[Node])
+
+                if LowLink[Node] == Index[Node]:
+                    Component = []
+                    while True:
+                        Item = Stack.pop()
+                        OnStack.discard(Item)
+                        Component.append(Item)
+                        if Item == Node:
+                            break
+                    if len(Component) > 1 or Node in self.Forward.get(Node, []):
+                        self.Cycles.append(Component)
+                    Order.extend(Component)
+
+        self.TopoIndex = {Node: i for i, Node in enumerate(Order)}
+        self.Analyzed = True
+
+    def GetTopologicalOrder(self) -> list:
+        """获取全部节点的拓扑序（依赖在前，环内节点相邻）"""
+        self.Analyze()
+        return sorted(self.TopoIndex, key=self.TopoIndex.__getitem__)
+
+    def FindCycles(self) -> list[list]:
+        """获取所有依赖环"""
+        self.Analyze()
+        return [list(Cycle) for Cycle in self.Cycles]
+
+    def GetDependencyClosure(self, Node: Hashable) -> list:
+        """获取节点的全部传递依赖（不含自身），按拓扑序排列，依赖在前"""
+        if Node not in self.DependencyCache:
+            self.DependencyCache[Node] = self.Closure(Node, self.Forward, Reverse=False)
+        return list(self.DependencyCache[Node])
+
+    def GetDependentClosure(self, Node: Hashable) -> list:
+        """获取传递依赖此节点的全部节点（不含自身），按逆拓扑序排列，依赖者在前"""
+        if Node not in self.DependentCache:
+            self.DependentCache[Node] = self.Closure(Node, self.Reverse, Reverse=True)
+        return list(self.DependentCache[Node])
+
+    def Closure(self, Node: Hashable, Edges: dict, Reverse: bool) -> tuple:
+        """沿指定方向遍历可达节点并按拓扑序排序"""
+        self.Analyze()
+        Visited = {Node}
+        Pending = [Node]
+        while Pending:
+            Cur = Pending.pop()
+            for Next in Edges.get(Cur, []):
+                if Next not in Visited:
+                    Visited.add(Next)
+                    Pending.append(Next)
+        Visited.discard(Node)
+
+        # 不在 Forward 中的节点（仅作为被依赖出现）排在最前
+        Result = sorted(Visited, key=lambda N: self.TopoIndex.get(N, -1))
+        if Reverse:
+            Result.reverse()
+        return tuple(Result)
@@ -1,10 +1,19 @@
 # 插件管理业务逻辑
-import json
 import os
 import stat
+import threading
+from array import array
+from bisect import insort
 from pathlib import Path
-from typing import Optional
-from Source.Data.PluginReader import PluginReader, PluginInfo, ProjectInfo, PluginSource
+from typing import Callable, Iterable, Optional
+from dataclasses import dataclass, field
+from Source.Data.PluginReader import PluginReader, PluginInfo, ProjectInfo, PluginSource, GetPluginSource
+from Source.Data.PluginCache import PluginCache
+from Source.Data.ProjectFile import ProjectDocument, UpdatePluginStates
+from Source.Data.Tracing import TraceSpan, Traced
+from Source.Logic.DependencyGraph import DependencyGraph
+from Source.Logic.PluginStore import PluginStore, PluginView, AndMasks, MaskRows
+from Source.Logic.SearchIndex import TrigramIndex
 
 
 def RemoveReadOnly(Path: Path):
@@ -17,207 +26,711 @@ def RemoveReadOnly(Path: Path):
                 os.chmod(Item, stat.S_IWRITE)
 
 
-class PluginManager:
-    """插件管理器"""
+def GetRootSources(RootSource: PluginSource) -> tuple[PluginSource, ...]:
+    """插件根目录下可能出现的来源（项目和引擎插件目录下都可能有商城插件）"""
+    return (RootSource, PluginSource.Fab)
 
-    def __init__(self):
-        self.Reader: Optional[PluginReader] = None
-        self.ProjectInfo: Optional[ProjectInfo] = None
-        self.Plugins: dict[PluginSource, list[PluginInfo]] = {
-            PluginSource.Project: [],
-            PluginSource.Engine: [],
-            PluginSource.Fab: []
-        }
-        self.FilteredPlugins: dict[PluginSource, list[PluginInfo]] = {
-            PluginSource.Project: [],
-            PluginSource.Engine: [],
-            PluginSource.Fab: []
-        }
 
-    def LoadProject(self, ProjectPath: Path) -> bool:
-        """加载项目"""
-        self.Reader = PluginReader(ProjectPath)
-        self.ProjectInfo = self.Reader.LoadProject()
+# 来源在反向依赖索引中的排列顺序（与全量构建时遍历来源的顺序一致）
+SOURCE_RANK = {Source: Index for Index, Source in enumerate(PluginSource)}
 
-        if not self.ProjectInfo:
-            return False
+# 建立倒排索引的搜索字段：0名称 1作者 2分类 3描述 4依赖
+INDEXED_FIELDS = (0, 1, 2, 3, 4)
 
-        self.Plugins = self.Reader.LoadAllPlugins()
-        for Source in PluginSource:
-            self.FilteredPlugins[Source] = self.Plugins[Source].copy()
-        return True
+# 各来源的默认加载顺序：项目插件数量少且最常用，引擎插件数量最多放在最后
+LOAD_ORDER = (PluginSource.Project, PluginSource.Fab, PluginSource.Engine)
 
-    def GetPlugins(self, Source: PluginSource) -> list[PluginInfo]:
-        """获取指定来源的插件列表"""
-        return self.FilteredPlugins[Source]
 
-    def Search(self, Keyword: str, Field: int = 0):
-        """搜索插件，Field: 0名称 1作者 2分类 3描述 4依赖 5被依赖，支持空格分隔多关键词"""
-        if not Keyword or not Keyword.strip():
-            for Source in PluginSource:
-                self.FilteredPlugins[Source] = self.Plugins[Source].copy()
-        else:
-            Keywords = [K.lower() for K in Keyword.split() if K]
-            for Source in PluginSource:
-                self.FilteredPlugins[Source] = []
-                for P in self.Plugins[Source]:
-                    if Field == 0:
-                        Text = P.Name.lower()
-                        Match = all(K in Text for K in Keywords)
-                    elif Field == 1:
-                        Text = P.CreatedBy.lower()
-                        Match = all(K in Text for K in Keywords)
-                    elif Field == 2:
-                        Text = P.Category.lower()
-                        Match = all(K in Text for K in Keywords)
-                    elif Field == 3:
-                        Text = P.Description.lower()
-                        Match = all(K in Text for K in Keywords)
-                    elif Field == 4:
-                        Deps = " ".join(P.Plugins).lower()
-                        Match = all(K in Deps for K in Keywords)
-                    elif Field == 5:
-                        Dependents = " ".join(Name for Name, _ in self.GetAllDependents(P.Name)).lower()
-                        Match = all(K in Dependents for K in Keywords)
-                    else:
-                        Match = False
-                    if Match:
-                        self.FilteredPlugins[Source].append(P)
+@dataclass
+class SearchResult:
+    """搜索结果"""
+    Field: int
+    Keywords: list  # 小写化的关键词，为空表示未过滤
+    Plugins: dict  # 来源 -> 匹配的插件视图（PluginView）
+    DataVersion: int = 0  # 搜索时的插件数据版本，与当前版本不一致时结果已过期
 
-    def GetCategories(self, Source: PluginSource) -> list[str]:
-        """获取指定来源的所有分类"""
-        Categories = set()
-        for Plugin in self.Plugins[Source]:
-            if Plugin.Category:
-                Categories.add(Plugin.Category)
-        return sorted(list(Categories))
+    def GetCounts(self) -> dict:
+        """各来源的匹配数量"""
+        return {Source: len(Items) for Source, Items in self.Plugins.items()}
 
-    def SetPluginEnabled(self, PluginName: str, Source: PluginSource, Enabled: bool) -> bool:
-        """设置插件启用状态"""
-        if not self.ProjectInfo:
-            return False
 
-        # 先更新项目文件，成功后再更新内存
-        if not self.UpdateProjectFile(PluginName, Enabled):
-            return False
+@dataclass
+class RefreshResult:
+    """增量刷新结果"""
+    Added: list = field(default_factory=list)  # 新增的插件
+    Removed: list = field(default_factory=list)  # 移除的插件
+    Modified: list = field(default_factory=list)  # 描述文件变化的插件（对象不变，字段已更新）
+    StatusChanged: list = field(default_factory=list)  # .uproject 中启用状态变化的插件名
+    Errors: list = field(default_factory=list)  # 重新解析失败的插件文件及原因（修改过的插件保留原数据）
 
-        # 更新内存中的状态
-        for Plugin in self.Plugins[Source]:
-            if Plugin.Name == PluginName:
-                Plugin.EnabledInProject = Enabled
-                break
+    def HasChanges(self) -> bool:
+        """是否有任何变化"""
+        return bool(self.Added or self.Removed or self.Modified or self.StatusChanged)
 
-        return True
 
-    def UpdateProjectFile(self, PluginName: str, Enabled: bool) -> bool:
-        """更新项目文件中的插件状态"""
-        if not self.ProjectInfo:
-            return False
+@dataclass
+class RefreshScan:
+    """增量刷新的扫描结果：由 ScanRefresh 在不持锁时得到（可在后台线程），再由 ApplyRefresh 合并"""
+    Reader: PluginReader  # 扫描时的读取器，合并前已被重新加载替换时丢弃结果
+    PluginStates: dict  # .uproject 中的插件启用状态
+    Sources: set  # 刷新的来源（已加载的）
+    Stats: dict  # 插件文件 -> (大小, 修改时间)
+    Known: dict  # 扫描前已加载的插件文件 -> 插件
+    Parsed: dict = field(default_factory=dict)  # 重新解析成功的插件文件 -> 新插件对象
+    Errors: list = field(default_factory=list)  # 重新解析失败的插件文件及原因
 
-        UProjectFiles = list(self.ProjectInfo.Path.glob("*.uproject"))
-        if not UProjectFiles:
-            return False
-        UProjectFile = UProjectFiles[0]
 
-        try:
-            with open(UProjectFile, "r", encoding="utf-8") as F:
-                Data = json.load(F)
+@dataclass
+class ProjectChanges:
+    """待写入项目文件的插件状态修改，通过 PluginManager.ApplyChanges 一次提交"""
+    States: dict = field(default_factory=dict)  # 插件名 -> True 启用 / False 禁用 / None 恢复默认
 
-            Plugins = Data.get("Plugins", [])
+    def SetEnabled(self, PluginName: str, Enabled: bool):
+        """启用或禁用插件"""
+        self.States[PluginName] = Enabled
 
-            # 查找是否已存在
-            Found = False
-            for Plugin in Plugins:
-                if Plugin.get("Name") == PluginName:
-                    Plugin["Enabled"] = Enabled
-                    Found = True
-                    break
+    def Reset(self, PluginName: str):
+        """恢复插件默认状态"""
+        self.States[PluginName] = None
 
-            if not Found:
-                Plugins.append({"Name": PluginName, "Enabled": Enabled})
-                Data["Plugins"] = Plugins
 
-            with open(UProjectFile, "w", encoding="utf-8") as F:
-                json.dump(Data, F, indent="\t", ensure_ascii=False)
+class PluginManager:
+    """插件管理器"""
 
-            # 更新内存中的项目信息
-            if Enabled:
-                if PluginName in self.ProjectInfo.DisabledPlugins:
-                    self.ProjectInfo.DisabledPlugins.remove(PluginName)
-                if PluginName not in self.ProjectInfo.EnabledPlugins:
-                    self.ProjectInfo.EnabledPlugins.append(PluginName)
-            else:
-                if PluginName in self.ProjectInfo.EnabledPlugins:
-                    self.ProjectInfo.EnabledPlugins.remove(PluginName)
-                if PluginName not in self.ProjectInfo.DisabledPlugins:
-                    self.ProjectInfo.DisabledPlugins.append(PluginName)
+    def __init__(self, Cache: Optional[PluginCache] = None, Workers: Optional[int] = None):
+        self.Reader: Optional[PluginReader] = None
+        self.Cache = Cache if Cache is not None else PluginCache()
+        self.Workers = Workers  # 解析线程数，None 使用默认值，1 为单线程
+        # 后台加载和后台搜索期间保护插件列表和索引
+        self.Lock = threading.RLock()
+        self.DataVersion = 0  # 插件增删时递增
+        self.ProjectInfo: Optional[ProjectInfo] = None
+        self.Document: Optional[ProjectDocument] = None  # 缓存的项目文件，修改插件状态时使用
+        # 按来源加载：已加载完成的来源（只整体替换，不原地修改，可无锁读取）、待加载的来源（按优先级排列）
+        self.LoadedSources: frozenset[PluginSource] = frozenset()
+        self.PendingSources: list[PluginSource] = []
+        # 后台加载尚未遍历的插件根目录 (目录, 基础来源)，每个根目录只遍历一次，文件按来源分发
+        self.PendingRoots: list[tuple[Path, PluginSource]] = []
+        # 由调用方在后台逐个来源加载，此时查询不在调用线程中补加载，跨来源结果为临时结果
+        self.BackgroundLoad = False
+        # 列式存储，Plugins 为各来源全部插件的视图，FilteredPlugins 为搜索过滤后的视图（行号数组）
+        self.Store = PluginStore()
+        self.Plugins: dict[PluginSource, PluginView] = {}
+        self.FilteredPlugins: dict[PluginSource, PluginView] = {}
+        self.ResetStore()
+        # 名称索引：插件名 -> {来源 -> 插件}
+        self.NameIndex: dict[str, dict[PluginSource, PluginInfo]] = {}
+        # 反向依赖索引：被依赖插件名 -> [(依赖它的插件名, 来源)]
+        self.DependentsIndex: dict[str, list[tuple[str, PluginSource]]] = {}
+        # 依赖图，节点为 (插件名, 来源)，插件增删后置空，按需重建
+        self.Graph: Optional[DependencyGraph] = None
+        # 预先小写化的搜索文本：id(插件) -> (名称, 作者, 分类, 描述, 依赖)
+        self.SearchTexts: dict[int, tuple[str, ...]] = {}
+        # 搜索倒排索引：字段 -> 三元组索引（被依赖字段随依赖关系变化，不建索引）
+        self.TextIndex: dict[int, TrigramIndex] = {Field: TrigramIndex() for Field in INDEXED_FIELDS}
+        # 被依赖搜索文本缓存：插件名 -> 小写化的被依赖插件名
+        self.DependentsTexts: dict[str, str] = {}
+        # 上一次搜索的字段和关键词，用于在追加输入时基于上次结果继续过滤
+        self.LastSearch: Optional[tuple[int, list[str]]] = None
+        # 当前生效的搜索条件（插件增删不清除），用于过滤后续加入的插件
+        self.ActiveSearch: Optional[tuple[int, list[str]]] = None
+        # 实际启用状态缓存：(插件名, 来源) -> 是否启用，插件增删或启用状态变化时置空
+        self.EnabledStates: Optional[dict[tuple[str, PluginSource], bool]] = None
+
+    @Traced("Manager")
+    def LoadProject(self, ProjectPath: Path, EnginePath: Optional[Path] = None,
+                    Sources: Optional[Iterable[PluginSource]] = None) -> bool:
+        """加载项目，EnginePath 为显式指定的引擎目录；Sources 为立即加载的来源（默认全部），
+        其余来源在首次查询到时加载"""
+        if not self.BeginLoad(ProjectPath, EnginePath):
+            return False
+        self.EnsureLoaded(Sources)
+        return True
 
+    def ResetStore(self):
+        """清空插件存储，重新生成各来源的视图"""
+        with self.Lock:
+            self.Store = PluginStore()
+            self.Plugins = {S: self.Store.GetView(S) for S in PluginSource}
+            self.FilteredPlugins = {S: self.Store.GetView(S).Copy() for S in PluginSource}
+
+    @Traced("Manager")
+    def BeginLoad(self, ProjectPath: Path, EnginePath: Optional[Path] = None, Background: bool = False) -> bool:
+        """读取项目信息并清空插件数据，插件随后按来源加载：Background 时由调用方在后台逐个来源扫描，
+        通过 AddPlugins 分批加入（渐进加载），否则在首次查询到该来源时同步加载"""
+        if self.Reader:
+            self.Reader.Cancel()
+        Reader = PluginReader(ProjectPath, self.Cache, Workers=self.Workers, EnginePath=EnginePath)
+        ProjectInfo = Reader.LoadProject()
+
+        with self.Lock:
+            self.Reader = Reader
+            self.ProjectInfo = ProjectInfo
+            self.Document = ProjectDocument(Reader.UProjectFile) if Reader.UProjectFile else None
+            # 项目无效时没有需要加载的来源
+            self.LoadedSources = frozenset() if ProjectInfo else frozenset(PluginSource)
+            self.PendingSources = list(LOAD_ORDER) if ProjectInfo else []
+            self.PendingRoots = Reader.GetRoots(set(PluginSource)) if ProjectInfo and Background else []
+            self.BackgroundLoad = Background
+            self.ResetStore()
+            self.BuildIndex()
+        return ProjectInfo is not None
+
+    def PrioritizeSource(self, Source: PluginSource):
+        """将来源移到待加载队列最前（切换到尚未加载的标签页时优先扫描）"""
+        with self.Lock:
+            if Source in self.PendingSources:
+                self.PendingSources.remove(Source)
+                self.PendingSources.insert(0, Source)
+
+    def TakePendingRoot(self, Reader: PluginReader) -> Optional[tuple[Path, PluginSource]]:
+        """取出优先级最高的待加载来源所在的下一个未遍历根目录（后台加载使用）；
+        没有待遍历的根目录、Reader 已被新的加载替换或已取消时返回 None"""
+        with self.Lock:
+            if Reader is not self.Reader or Reader.CancelRequested:
+                return None
+            for Source in self.PendingSources:
+                for Root in self.PendingRoots:
+                    if Source in GetRootSources(Root[1]):
+                        self.PendingRoots.remove(Root)
+                        return Root
+            return None
+
+    def TakeFinishedSources(self, Reader: PluginReader) -> list[PluginSource]:
+        """取出所在根目录已全部遍历的待加载来源（后台加载使用，由调用方在该来源的插件全部加入后调用 FinishSource）"""
+        with self.Lock:
+            if Reader is not self.Reader:
+                return []
+            Remaining = {S for _, RootSource in self.PendingRoots for S in GetRootSources(RootSource)}
+            Finished = [S for S in self.PendingSources if S not in Remaining]
+            for Source in Finished:
+                self.PendingSources.remove(Source)
+            return Finished
+
+    def FinishSource(self, Source: PluginSource):
+        """标记来源已加载完成（该来源的插件已全部通过 AddPlugins 加入）"""
+        with self.Lock:
+            self.LoadedSources = self.LoadedSources | {Source}
+
+    def IsSourceLoaded(self, Source: PluginSource) -> bool:
+        """来源是否已加载完成"""
+        return Source in self.LoadedSources
+
+    def IsComplete(self) -> bool:
+        """全部来源是否已加载完成（未完成时跨来源依赖、冲突和统计为临时结果）"""
+        return len(self.LoadedSources) == len(PluginSource)
+
+    def GetUnloadedSources(self) -> list[PluginSource]:
+        """尚未加载完成的来源（按默认加载顺序）"""
+        return [S for S in LOAD_ORDER if S not in self.LoadedSources]
+
+    def EnsureLoaded(self, Sources: Optional[Iterable[PluginSource]] = None) -> bool:
+        """同步加载尚未加载的来源（默认全部），返回这些来源是否都已加载；
+        后台加载期间不在调用线程中加载，调用方应将结果视为临时结果"""
+        if len(self.LoadedSources) == len(PluginSource):
             return True
-        except Exception as E:
-            print(f"更新项目文件失败: {E}")
-            return False
+        Wanted = set(Sources) if Sources is not None else set(PluginSource)
+        # 后台加载期间只读取已加载来源，不等待正在加入插件的加载线程（列表绘制时频繁调用）
+        if Wanted <= self.LoadedSources or self.BackgroundLoad:
+            return Wanted <= self.LoadedSources
+        with self.Lock:
+            if not self.BackgroundLoad:
+                self.LoadSources([S for S in self.PendingSources if S in Wanted])
+            return Wanted <= self.LoadedSources
+
+    @Traced("Manager")
+    def LoadSources(self, Sources: list[PluginSource]):
+        """在当前线程扫描并加入指定来源的插件（一次遍历，解析缓存只读取一次）"""
+        if not Sources:
+            return
+        with self.Lock:
+            for Source in Sources:
+                self.PendingSources.remove(Source)
+            for Batch in self.Reader.IterPluginBatches(Sources):
+                self.AddPlugins(Batch)
+            self.LoadedSources = self.LoadedSources | set(Sources)
+
+    @Traced("Manager")
+    def AddPlugins(self, Plugins: list[PluginInfo]):
+        """合并一批新加载的插件，并按当前搜索条件加入过滤结果"""
+        with self.Lock:
+            # 后台加载期间移动到尚未加载来源的插件会再次被扫描到，跳过已存在的
+            Plugins = [
+                Plugin for Plugin in Plugins
+                if getattr(self.NameIndex.get(Plugin.Name, {}).get(Plugin.Source), "Path", None) != Plugin.Path
+            ]
+            LastSearch = self.LastSearch
+            Rows = []
+            for Plugin in Plugins:
+                Rows.append(self.Store.Add(Plugin))
+                self.AddToIndex(Plugin, Plugin.Source)
+            # 新插件已按条件过滤，增量搜索状态仍然有效
+            self.LastSearch = LastSearch
+
+            Active = self.ActiveSearch
+            if Active and Active[0] == 5:
+                # 被依赖文本随新插件变化，重新过滤全部插件
+                self.ReapplySearch()
+            else:
+                for Plugin, Row in zip(Plugins, Rows):
+                    if not Active or self.MatchSearch(Plugin, *Active):
+                        self.FilteredPlugins[Plugin.Source].Append(Row)
+
+    @Traced("Manager")
+    def ReapplySearch(self):
+        """按当前搜索条件重新过滤全部插件"""
+        with self.Lock:
+            Records = self.Store.Records
+            for Source in PluginSource:
+                if self.ActiveSearch:
+                    self.FilteredPlugins[Source] = PluginView(Records, array("I", (
+                        Row for Row in self.Plugins[Source].Rows
+                        if self.MatchSearch(Records[Row], *self.ActiveSearch)
+                    )))
+                else:
+                    self.FilteredPlugins[Source] = self.Plugins[Source].Copy()
+
+    @Traced("Manager")
+    def BuildIndex(self):
+        """构建名称索引和反向依赖索引（同一来源存在同名插件时名称索引保留第一个）"""
+        with self.Lock:
+            self.NameIndex = {}
+            self.DependentsIndex = {}
+            self.SearchTexts = {}
+            for Index in self.TextIndex.values():
+                Index.Clear()
+            self.InvalidateSearch()
+            for Source in PluginSource:
+                for Plugin in self.Plugins[Source]:
+                    self.NameIndex.setdefault(Plugin.Name, {}).setdefault(Source, Plugin)
+                    self.AddSearchTexts(Plugin)
+                    Plugin.ReleaseDetails()
+                    for DepName in dict.fromkeys(Plugin.Plugins):
+                        self.DependentsIndex.setdefault(DepName, []).append((Plugin.Name, Source))
+
+    def AddToIndex(self, Plugin: PluginInfo, Source: PluginSource):
+        """将插件加入索引"""
+        with self.Lock:
+            self.InvalidateSearch()
+            self.NameIndex.setdefault(Plugin.Name, {}).setdefault(Source, Plugin)
+            self.AddSearchTexts(Plugin)
+            # 描述已小写化保存在搜索文本中，详情字段释放后由详情面板按需读取
+            Plugin.ReleaseDetails()
+            for DepName in dict.fromkeys(Plugin.Plugins):
+                # 按来源顺序插入到同来源条目之后，保持与全量构建一致的顺序
+                insort(self.DependentsIndex.setdefault(DepName, []), (Plugin.Name, Source),
+                       key=lambda Item: SOURCE_RANK[Item[1]])
+
+    def RemoveFromIndex(self, Plugin: PluginInfo, Source: PluginSource):
+        """从索引移除指定来源的插件"""
+        with self.Lock:
+            self.InvalidateSearch()
+            self.RemoveSearchTexts(Plugin)
+            Entry = self.NameIndex.get(Plugin.Name)
+            if Entry:
+                Entry.pop(Source, None)
+                if not Entry:
+                    del self.NameIndex[Plugin.Name]
+
+            Key = (Plugin.Name, Source)
+            for DepName in dict.fromkeys(Plugin.Plugins):
+                Dependents = self.DependentsIndex.get(DepName)
+                if not Dependents:
+                    continue
+                Dependents[:] = [Item for Item in Dependents if Item != Key]
+                if not Dependents:
+                    del self.DependentsIndex[DepName]
+
+    def Refresh(self, Sources: Optional[list[PluginSource]] = None) -> Optional[RefreshResult]:
+        """增量刷新：只重新解析新增或修改的插件文件，已有插件对象保持不变（尚未加载的来源不刷新）；
+        .uproject 的外部修改按差异更新启用状态。引擎关联变化时返回 None，需完整重新加载"""
+        Scan = self.ScanRefresh(Sources)
+        if Scan is None:
+            return None
+        return self.ApplyRefresh(Scan)
+
+    @Traced("Manager")
+    def ScanRefresh(self, Sources: Optional[list[PluginSource]] = None) -> Optional[RefreshScan]:
+        """增量刷新的耗时部分：遍历插件目录对比文件状态并重新解析变化的文件，不持锁（界面在后台线程调用）；
+        项目文件无法读取时返回空扫描结果，引擎关联变化时返回 None"""
+        Reader = self.Reader
+        if not Reader or not self.ProjectInfo or not Reader.UProjectFile:
+            return None
+
+        Project = Reader.ReadProjectFile(Reader.UProjectFile)
+        if Project is None:
+            return RefreshScan(Reader, self.ProjectInfo.PluginStates, set(), {}, {})
+        if Project["EngineAssociation"] != self.ProjectInfo.EngineVersion:
+            return None
+
+        Sources = (set(Sources) if Sources is not None else set(PluginSource)) & self.LoadedSources
+        with self.Lock:
+            Known = {
+                Plugin.Path / f"{Plugin.Name}.uplugin": Plugin
+                for Source in Sources for Plugin in self.Plugins[Source]
+            }
+        Scan = RefreshScan(Reader, Project["PluginStates"], Sources, Reader.ScanFileStats(Sources), Known)
+
+        # 新增的文件和状态变化的文件需要重新解析（插件由本工具移动或重命名时没有旧状态，合并时只记录新状态）
+        Changed: dict[PluginSource, list[Path]] = {}
+        for UPluginFile, St in Scan.Stats.items():
+            if UPluginFile in Known:
+                OldSt = Reader.FileStats.get(UPluginFile)
+                if OldSt is None or OldSt == St:
+                    continue
+            Changed.setdefault(Reader.GetRootSource(UPluginFile), []).append(UPluginFile)
+
+        for Source, Files in Changed.items():
+            for Parsed in Reader.ParsePluginFiles(Files, Source, Scan.Errors):
+                Scan.Parsed[Parsed.Path / f"{Parsed.Name}.uplugin"] = Parsed
+        if self.Cache and Changed:
+            self.Cache.Save()
+            self.Cache.Unload()
+        return Scan
+
+    @Traced("Manager")
+    def ApplyRefresh(self, Scan: RefreshScan) -> RefreshResult:
+        """将扫描结果合并到插件数据（持锁，只做内存中的增删改）"""
+        Result = RefreshResult()
+        with self.Lock:
+            if Scan.Reader is not self.Reader:
+                # 扫描期间项目已重新加载
+                return Result
+            Result.StatusChanged = self.ApplyProjectPlugins(Scan.PluginStates)
+
+            FileStats = self.Reader.FileStats
+            for UPluginFile, Plugin in Scan.Known.items():
+                if self.Store.GetRow(Plugin) is None:
+                    # 扫描期间已被移除
+                    continue
+                if UPluginFile not in Scan.Stats:
+                    # 移除已不存在的插件
+                    self.RemovePlugin(Plugin)
+                    FileStats.pop(UPluginFile, None)
+                    Result.Removed.append(Plugin)
+                elif UPluginFile not in FileStats:
+                    FileStats[UPluginFile] = Scan.Stats[UPluginFile]
+
+            for UPluginFile, Parsed in Scan.Parsed.items():
+                self.Reader.ApplyEnabledStatus([Parsed])
+                Plugin = Scan.Known.get(UPluginFile)
+                if Plugin is None or self.Store.GetRow(Plugin) is None:
+                    Result.Added.append(Parsed)
+                    continue
+                # 原地更新字段，保持对象不变（界面选中项依赖对象和名称）
+                self.RemoveFromIndex(Plugin, Plugin.Source)
+                Plugin.CopyFrom(Parsed)
+                self.Store.Update(Plugin)
+                self.AddToIndex(Plugin, Plugin.Source)
+                Result.Modified.append(Plugin)
+
+            # 替换刷新来源中的解析错误：重新解析过或已删除的文件以本次结果为准，解析失败的文件下次刷新时重试
+            Result.Errors = Scan.Errors
+            Rescanned = {UPluginFile for UPluginFile, _ in Scan.Errors} | Scan.Parsed.keys()
+            self.Reader.Errors[:] = [
+                (UPluginFile, Error) for UPluginFile, Error in self.Reader.Errors
+                if UPluginFile not in Rescanned and not (
+                    UPluginFile not in Scan.Stats and self.GetFileSource(UPluginFile) in Scan.Sources
+                )
+            ] + Scan.Errors
+
+            if Result.Added:
+                self.AddPlugins(Result.Added)
+            if Result.Removed or Result.Modified:
+                self.ReapplySearch()
+        return Result
 
-    def ResetPluginToDefault(self, PluginName: str, Source: PluginSource) -> bool:
-        """恢复插件到默认状态（从项目文件中移除配置）"""
-        if not self.ProjectInfo:
-            return False
+    def GetFileSource(self, UPluginFile: Path) -> PluginSource:
+        """获取插件文件所属的来源"""
+        return GetPluginSource(UPluginFile, self.Reader.GetRootSource(UPluginFile))
+
+    def ApplyProjectPlugins(self, NewStates: dict[str, bool]) -> list[str]:
+        """按差异应用 .uproject 中的插件启用状态，返回状态变化的插件名"""
+        OldStates = self.ProjectInfo.PluginStates
+        Changed = sorted(Name for Name in OldStates.keys() | NewStates.keys() if OldStates.get(Name) != NewStates.get(Name))
+        self.SetPluginStates({Name: NewStates.get(Name) for Name in Changed})
+        return Changed
+
+    def SetPluginStates(self, States: dict[str, Optional[bool]]):
+        """更新内存中插件的显式启用状态（None 表示未配置），并清除实际启用状态缓存"""
+        with self.Lock:
+            for PluginName, Enabled in States.items():
+                if Enabled is None:
+                    self.ProjectInfo.PluginStates.pop(PluginName, None)
+                else:
+                    self.ProjectInfo.PluginStates[PluginName] = Enabled
+                for Plugin in self.NameIndex.get(PluginName, {}).values():
+                    Plugin.EnabledInProject = Enabled
+                    self.Store.UpdateState(Plugin)
+            self.EnabledStates = None
+
+    def GetEnabledStates(self) -> dict[tuple[str, PluginSource], bool]:
+        """获取已加载插件的实际启用状态：(插件名, 来源) -> 是否启用（按需构建，插件或状态变化后重建；
+        构建完成后整体替换，已构建时无锁读取）"""
+        States = self.EnabledStates
+        if States is not None:
+            return States
+        with self.Lock:
+            if self.EnabledStates is None:
+                States = {}
+                for Source in PluginSource:
+                    for Plugin in self.Plugins[Source]:
+                        States.setdefault((Plugin.Name, Source), Plugin.IsEnabled())
+                self.EnabledStates = States
+            return self.EnabledStates
+
+    def RemovePlugin(self, Plugin: PluginInfo):
+        """从内存中移除插件对象"""
+        with self.Lock:
+            Source = Plugin.Source
+            self.RemoveFromIndex(Plugin, Source)
+            Row = self.Store.Remove(Plugin)
+            if Row is not None:
+                self.FilteredPlugins[Source].Discard(Row)
+
+    def GetLoadErrors(self) -> list[tuple[Path, str]]:
+        """获取最近一次加载中解析失败的插件文件"""
+        return self.Reader.Errors if self.Reader else []
+
+    def GetPlugins(self, Source: PluginSource) -> PluginView:
+        """获取指定来源的插件列表（搜索过滤后的视图），来源尚未加载时先加载"""
+        self.EnsureLoaded((Source,))
+        return self.FilteredPlugins[Source]
 
-        UProjectFiles = list(self.ProjectInfo.Path.glob("*.uproject"))
-        if not UProjectFiles:
-            return False
-        UProjectFile = UProjectFiles[0]
+    def InvalidateSearch(self):
+        """插件增删后清除依赖图、启用状态缓存和增量搜索状态"""
+        self.DataVersion += 1
+        self.Graph = None
+        self.EnabledStates = None
+        self.DependentsTexts = {}
+        self.LastSearch = None
+
+    def BuildSearchTexts(self, Plugin: PluginInfo) -> tuple[str, ...]:
+        """生成插件的小写化搜索文本（被依赖字段单独缓存）"""
+        return (
+            Plugin.Name.lower(),
+            Plugin.CreatedBy.lower(),
+            Plugin.Category.lower(),
+            Plugin.Description.lower(),
+            " ".join(Plugin.Plugins).lower()
+        )
+
+    def AddSearchTexts(self, Plugin: PluginInfo):
+        """生成插件搜索文本并加入倒排索引"""
+        Key = id(Plugin)
+        if Key in self.SearchTexts:
+            return
+        Texts = self.BuildSearchTexts(Plugin)
+        self.SearchTexts[Key] = Texts
+        for Field in INDEXED_FIELDS:
+            self.TextIndex[Field].Add(Key, Texts[Field])
+
+    def RemoveSearchTexts(self, Plugin: PluginInfo):
+        """移除插件搜索文本及其倒排索引"""
+        Key = id(Plugin)
+        Texts = self.SearchTexts.pop(Key, None)
+        if Texts is None:
+            return
+        for Field in INDEXED_FIELDS:
+            self.TextIndex[Field].Remove(Key, Texts[Field])
+
+    def GetSearchText(self, Plugin: PluginInfo, Field: int, NewTexts: Optional[dict] = None) -> str:
+        """获取插件指定字段的小写化搜索文本；不持锁搜索时传入 NewTexts，新生成的被依赖文本写入其中
+        而不是缓存，由调用方在数据未变化时合并"""
+        if Field == 5:
+            Text = self.DependentsTexts.get(Plugin.Name)
+            if Text is None and NewTexts is not None:
+                Text = NewTexts.get(Plugin.Name)
+            if Text is None:
+                Text = " ".join(Name for Name, _ in self.DependentsIndex.get(Plugin.Name, ())).lower()
+                (self.DependentsTexts if NewTexts is None else NewTexts)[Plugin.Name] = Text
+            return Text
+
+        Texts = self.SearchTexts.get(id(Plugin))
+        if Texts is None:
+            Texts = self.BuildSearchTexts(Plugin)
+            if NewTexts is None:
+                self.SearchTexts[id(Plugin)] = Texts
+        return Texts[Field]
 
-        try:
-            with open(UProjectFile, "r", encoding="utf-8") as F:
-                Data = json.load(F)
+    def Search(self, Keyword: str, Field: int = 0):
+        """搜索插件，Field: 0名称 1作者 2分类 3描述 4依赖 5被依赖，支持空格分隔多关键词"""
+        while True:
+            Result = self.QuerySearch(Keyword, Field, self.GetSearchState())
+            with self.Lock:
+                # 搜索期间有插件增删（后台加载）时结果已过期，重新搜索
+                if Result.DataVersion == self.DataVersion:
+                    self.ApplySearch(Result)
+                    return
+
+    def GetSearchState(self) -> tuple:
+        """获取当前搜索状态快照（上次搜索条件和结果），供后台查询使用"""
+        with self.Lock:
+            return self.LastSearch, dict(self.FilteredPlugins)
+
+    def MatchSearch(self, Plugin: PluginInfo, Field: int, Keywords: list[str],
+                    NewTexts: Optional[dict] = None) -> bool:
+        """检查插件是否匹配全部关键词"""
+        return all(K in self.GetSearchText(Plugin, Field, NewTexts) for K in Keywords)
+
+    def QuerySearch(self, Keyword: str, Field: int, State: Optional[tuple] = None,
+                    IsCancelled: Optional[Callable[[], bool]] = None) -> Optional[SearchResult]:
+        """执行搜索但不修改当前结果，可在后台线程调用，被取消时返回 None"""
+        with TraceSpan("Search", "Manager", Keyword=Keyword, Field=Field) as QuerySpan:
+            Result = self.RunQuery(Keyword, Field, State, IsCancelled)
+            QuerySpan.SetArgs(Matches=sum(Result.GetCounts().values()) if Result else None)
+            return Result
+
+    def RunQuery(self, Keyword: str, Field: int, State: Optional[tuple],
+                 IsCancelled: Optional[Callable[[], bool]]) -> Optional[SearchResult]:
+        """执行搜索：持锁取得各来源候选行的快照，逐个匹配在锁外进行，避免阻塞界面绘制；
+        期间插件增删时结果的 DataVersion 与当前版本不一致，由调用方丢弃"""
+        with self.Lock:
+            Version = self.DataVersion
+            Records = self.Store.Records
+            if not Keyword or not Keyword.strip():
+                return SearchResult(Field, [], {S: self.Plugins[S].Copy() for S in PluginSource}, Version)
+
+            Keywords = [K.lower() for K in Keyword.split() if K]
+            if Field < 0 or Field > 5:
+                return SearchResult(Field, [], {S: PluginView(Records) for S in PluginSource}, Version)
+
+            # 新关键词是上次关键词的细化（每个旧关键词都包含在某个新关键词中）时，
+            # 结果必然是上次结果的子集，只需过滤上次结果
+            LastSearch, LastPlugins = State if State else (None, None)
+            Refines = False
+            if LastSearch and LastSearch[0] == Field:
+                Refines = all(any(Old in New for New in Keywords) for Old in LastSearch[1])
+
+            # 倒排索引求交集得到候选（转换为行掩码与来源掩码相与），候选再做子串校验
+            HitMask = None
+            if Field in self.TextIndex:
+                IndexHits = self.TextIndex[Field].GetCandidates(Keywords)
+                if IndexHits is not None:
+                    RowIndex = self.Store.RowIndex
+                    HitMask = self.Store.GetRowsMask(RowIndex[Key] for Key in IndexHits if Key in RowIndex)
+
+            CandidateRows = {}
+            for Source in PluginSource:
+                Candidates = LastPlugins[Source].Rows if Refines else self.Plugins[Source].Rows
+                if HitMask is not None:
+                    SourceMask = self.Store.GetRowsMask(Candidates) if Refines else self.Store.GetSourceMask(Source)
+                    CandidateRows[Source] = MaskRows(AndMasks(HitMask, SourceMask))
+                else:
+                    CandidateRows[Source] = Candidates[:]
+
+        Result = {}
+        NewTexts = {}
+        for Source in PluginSource:
+            if IsCancelled and IsCancelled():
+                return None
+            # 上次结果中可能有已移除的行
+            Result[Source] = PluginView(Records, array("I", (
+                Row for Row in CandidateRows[Source]
+                if Records[Row] is not None and self.MatchSearch(Records[Row], Field, Keywords, NewTexts)
+            )))
+        if NewTexts:
+            with self.Lock:
+                if self.DataVersion == Version:
+                    self.DependentsTexts.update(NewTexts)
+        return SearchResult(Field, Keywords, Result, Version)
+
+    def ApplySearch(self, Result: Optional[SearchResult]):
+        """应用搜索结果"""
+        if Result is None:
+            return
+        with self.Lock:
+            self.FilteredPlugins = Result.Plugins
+            self.LastSearch = (Result.Field, Result.Keywords) if Result.Keywords else None
+            self.ActiveSearch = self.LastSearch
+
+    def GetCategories(self, Source: PluginSource) -> list[str]:
+        """获取指定来源的所有分类"""
+        self.EnsureLoaded((Source,))
+        with self.Lock:
+            return self.Store.GetCategories(Source)
 
-            Plugins = Data.get("Plugins", [])
+    def SetPluginEnabled(self, PluginName: str, Source: PluginSource, Enabled: bool) -> bool:
+        """设置插件启用状态"""
+        Changes = ProjectChanges()
+        Changes.SetEnabled(PluginName, Enabled)
+        return self.ApplyChanges(Changes)[0]
 
-            # 移除插件配置
-            Data["Plugins"] = [P for P in Plugins if P.get("Name") != PluginName]
+    def ResetPluginToDefault(self, PluginName: str, Source: PluginSource) -> bool:
+        """恢复插件到默认状态（从项目文件中移除配置）"""
+        Changes = ProjectChanges()
+        Changes.Reset(PluginName)
+        return self.ApplyChanges(Changes)[0]
+
+    @Traced("Manager")
+    def ApplyChanges(self, Changes: ProjectChanges) -> tuple[bool, str]:
+        """提交批量修改：项目文件只读写一次，写入成功后再更新内存，返回 (成功, 错误信息)"""
+        if not Changes.States:
+            return True, ""
+        Success, Error = self.UpdateProjectFile(Changes.States)
+        if not Success:
+            return False, Error
 
-            with open(UProjectFile, "w", encoding="utf-8") as F:
-                json.dump(Data, F, indent="\t", ensure_ascii=False)
+        self.SetPluginStates(Changes.States)
+        return True, ""
 
-            # 更新内存中的状态
-            if PluginName in self.ProjectInfo.EnabledPlugins:
-                self.ProjectInfo.EnabledPlugins.remove(PluginName)
-            if PluginName in self.ProjectInfo.DisabledPlugins:
-                self.ProjectInfo.DisabledPlugins.remove(PluginName)
+    def UpdateProjectFile(self, States: dict[str, Optional[bool]]) -> tuple[bool, str]:
+        """更新项目文件中的插件状态（None 表示移除配置），只改动相关条目，返回 (成功, 错误信息)
 
-            for Plugin in self.Plugins[Source]:
-                if Plugin.Name == PluginName:
-                    Plugin.EnabledInProject = None
-                    break
+        文件在上次读取后被外部修改（编辑器保存、版本控制同步）时，基于新内容合并本次修改；
+        本次修改的插件在外部也被改成其他状态时视为冲突，不写入。
+        """
+        if not self.ProjectInfo or not self.Document:
+            return False, "未加载项目"
 
-            return True
+        Document = self.Document
+        try:
+            with TraceSpan("LoadProjectFile", "Manager"):
+                Reloaded = Document.Load()
+            if Reloaded:
+                Conflicts = self.GetWriteConflicts(Document.GetPluginStates(), States)
+                if Conflicts:
+                    Names = "\n".join(f"  - {Name}" for Name in Conflicts)
+                    return False, f"项目文件已被外部修改，以下插件的状态与当前显示不一致：\n{Names}\n\n请重新加载后再修改"
+
+            NewText = UpdatePluginStates(Document.Text, States)
+            # 内容没有变化时不写入
+            if NewText != Document.Text:
+                if Document.IsModified():
+                    return False, "项目文件正在被其他程序修改，请稍后重试"
+                with TraceSpan("WriteProjectFile", "Manager", Path=str(Document.Path), Changes=len(States)):
+                    Document.Write(NewText)
+        except PermissionError:
+            return False, "拒绝访问，请确保 UE 编辑器已关闭且项目文件可写。"
         except Exception as E:
-            print(f"恢复默认状态失败: {E}")
-            return False
+            print(f"更新项目文件失败: {Document.Path} - {E}")
+            return False, str(E)
+        return True, ""
+
+    def GetWriteConflicts(self, DiskStates: dict[str, bool], States: dict[str, Optional[bool]]) -> list[str]:
+        """获取外部修改与本次修改冲突的插件：文件中的状态既不是内存中的状态，也不是要写入的状态"""
+        Conflicts = []
+        for PluginName, Enabled in States.items():
+            Disk = DiskStates.get(PluginName)
+            if Disk != self.ProjectInfo.PluginStates.get(PluginName) and Disk != Enabled:
+                Conflicts.append(PluginName)
+        return Conflicts
 
     def GetDependencies(self, PluginName: str, Source: PluginSource) -> list[str]:
         """获取插件依赖"""
-        for Plugin in self.Plugins[Source]:
-            if Plugin.Name == PluginName:
-                return Plugin.Plugins
-        return []
+        with self.Lock:
+            Row = self.Store.GetRow(self.GetPluginByName(PluginName, Source))
+            return self.Store.GetDependencies(Row) if Row is not None else []
 
     def GetDependents(self, PluginName: str, Source: PluginSource) -> list[str]:
         """获取依赖此插件的其他插件（在同一来源中）"""
-        Dependents = []
-        for Plugin in self.Plugins[Source]:
-            if PluginName in Plugin.Plugins:
-                Dependents.append(Plugin.Name)
-        return Dependents
+        self.EnsureLoaded((Source,))
+        return [Name for Name, S in self.DependentsIndex.get(PluginName, ()) if S == Source]
 
     def GetAllDependents(self, PluginName: str) -> list[tuple[str, PluginSource]]:
         """获取所有来源中依赖此插件的插件列表"""
-        Dependents = []
-        for Source in PluginSource:
-            for Plugin in self.Plugins[Source]:
-                if PluginName in Plugin.Plugins:
-                    Dependents.append((Plugin.Name, Source))
-        return Dependents
+        self.EnsureLoaded()
+        return list(self.DependentsIndex.get(PluginName, ()))
 
     def GetAllDependencies(self, PluginName: str, Source: PluginSource) -> list[tuple[str, PluginSource]]:
         """获取插件的所有依赖（跨来源查找）"""
@@ -236,58 +749,97 @@ class PluginManager:
 
     def IsPluginEnabled(self, PluginName: str, Source: PluginSource) -> bool:
         """检查插件是否启用"""
-        Plugin = self.GetPluginByName(PluginName, Source)
-        if not Plugin:
-            return False
-        if Plugin.EnabledInProject is True:
-            return True
-        if Plugin.EnabledInProject is False:
-            return False
-        return Plugin.EnabledByDefault
-
-    def GetDisabledDependents(self, PluginName: str) -> list[tuple[str, PluginSource]]:
-        """获取所有依赖此插件且当前启用的插件（禁用时需连带禁用）"""
+        self.EnsureLoaded((Source,))
+        return self.GetEnabledStates().get((PluginName, Source), False)
+
+    @Traced("Manager")
+    def GetGraph(self) -> DependencyGraph:
+        """获取依赖图（按需构建，需要全部来源）"""
+        self.EnsureLoaded()
+        if self.Graph is None:
+            Graph = DependencyGraph()
+            for Source in PluginSource:
+                for Plugin in self.Plugins[Source]:
+                    Graph.SetDependencies((Plugin.Name, Source), self.GetAllDependencies(Plugin.Name, Source))
+            # 反向边由正向边反转得到，只包含实际解析到该节点的依赖者（同名插件各自独立）
+            Dependents: dict[tuple[str, PluginSource], list] = {Node: [] for Node in Graph.Forward}
+            for Node, Dependencies in Graph.Forward.items():
+                for Dependency in Dependencies:
+                    Dependents.setdefault(Dependency, []).append(Node)
+            for Node, NodeDependents in Dependents.items():
+                Graph.SetDependents(Node, NodeDependents)
+            self.Graph = Graph
+        return self.Graph
+
+    def GetDependencyClosure(self, PluginName: str, Source: PluginSource) -> list[tuple[str, PluginSource]]:
+        """获取插件的全部传递依赖，依赖在前"""
+        return self.GetGraph().GetDependencyClosure((PluginName, Source))
+
+    def GetDependentClosure(self, PluginName: str, Source: Optional[PluginSource] = None) -> list[tuple[str, PluginSource]]:
+        """获取传递依赖此插件的全部插件，依赖者在前"""
+        if Source is None:
+            self.EnsureLoaded()
+            Entry = self.NameIndex.get(PluginName)
+            if not Entry:
+                # 插件不存在时仍返回直接依赖者
+                return self.GetAllDependents(PluginName)
+            Source = next(iter(Entry))
+        return self.GetGraph().GetDependentClosure((PluginName, Source))
+
+    def FindDependencyCycles(self) -> list[list[tuple[str, PluginSource]]]:
+        """获取所有循环依赖"""
+        return self.GetGraph().FindCycles()
+
+    def GetImpactSet(self, PluginName: str, Source: PluginSource) -> list[tuple[str, PluginSource]]:
+        """获取删除或移动插件时受影响的插件（全部传递依赖者）"""
+        return self.GetDependentClosure(PluginName, Source)
+
+    def GetDisabledDependents(self, PluginName: str, Source: Optional[PluginSource] = None) -> list[tuple[str, PluginSource]]:
+        """获取所有传递依赖此插件且当前启用的插件（禁用时需连带禁用）"""
         Result = []
-        for Name, Source in self.GetAllDependents(PluginName):
-            if self.IsPluginEnabled(Name, Source):
-                Result.append((Name, Source))
+        for Name, S in self.GetDependentClosure(PluginName, Source):
+            if self.IsPluginEnabled(Name, S):
+                Result.append((Name, S))
         return Result
 
     def GetDisabledDependencies(self, PluginName: str, Source: PluginSource) -> list[tuple[str, PluginSource]]:
-        """获取插件依赖中当前未启用的插件（启用时需连带启用）"""
+        """获取插件传递依赖中当前未启用的插件（启用时需连带启用），依赖在前"""
         Result = []
-        for DepName, DepSource in self.GetAllDependencies(PluginName, Source):
+        for DepName, DepSource in self.GetDependencyClosure(PluginName, Source):
             if not self.IsPluginEnabled(DepName, DepSource):
                 Result.append((DepName, DepSource))
         return Result
 
+    def GetStatusText(self, Plugin: PluginInfo) -> str:
+        """获取插件状态文本：冲突 / 启用 / 禁用 / 默认(启用或禁用)"""
+        if self.HasConflict(Plugin.Name):
+            return "冲突"
+        if Plugin.EnabledInProject is True:
+            return "启用"
+        if Plugin.EnabledInProject is False:
+            return "禁用"
+        return "默认" + ("(启用)" if self.IsPluginEnabled(Plugin.Name, Plugin.Source) else "(禁用)")
+
     def GetPluginByName(self, Name: str, Source: PluginSource) -> Optional[PluginInfo]:
         """根据名称和来源获取插件"""
-        for Plugin in self.Plugins[Source]:
-            if Plugin.Name == Name:
-                return Plugin
-        return None
+        self.EnsureLoaded((Source,))
+        return self.NameIndex.get(Name, {}).get(Source)
 
     def GetConflictingPlugin(self, Name: str, Source: PluginSource) -> Optional[tuple[PluginInfo, PluginSource]]:
         """获取同名冲突插件（返回另一个来源的同名插件）"""
+        self.EnsureLoaded()
+        Entry = self.NameIndex.get(Name, {})
         for S in PluginSource:
-            if S == Source:
-                continue
-            for Plugin in self.Plugins[S]:
-                if Plugin.Name == Name:
-                    return (Plugin, S)
+            if S != Source and S in Entry:
+                return (Entry[S], S)
         return None
 
     def HasConflict(self, Name: str) -> bool:
         """检查插件是否存在同名冲突"""
-        FoundSources = []
-        for S in PluginSource:
-            for Plugin in self.Plugins[S]:
-                if Plugin.Name == Name:
-                    FoundSources.append(S)
-                    break
-        return len(FoundSources) > 1
+        self.EnsureLoaded()
+        return len(self.NameIndex.get(Name, {})) > 1
 
+    @Traced("Manager")
     def RenamePluginFolder(self, Name: str, Source: PluginSource) -> tuple[bool, str]:
         """重命名插件文件夹为插件同名，返回 (成功, 错误信息)"""
         Plugin = self.GetPluginByName(Name, Source)
@@ -308,6 +860,7 @@ class PluginManager:
         try:
             RemoveReadOnly(OldPath)
             OldPath.rename(NewPath)
+            # 索引保存的是插件对象，名称不变，无需更新索引
             Plugin.Path = NewPath
             return True, ""
         except PermissionError:
@@ -315,6 +868,7 @@ class PluginManager:
         except Exception as E:
             return False, str(E)
 
+    @Traced("Manager")
     def DeletePlugin(self, Name: str, Source: PluginSource) -> tuple[bool, str]:
         """删除插件（移动到回收站），返回 (成功, 错误信息)"""
         import shutil
@@ -333,8 +887,9 @@ class PluginManager:
                 shutil.rmtree(Plugin.Path)
 
             # 从内存中移除
-            self.Plugins[Source] = [P for P in self.Plugins[Source] if P.Name != Name]
-            self.FilteredPlugins[Source] = [P for P in self.FilteredPlugins[Source] if P.Name != Name]
+            for P in list(self.Plugins[Source]):
+                if P.Name == Name:
+                    self.RemovePlugin(P)
 
             # 从项目文件移除配置
             self.ResetPluginToDefault(Name, Source)
@@ -345,12 +900,15 @@ class PluginManager:
         except Exception as E:
             return False, str(E)
 
+    @Traced("Manager")
     def MovePlugin(self, Name: str, FromSource: PluginSource, ToSource: PluginSource) -> tuple[bool, str]:
         """移动插件到另一个来源目录，返回 (成功, 错误信息)"""
         import shutil
         Plugin = self.GetPluginByName(Name, FromSource)
         if not Plugin:
             return False, "插件不存在"
+        # 目标来源在移动后才加载会再次扫描到该插件
+        self.EnsureLoaded((ToSource,))
 
         # 确定目标目录
         if ToSource == PluginSource.Project:
@@ -374,14 +932,18 @@ class PluginManager:
             RemoveReadOnly(Plugin.Path)
             shutil.move(str(Plugin.Path), str(NewPath))
 
-            # 更新内存中的数据
-            self.Plugins[FromSource] = [P for P in self.Plugins[FromSource] if P.Name != Name]
-            self.FilteredPlugins[FromSource] = [P for P in self.FilteredPlugins[FromSource] if P.Name != Name]
+            # 更新内存中的数据（后台加载线程可能同时加入插件）
+            with self.Lock:
+                for P in list(self.Plugins[FromSource]):
+                    if P.Name == Name:
+                        self.RemovePlugin(P)
 
-            Plugin.Path = NewPath
-            Plugin.Source = ToSource
-            self.Plugins[ToSource].append(Plugin)
-            self.FilteredPlugins[ToSource].append(Plugin)
+                Plugin.Path = NewPath
+                Plugin.Source = ToSource
+                Row = self.Store.Add(Plugin)
+                self.AddToIndex(Plugin, ToSource)
+                if not self.ActiveSearch or self.MatchSearch(Plugin, *self.ActiveSearch):
+                    self.FilteredPlugins[ToSource].Append(Row)
 
             return True, ""
         except PermissionError:
@@ -402,19 +964,18 @@ class PluginManager:
             return False, str(E)
 
     def GetStats(self) -> dict:
-        """获取统计信息"""
-        Total = sum(len(self.Plugins[S]) for S in PluginSource)
-        EnabledCount = 0
-        for Source in PluginSource:
-            for P in self.Plugins[Source]:
-                if P.EnabledInProject is True or (P.EnabledInProject is None and P.EnabledByDefault):
-                    EnabledCount += 1
+        """获取统计信息（需要全部来源）"""
+        self.EnsureLoaded()
+        with self.Lock:
+            Counts = {S: len(self.Plugins[S]) for S in PluginSource}
+            EnabledCount = self.Store.CountEnabled()
 
+        Total = sum(Counts.values())
         return {
             "Total": Total,
-            "Project": len(self.Plugins[PluginSource.Project]),
-            "Engine": len(self.Plugins[PluginSource.Engine]),
-            "Fab": len(self.Plugins[PluginSource.Fab]),
+            "Project": Counts[PluginSource.Project],
+            "Engine": Counts[PluginSource.Engine],
+            "Fab": Counts[PluginSource.Fab],
             "Enabled": EnabledCount,
             "Disabled": Total - EnabledCount
         }
@@ -0,0 +1,208 @@
+# 列式插件存储
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from itertools import compress
+from typing import Iterable, Optional
+
+from Source.Data.PluginReader import PluginInfo, PluginSource
+
+
+# 来源列的编码，已移除的行标记为 REMOVED
+SOURCES = list(PluginSource)
+SOURCE_CODES = {Source: Code for Code, Source in enumerate(SOURCES)}
+REMOVED = 255
+
+# 启用状态列的编码：未配置 / 项目中启用 / 项目中禁用
+STATE_DEFAULT = 0
+STATE_ENABLED = 1
+STATE_DISABLED = 2
+
+
+def MakeTable(Codes: Iterable[int]) -> bytes:
+    """生成 bytes.translate 用的转换表：指定编码转换为 1，其余为 0"""
+    Codes = set(Codes)
+    return bytes(1 if i in Codes else 0 for i in range(256))
+
+
+SOURCE_TABLES = {Source: MakeTable([Code]) for Source, Code in SOURCE_CODES.items()}
+STATE_ENABLED_TABLE = MakeTable([STATE_ENABLED])
+STATE_DEFAULT_TABLE = MakeTable([STATE_DEFAULT])
+
+
+def AndMasks(A: bytes, B: bytes) -> bytes:
+    """逐行与运算（掩码每行一个字节，取值 0 或 1，整列一次完成）"""
+    return (int.from_bytes(A, "little") & int.from_bytes(B, "little")).to_bytes(len(A), "little")
+
+
+def OrMasks(A: bytes, B: bytes) -> bytes:
+    """逐行或运算"""
+    return (int.from_bytes(A, "little") | int.from_bytes(B, "little")).to_bytes(len(A), "little")
+
+
+def MaskRows(Mask: bytes) -> array:
+    """掩码为 1 的行号（升序）"""
+    return array("I", compress(range(len(Mask)), Mask))
+
+
+def GetStateCode(Plugin: PluginInfo) -> int:
+    """插件在项目中的启用状态编码"""
+    if Plugin.EnabledInProject is None:
+        return STATE_DEFAULT
+    return STATE_ENABLED if Plugin.EnabledInProject else STATE_DISABLED
+
+
+class PluginView(Sequence):
+    """插件视图：以行号数组引用存储中的插件，过滤结果不复制插件列表"""
+
+    def __init__(self, Records: list, Rows: Optional[array] = None):
+        self.Records = Records
+        self.Rows = Rows if Rows is not None else array("I")
+
+    def __len__(self) -> int:
+        return len(self.Rows)
+
+    def __getitem__(self, Index):
+        if isinstance(Index, slice):
+            return [self.Records[Row] for Row in self.Rows[Index]]
+        return self.Records[self.Rows[Index]]
+
+    def __iter__(self):
+        return map(self.Records.__getitem__, self.Rows)
+
+    def __repr__(self) -> str:
+        return f"PluginView({len(self.Rows)} 个插件)"
+
+    def Copy(self) -> "PluginView":
+        """复制视图（只复制行号数组）"""
+        return PluginView(self.Records, self.Rows[:])
+
+    def Append(self, Row: int):
+        """追加一行（行号需大于已有行号）"""
+        self.Rows.append(Row)
+
+    def Discard(self, Row: int):
+        """移除一行（不存在时忽略）"""
+        Pos = bisect_left(self.Rows, Row)
+        if Pos < len(self.Rows) and self.Rows[Pos] == Row:
+            del self.Rows[Pos]
+
+
+class PluginStore:
+    """列式插件存储：每个插件占一行，名称、来源、分类、作者、启用标志和依赖分别按列保存
+
+    计数和过滤以整列掩码运算完成，按来源的插件列表和过滤结果都是行号数组视图。
+    移除插件只标记行（不移动其余行），重新加载时整体重建。
+    """
+
+    def __init__(self):
+        self.Records: list[Optional[PluginInfo]] = []
+        self.RowIndex: dict[int, int] = {}  # id(插件) -> 行号
+        self.Names: list[str] = []
+        self.Categories: list[str] = []
+        self.Authors: list[str] = []
+        self.Sources = bytearray()
+        self.EnabledByDefault = bytearray()
+        self.States = bytearray()
+        # 依赖列：DepNames[DepStarts[行]:DepEnds[行]] 为该行的依赖插件名
+        self.DepStarts = array("I")
+        self.DepEnds = array("I")
+        self.DepNames: list[str] = []
+        # 各来源的行号（升序），同时作为管理器中按来源的插件列表
+        self.SourceRows: dict[PluginSource, array] = {Source: array("I") for Source in PluginSource}
+
+    def __len__(self) -> int:
+        return sum(len(Rows) for Rows in self.SourceRows.values())
+
+    def GetRow(self, Plugin: PluginInfo) -> Optional[int]:
+        """获取插件所在行，不在存储中时返回 None"""
+        return self.RowIndex.get(id(Plugin))
+
+    def Add(self, Plugin: PluginInfo) -> int:
+        """追加插件，返回行号"""
+        Row = len(self.Records)
+        self.Records.append(Plugin)
+        self.RowIndex[id(Plugin)] = Row
+        self.Names.append(Plugin.Name)
+        self.Categories.append(Plugin.Category)
+        self.Authors.append(Plugin.CreatedBy)
+        self.Sources.append(SOURCE_CODES[Plugin.Source])
+        self.EnabledByDefault.append(1 if Plugin.EnabledByDefault else 0)
+        self.States.append(GetStateCode(Plugin))
+        self.DepStarts.append(len(self.DepNames))
+        self.DepNames.extend(Plugin.Plugins)
+        self.DepEnds.append(len(self.DepNames))
+        self.SourceRows[Plugin.Source].append(Row)
+        return Row
+
+    def Remove(self, Plugin: PluginInfo) -> Optional[int]:
+        """移除插件（标记行），返回原行号"""
+        Row = self.RowIndex.pop(id(Plugin), None)
+        if Row is None:
+            return None
+        self.GetView(SOURCES[self.Sources[Row]]).Discard(Row)
+        self.Records[Row] = None
+        self.Names[Row] = self.Categories[Row] = self.Authors[Row] = ""
+        self.Sources[Row] = REMOVED
+        self.EnabledByDefault[Row] = 0
+        self.States[Row] = STATE_DEFAULT
+        self.DepEnds[Row] = self.DepStarts[Row]
+        return Row
+
+    def Update(self, Plugin: PluginInfo):
+        """插件字段原地变化后更新所在行（来源不变）"""
+        Row = self.GetRow(Plugin)
+        if Row is None:
+            return
+        self.Names[Row] = Plugin.Name
+        self.Categories[Row] = Plugin.Category
+        self.Authors[Row] = Plugin.CreatedBy
+        self.EnabledByDefault[Row] = 1 if Plugin.EnabledByDefault else 0
+        self.States[Row] = GetStateCode(Plugin)
+        # 依赖变化时追加到依赖列末尾，原区间废弃
+        if self.DepNames[self.DepStarts[Row]:self.DepEnds[Row]] != Plugin.Plugins:
+            self.DepStarts[Row] = len(self.DepNames)
+            self.DepNames.extend(Plugin.Plugins)
+            self.DepEnds[Row] = len(self.DepNames)
+
+    def UpdateState(self, Plugin: PluginInfo):
+        """插件在项目中的启用状态变化后更新状态列"""
+        Row = self.GetRow(Plugin)
+        if Row is not None:
+            self.States[Row] = GetStateCode(Plugin)
+
+    def GetView(self, Source: PluginSource) -> PluginView:
+        """指定来源全部插件的视图（随存储变化）"""
+        return PluginView(self.Records, self.SourceRows[Source])
+
+    def GetDependencies(self, Row: int) -> list[str]:
+        """获取行的依赖插件名"""
+        return self.DepNames[self.DepStarts[Row]:self.DepEnds[Row]]
+
+    def GetSourceMask(self, Source: PluginSource) -> bytes:
+        """来源掩码"""
+        return self.Sources.translate(SOURCE_TABLES[Source])
+
+    def GetEnabledMask(self) -> bytes:
+        """实际启用的行：项目中启用，或未配置且默认启用"""
+        Explicit = self.States.translate(STATE_ENABLED_TABLE)
+        Default = AndMasks(self.States.translate(STATE_DEFAULT_TABLE), self.EnabledByDefault)
+        return OrMasks(Explicit, Default)
+
+    def GetRowsMask(self, Rows: Iterable[int]) -> bytearray:
+        """由行号生成掩码"""
+        Mask = bytearray(len(self.Records))
+        for Row in Rows:
+            Mask[Row] = 1
+        return Mask
+
+    def CountEnabled(self, Source: Optional[PluginSource] = None) -> int:
+        """启用的插件数，Source 为 None 时统计全部来源"""
+        Mask = self.GetEnabledMask()
+        if Source is not None:
+            Mask = AndMasks(Mask, self.GetSourceMask(Source))
+        return Mask.count(1)
+
+    def GetCategories(self, Source: PluginSource) -> list[str]:
+        """获取指定来源的全部分类（已排序）"""
+        return sorted(set(compress(self.Categories, self.GetSourceMask(Source))) - {""})
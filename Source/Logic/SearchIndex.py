@@ -0,0 +1,60 @@
+# 搜索倒排索引
+from typing import Hashable, Optional
+
+
+# 三元组长度
+GRAM_SIZE = 3
+
+
+def GetGrams(Text: str) -> set[str]:
+    """获取文本的全部三元组"""
+    return {Text[i:i + GRAM_SIZE] for i in range(len(Text) - GRAM_SIZE + 1)}
+
+
+class TrigramIndex:
+    """三元组倒排索引，用于快速缩小子串搜索的候选范围
+
+    索引只负责筛选候选，候选仍需做子串校验（三元组全部命中不代表连续出现）。
+    """
+
+    def __init__(self):
+        self.Postings: dict[str, set] = {}
+
+    def Add(self, Key: Hashable, Text: str):
+        """添加文本（应已小写化）"""
+        for Gram in GetGrams(Text):
+            self.Postings.setdefault(Gram, set()).add(Key)
+
+    def Remove(self, Key: Hashable, Text: str):
+        """移除文本，Text 需与添加时一致"""
+        for Gram in GetGrams(Text):
+            Keys = self.Postings.get(Gram)
+            if Keys is None:
+                continue
+            Keys.discard(Key)
+            if not Keys:
+                del self.Postings[Gram]
+
+    def Clear(self):
+        """清空索引"""
+        self.Postings = {}
+
+    def GetCandidates(self, Keywords: list[str]) -> Optional[set]:
+        """获取可能同时包含所有关键词的键集合，关键词都短于三元组时返回 None（无法筛选）"""
+        Result: Optional[set] = None
+        # 按倒排表长度从短到长求交集，尽早缩小结果
+        Lists = []
+        for Keyword in Keywords:
+            if len(Keyword) < GRAM_SIZE:
+                continue
+            for Gram in GetGrams(Keyword):
+                Keys = self.Postings.get(Gram)
+                if not Keys:
+                    return set()
+                Lists.append(Keys)
+
+        for Keys in sorted(Lists, key=len):
+            Result = set(Keys) if Result is None else Result & Keys
+            if not Result:
+                break
+        return Result
@@ -2,14 +2,27 @@
 from pathlib import Path
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QTreeWidget, QTreeWidgetItem, QLineEdit, QLabel, QTextEdit,
+    QTreeView, QAbstractItemView, QLineEdit, QLabel, QTextEdit,
     QGroupBox, QCheckBox, QPushButton, QMessageBox, QHeaderView, QStatusBar, QTabBar, QComboBox
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QColor, QBrush
+from PySide6.QtCore import Qt, QTimer, QThreadPool, QFileSystemWatcher
+from PySide6.QtGui import QFont
 
-from Source.Logic.PluginManager import PluginManager
+from Source.Logic.PluginManager import PluginManager, ProjectChanges
 from Source.Data.PluginReader import PluginInfo, PluginSource
+from Source.Data.Tracing import Traced, STARTUP
+from Source.UI.Workers import SearchSignals, SearchTask, LoadSignals, LoadTask, RefreshSignals, RefreshTask
+from Source.UI.PluginListModel import PluginListModel
+
+
+# 搜索输入防抖间隔（毫秒）
+SEARCH_DEBOUNCE_MS = 150
+
+# 文件变化后增量刷新的合并间隔（毫秒）
+REFRESH_DEBOUNCE_MS = 500
+
+# 来源显示名称
+SOURCE_NAMES = {PluginSource.Project: "项目", PluginSource.Fab: "商城", PluginSource.Engine: "引擎"}
 
 
 class MainWindow(QMainWindow):
@@ -19,9 +32,65 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.Manager = PluginManager()
         self.CurSource: PluginSource = PluginSource.Project
+
+        # 后台搜索：输入防抖，单线程执行，只应用最新一次搜索的结果
+        self.SearchGeneration = 0
+        self.SearchPool = QThreadPool(self)
+        self.SearchPool.setMaxThreadCount(1)
+        self.SearchSignals = SearchSignals()
+        self.SearchSignals.Finished.connect(self.OnSearchFinished)
+        self.SearchTimer = QTimer(self)
+        self.SearchTimer.setSingleShot(True)
+        self.SearchTimer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.SearchTimer.timeout.connect(self.StartSearch)
+
+        # 后台加载：按来源逐个扫描（当前标签页优先），插件分批加入列表，只处理最新一次加载的结果
+        self.LoadGeneration = 0
+        self.IsLoading = False
+        self.PendingSelectName = None  # 重新加载后等待恢复选中的插件
+        self.LoadPool = QThreadPool(self)
+        self.LoadPool.setMaxThreadCount(1)
+        self.LoadSignals = LoadSignals()
+        self.LoadSignals.Batch.connect(self.OnLoadBatch)
+        self.LoadSignals.SourceLoaded.connect(self.OnSourceLoaded)
+        self.LoadSignals.Finished.connect(self.OnLoadFinished)
+
+        # 监视项目文件和插件目录，文件变化后合并短时间内的多次通知再增量刷新
+        self.Watcher = QFileSystemWatcher(self)
+        self.RefreshTimer = QTimer(self)
+        self.RefreshTimer.setSingleShot(True)
+        self.RefreshTimer.setInterval(REFRESH_DEBOUNCE_MS)
+        self.RefreshTimer.timeout.connect(self.OnFilesChanged)
+        self.Watcher.fileChanged.connect(self.RefreshTimer.start)
+        self.Watcher.directoryChanged.connect(self.RefreshTimer.start)
+        # 增量刷新在加载线程池中扫描（与加载任务串行），进行中再次请求时合并来源，完成后再刷新一次
+        self.IsRefreshing = False
+        self.QueuedRefresh: set = set()
+        self.RefreshSignals = RefreshSignals()
+        self.RefreshSignals.Finished.connect(self.OnRefreshScanned)
+
+        # 项目在窗口首次显示并绘制后再加载，启动时先看到界面
+        self.StartupScheduled = False
         self.InitUI()
+
+    def showEvent(self, Event):
+        """首次显示时安排加载项目（事件循环处理完显示事件后执行）"""
+        super().showEvent(Event)
+        if not self.StartupScheduled:
+            self.StartupScheduled = True
+            QTimer.singleShot(0, self.StartLoading)
+
+    def StartLoading(self):
+        """立即绘制窗口，然后加载当前目录的项目"""
+        self.repaint()
+        STARTUP.Mark("首次绘制")
         self.LoadProject(Path.cwd())
+        STARTUP.Mark("读取项目信息")
+        if not self.IsLoading:
+            # 项目文件无效，不会再有加载完成的通知
+            STARTUP.Finish()
 
+    @Traced("UI")
     def InitUI(self):
         """初始化界面"""
         self.setWindowTitle("UE Plugin Manager")
@@ -151,7 +220,7 @@ class MainWindow(QMainWindow):
         self.SearchEdit = QLineEdit()
         self.SearchEdit.setPlaceholderText("搜索插件...")
         self.SearchEdit.setClearButtonEnabled(True)
-        self.SearchEdit.textChanged.connect(self.OnSearch)
+        self.SearchEdit.textChanged.connect(self.OnSearchTextChanged)
         SearchLayout.addWidget(self.SearchEdit)
         Layout.addLayout(SearchLayout)
 
@@ -163,13 +232,17 @@ class MainWindow(QMainWindow):
         self.SourceTabs.currentChanged.connect(self.OnTabChanged)
         Layout.addWidget(self.SourceTabs)
 
-        self.PluginTree = QTreeWidget()
-        self.PluginTreeHeaders = ["名称", "作者", "分类", "状态"]
-        self.PluginTree.setHeaderLabels(self.PluginTreeHeaders)
+        # 模型直接引用插件数据，视图只为可见行请求数据
+        self.PluginModel = PluginListModel(self.Manager, self)
+        self.PluginTree = QTreeView()
+        self.PluginTree.setModel(self.PluginModel)
         self.PluginTree.setRootIsDecorated(False)
+        self.PluginTree.setUniformRowHeights(True)
+        self.PluginTree.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.PluginTree.setSelectionMode(QAbstractItemView.SingleSelection)
         self.PluginTree.setSortingEnabled(True)
         self.PluginTree.sortByColumn(0, Qt.AscendingOrder)
-        self.PluginTree.itemSelectionChanged.connect(self.OnPluginSelected)
+        self.PluginTree.selectionModel().selectionChanged.connect(self.OnPluginSelected)
 
         Header = self.PluginTree.header()
         Header.setSortIndicatorShown(False)
@@ -240,6 +313,13 @@ class MainWindow(QMainWindow):
         self.DependentsEdit.setMaximumHeight(60)
         Layout.addWidget(self.DependentsEdit)
 
+        # 全部来源加载完成前，依赖和冲突信息为临时结果
+        self.ProvisionalLabel = QLabel()
+        self.ProvisionalLabel.setStyleSheet("color: #c08000;")
+        self.ProvisionalLabel.setWordWrap(True)
+        self.ProvisionalLabel.hide()
+        Layout.addWidget(self.ProvisionalLabel)
+
         # 按钮区
         BtnLayout = QVBoxLayout()
         BtnLayout.setSpacing(8)
@@ -321,9 +401,12 @@ class MainWindow(QMainWindow):
 
         return self.DetailPanel
 
+    @Traced("UI")
     def LoadProject(self, ProjectPath: Path, AutoSelect: bool = True):
-        """加载项目"""
-        if not self.Manager.LoadProject(ProjectPath):
+        """加载项目（插件在后台按来源扫描，分批显示）"""
+        self.CancelSearch()
+        self.LoadGeneration += 1
+        if not self.Manager.BeginLoad(ProjectPath, Background=True):
             return
 
         Info = self.Manager.ProjectInfo
@@ -341,13 +424,146 @@ class MainWindow(QMainWindow):
             self.EngineVersionLabel.setText("-")
             self.EnginePathLabel.setText("-")
 
-        # 刷新列表
-        self.RefreshPluginList()
+        # 清空列表，等待后台加载结果
         if AutoSelect:
-            self.SelectFirstOrClear()
+            self.PendingSelectName = None
+            self.ClearDetailPanel()
+        else:
+            self.PendingSelectName = getattr(self, "CurPluginName", None)
+        self.RefreshPluginList()
+        # 当前标签页的来源最先加载
+        self.Manager.PrioritizeSource(self.CurSource)
+
+        self.IsLoading = True
+        self.StatusLeftLabel.setText("正在扫描插件...")
+        self.StatusRightLabel.setText("")
+        self.LoadPool.start(LoadTask(self.Manager, self.Manager.Reader, self.LoadSignals, self.LoadGeneration))
+
+    @Traced("UI")
+    def OnLoadBatch(self, Generation: int, Plugins: list, Scanned: int):
+        """一批插件加载完成"""
+        if Generation != self.LoadGeneration:
+            return
+        self.Manager.AddPlugins(Plugins)
+        if not STARTUP.HasMark("首批插件显示"):
+            STARTUP.Mark("首批插件显示")
+
+        # 只有当前标签页有新插件时才刷新列表，其余只更新数量
+        if any(P.Source == self.CurSource for P in Plugins):
+            self.RefreshPluginList()
+            self.RestoreSelection()
+        else:
+            self.UpdateTabCounts()
+
+        Found = self.Manager.GetStats()["Total"]
+        self.StatusLeftLabel.setText(f"正在扫描插件... 已扫描 {Scanned} 个文件，已找到 {Found} 个插件")
 
-        # 更新状态栏
+    def OnSourceLoaded(self, Generation: int, Source: PluginSource):
+        """一个来源加载完成"""
+        if Generation != self.LoadGeneration:
+            return
+        self.Manager.FinishSource(Source)
+        self.UpdateTabCounts()
+        self.UpdateProvisionalLabel()
+
+    @Traced("UI")
+    def OnLoadFinished(self, Generation: int):
+        """加载完成"""
+        if Generation != self.LoadGeneration:
+            return
+        self.IsLoading = False
+        # 引擎插件加入后冲突状态可能变化，完整刷新一次
+        self.RefreshPluginList()
+        self.RestoreSelection()
+        self.PendingSelectName = None
+        self.UpdateProvisionalLabel()
         self.UpdateStatusBar()
+        self.UpdateWatchPaths()
+        STARTUP.Mark("插件加载完成")
+        STARTUP.Finish()
+
+    @Traced("UI")
+    def UpdateWatchPaths(self):
+        """更新监视列表：项目文件、项目和商城插件的描述文件及其所在目录（引擎内置插件不监视）"""
+        Paths = set()
+        Reader = self.Manager.Reader
+        if Reader and Reader.UProjectFile:
+            Paths.add(str(Reader.UProjectFile))
+            for PluginsDir, _ in Reader.GetRoots({PluginSource.Project, PluginSource.Fab}):
+                if PluginsDir.is_dir():
+                    Paths.add(str(PluginsDir))
+            for Source in (PluginSource.Project, PluginSource.Fab):
+                for Plugin in self.Manager.Plugins[Source]:
+                    Paths.add(str(Plugin.Path / f"{Plugin.Name}.uplugin"))
+                    # 监视插件目录到根目录之间的各级目录，以便发现新增和删除的插件
+                    Dir = Plugin.Path
+                    while str(Dir) not in Paths and Dir.parent != Dir:
+                        Paths.add(str(Dir))
+                        Dir = Dir.parent
+
+        # 文件被替换保存后会从监视列表中移除，这里统一重新添加
+        Watched = set(self.Watcher.files()) | set(self.Watcher.directories())
+        if Watched - Paths:
+            self.Watcher.removePaths(list(Watched - Paths))
+        if Paths - Watched:
+            self.Watcher.addPaths(list(Paths - Watched))
+
+    def OnFilesChanged(self):
+        """监视的文件变化后只刷新项目和商城插件"""
+        self.RefreshFromDisk([PluginSource.Project, PluginSource.Fab])
+
+    def RefreshFromDisk(self, Sources=None):
+        """增量刷新：在后台遍历插件目录并只重新解析变化的插件文件，完成后合并并保持当前选中"""
+        if self.IsLoading:
+            # 正在加载时推迟到加载完成后再检查
+            self.RefreshTimer.start()
+            return
+        if not self.Manager.ProjectInfo:
+            return
+        if self.IsRefreshing:
+            self.QueuedRefresh |= set(Sources) if Sources is not None else set(PluginSource)
+            return
+
+        self.IsRefreshing = True
+        self.LoadPool.start(RefreshTask(self.Manager, Sources, self.RefreshSignals, self.LoadGeneration))
+
+    @Traced("UI")
+    def OnRefreshScanned(self, Generation: int, Scan):
+        """刷新扫描完成，合并变化并更新界面"""
+        self.IsRefreshing = False
+        if Generation != self.LoadGeneration:
+            # 扫描期间项目已重新加载
+            self.QueuedRefresh = set()
+            return
+        if Scan is None:
+            # 引擎关联变化，需要完整重新加载
+            self.QueuedRefresh = set()
+            self.LoadProject(self.Manager.ProjectInfo.Path, AutoSelect=False)
+            return
+
+        Result = self.Manager.ApplyRefresh(Scan)
+        if Result.Added or Result.Removed or Result.Modified:
+            self.RefreshPluginList()
+            self.TryReselectOrFirst()
+        elif Result.StatusChanged:
+            self.OnPluginStatusChanged(Result.StatusChanged)
+        # 解析失败的文件也在状态栏中显示
+        self.UpdateStatusBar()
+        self.UpdateWatchPaths()
+
+        if self.QueuedRefresh:
+            Sources, self.QueuedRefresh = list(self.QueuedRefresh), set()
+            self.RefreshFromDisk(Sources)
+
+    def RestoreSelection(self):
+        """刷新列表后恢复选中：优先等待恢复的插件，其次当前插件，否则选第一个"""
+        if self.PendingSelectName:
+            Row = self.PluginModel.FindRow(self.PendingSelectName)
+            if Row >= 0:
+                self.PendingSelectName = None
+                self.SelectRow(Row)
+                return
+        self.TryReselectOrFirst()
 
     def GetSourceByTabIndex(self, Index: int) -> PluginSource:
         """根据标签页索引获取来源类型"""
@@ -358,114 +574,133 @@ class MainWindow(QMainWindow):
         else:
             return PluginSource.Engine
 
+    @Traced("UI")
     def RefreshPluginList(self):
         """刷新插件列表（不改变选中状态）"""
-        # 阻止信号，防止 clear() 触发不必要的事件
-        self.PluginTree.blockSignals(True)
-        self.PluginTree.clear()
-        self.PluginTree.blockSignals(False)
-
         # 获取当前标签页对应的来源类型
         self.CurSource = self.GetSourceByTabIndex(self.SourceTabs.currentIndex())
-
-        # 更新各标签页的匹配数
-        ProjectCount = len(self.Manager.GetPlugins(PluginSource.Project))
-        FabCount = len(self.Manager.GetPlugins(PluginSource.Fab))
-        EngineCount = len(self.Manager.GetPlugins(PluginSource.Engine))
-
-        self.SourceTabs.setTabText(0, f"项目 ({ProjectCount})")
-        self.SourceTabs.setTabText(1, f"商城 ({FabCount})")
-        self.SourceTabs.setTabText(2, f"引擎 ({EngineCount})")
-
-        # 只显示当前标签页类型的插件
-        RedBrush = QBrush(QColor(220, 50, 50))
-        Plugins = self.Manager.GetPlugins(self.CurSource)
-        for Plugin in Plugins:
-            Item = QTreeWidgetItem()
-            Item.setText(0, Plugin.Name)
-            Item.setText(1, Plugin.CreatedBy or "-")
-            Item.setText(2, Plugin.Category or "-")
-
-            # 检查是否冲突
-            HasConflict = self.Manager.HasConflict(Plugin.Name)
-
-            # 状态
-            if HasConflict:
-                Status = "冲突"
-                Item.setForeground(3, RedBrush)
-            elif Plugin.EnabledInProject is True:
-                Status = "启用"
-            elif Plugin.EnabledInProject is False:
-                Status = "禁用"
-            else:
-                Status = "默认" + ("(启用)" if Plugin.EnabledByDefault else "(禁用)")
-            Item.setText(3, Status)
-
-            Item.setData(0, Qt.UserRole, Plugin.Name)
-            self.PluginTree.addTopLevelItem(Item)
+        self.UpdateTabCounts()
+
+        # 只显示当前标签页类型的插件，阻止信号，防止重置模型触发不必要的事件
+        self.PluginTree.selectionModel().blockSignals(True)
+        self.PluginModel.SetPlugins(self.Manager.GetPlugins(self.CurSource))
+        self.PluginTree.selectionModel().blockSignals(False)
+
+    def UpdateTabCounts(self):
+        """更新各标签页的匹配数（来源尚未加载完成时数量后加省略号）"""
+        for Index in range(self.SourceTabs.count()):
+            Source = self.GetSourceByTabIndex(Index)
+            Count = len(self.Manager.GetPlugins(Source))
+            Suffix = "" if self.Manager.IsSourceLoaded(Source) else "…"
+            self.SourceTabs.setTabText(Index, f"{SOURCE_NAMES[Source]} ({Count}{Suffix})")
+
+    def GetProvisionalNote(self) -> str:
+        """尚未加载完成的来源提示，全部加载完成后为空"""
+        Pending = self.Manager.GetUnloadedSources()
+        if not Pending:
+            return ""
+        return f"{'、'.join(SOURCE_NAMES[S] for S in Pending)}插件尚未加载完成，依赖和冲突信息为临时结果"
+
+    def AppendProvisionalNote(self, Text: str) -> str:
+        """在提示文本后附加临时结果说明"""
+        Note = self.GetProvisionalNote()
+        return f"{Text}\n\n（{Note}）" if Note else Text
+
+    def UpdateProvisionalLabel(self):
+        """详情面板显示插件时，在全部来源加载完成前提示依赖和冲突信息为临时结果"""
+        Note = self.GetProvisionalNote()
+        self.ProvisionalLabel.setText(Note)
+        self.ProvisionalLabel.setVisible(bool(Note) and self.DetailPanel.isEnabled())
+
+    def SelectRow(self, Row: int):
+        """选中指定行"""
+        self.PluginTree.setCurrentIndex(self.PluginModel.index(Row, 0))
 
     def SelectFirstOrClear(self):
         """选中第一个插件，如果列表为空则置灰详情面板"""
-        if self.PluginTree.topLevelItemCount() > 0:
-            self.PluginTree.setCurrentItem(self.PluginTree.topLevelItem(0))
+        if self.PluginModel.rowCount() > 0:
+            self.SelectRow(0)
         else:
             self.ClearDetailPanel()
 
     def TryReselectOrFirst(self):
         """尝试重新选中当前插件，失败则选第一个或置灰"""
-        if self.PluginTree.topLevelItemCount() == 0:
+        if self.PluginModel.rowCount() == 0:
             self.ClearDetailPanel()
             return
 
         # 尝试重新选中之前的插件
         if hasattr(self, "CurPluginName"):
-            for i in range(self.PluginTree.topLevelItemCount()):
-                Item = self.PluginTree.topLevelItem(i)
-                if Item.data(0, Qt.UserRole) == self.CurPluginName:
-                    self.PluginTree.setCurrentItem(Item)
-                    return
+            Row = self.PluginModel.FindRow(self.CurPluginName)
+            if Row >= 0:
+                self.SelectRow(Row)
+                return
 
         # 找不到就选第一个
-        self.PluginTree.setCurrentItem(self.PluginTree.topLevelItem(0))
+        self.SelectRow(0)
 
-    def OnSearch(self, Text: str):
-        """搜索"""
-        Field = self.SearchFieldCombo.currentIndex()
-        self.Manager.Search(Text, Field)
-        self.RefreshPluginList()
-        self.SelectFirstOrClear()
+    def OnSearchTextChanged(self, Text: str):
+        """搜索文本变更，防抖后再搜索"""
+        self.SearchTimer.start()
 
     def OnSearchFieldChanged(self, Index: int):
         """搜索字段变更"""
-        self.OnSearch(self.SearchEdit.text())
+        self.StartSearch()
+
+    def StartSearch(self):
+        """在后台线程执行搜索，进行中的旧搜索会被取消"""
+        self.SearchTimer.stop()
+        self.SearchGeneration += 1
+        Generation = self.SearchGeneration
+        Task = SearchTask(
+            self.Manager, self.SearchSignals, Generation,
+            self.SearchEdit.text(), self.SearchFieldCombo.currentIndex(),
+            self.Manager.GetSearchState(),
+            lambda: Generation != self.SearchGeneration
+        )
+        self.SearchPool.start(Task)
+
+    def CancelSearch(self):
+        """取消等待中和进行中的搜索"""
+        self.SearchTimer.stop()
+        self.SearchGeneration += 1
+
+    @Traced("UI")
+    def OnSearchFinished(self, Generation: int, Result):
+        """搜索完成，只应用最新一次搜索的结果"""
+        if Generation != self.SearchGeneration:
+            return
+        # 搜索期间有新插件加入，结果已过期，重新搜索
+        if Result.DataVersion != self.Manager.DataVersion:
+            self.StartSearch()
+            return
+        self.Manager.ApplySearch(Result)
+        self.RefreshPluginList()
+        self.SelectFirstOrClear()
 
     def OnTabChanged(self, Index: int):
-        """标签页切换"""
+        """标签页切换（来源尚未加载时优先加载）"""
         self.RefreshPluginList()
+        self.Manager.PrioritizeSource(self.CurSource)
         self.SelectFirstOrClear()
 
     def OnSortChanged(self, Column: int, Order):
         """排序变更，更新列标题箭头"""
-        for i, Name in enumerate(self.PluginTreeHeaders):
-            if i == Column:
-                Arrow = " ↑" if Order == Qt.AscendingOrder else " ↓"
-                self.PluginTree.headerItem().setText(i, Name + Arrow)
-            else:
-                self.PluginTree.headerItem().setText(i, Name)
+        self.PluginModel.SetSortIndicator(Column, Order)
 
     def OnPluginSelected(self):
         """插件选中"""
-        Items = self.PluginTree.selectedItems()
-        if not Items:
+        Rows = self.PluginTree.selectionModel().selectedRows()
+        if not Rows:
             return
 
-        PluginName = Items[0].data(0, Qt.UserRole)
-        Plugin = self.Manager.GetPluginByName(PluginName, self.CurSource)
+        Plugin = self.PluginModel.GetPlugin(Rows[0].row())
         if not Plugin:
             return
 
         self.ShowPluginDetail(Plugin)
 
+    @Traced("UI")
     def ShowPluginDetail(self, Plugin: PluginInfo):
         """显示插件详情"""
         self.DetailPanel.setEnabled(True)
@@ -496,12 +731,8 @@ class MainWindow(QMainWindow):
         if self.CurHasConflict:
             # 冲突时不勾选
             self.EnabledCheck.setChecked(False)
-        elif Plugin.EnabledInProject is True:
-            self.EnabledCheck.setChecked(True)
-        elif Plugin.EnabledInProject is False:
-            self.EnabledCheck.setChecked(False)
         else:
-            self.EnabledCheck.setChecked(Plugin.EnabledByDefault)
+            self.EnabledCheck.setChecked(self.Manager.IsPluginEnabled(Plugin.Name, Plugin.Source))
 
         # 保存当前插件名
         self.CurPluginName = Plugin.Name
@@ -528,6 +759,7 @@ class MainWindow(QMainWindow):
             self.MoveTip.setText("引擎插件不可移动")
             CanMove = False
         self.MovePluginBtn.setEnabled(CanMove)
+        self.UpdateProvisionalLabel()
 
     def ClearDetailPanel(self):
         """清空并置灰详情面板"""
@@ -540,6 +772,7 @@ class MainWindow(QMainWindow):
         self.DescriptionEdit.setText("")
         self.DependenciesEdit.setText("")
         self.DependentsEdit.setText("")
+        self.ProvisionalLabel.hide()
         self.EnabledCheck.setChecked(False)
         if hasattr(self, "CurPluginName"):
             del self.CurPluginName
@@ -598,7 +831,9 @@ class MainWindow(QMainWindow):
 
         if DisabledDeps:
             DepNames = [f"  - {Name}" for Name, _ in DisabledDeps]
-            Msg = f"插件 {PluginName} 依赖以下未启用的插件：\n" + "\n".join(DepNames) + "\n\n是否一并启用？"
+            Msg = self.AppendProvisionalNote(
+                f"插件 {PluginName} 依赖以下未启用的插件（含间接依赖）：\n" + "\n".join(DepNames)
+            ) + "\n\n是否一并启用？"
             Reply = QMessageBox.question(self, "依赖确认", Msg, QMessageBox.Yes | QMessageBox.Cancel)
             if Reply != QMessageBox.Yes:
                 # 确保状态恢复（对话框可能导致状态丢失）
@@ -612,12 +847,14 @@ class MainWindow(QMainWindow):
 
     def DisablePluginWithDeps(self, PluginName: str, Source):
         """禁用插件及依赖它的插件"""
-        EnabledDependents = self.Manager.GetDisabledDependents(PluginName)
+        EnabledDependents = self.Manager.GetDisabledDependents(PluginName, Source)
         PluginsToDisable = [(PluginName, Source)]
 
         if EnabledDependents:
             DepNames = [f"  - {Name}" for Name, _ in EnabledDependents]
-            Msg = f"以下插件依赖 {PluginName}：\n" + "\n".join(DepNames) + "\n\n禁用后这些插件也将被禁用，是否继续？"
+            Msg = self.AppendProvisionalNote(
+                f"以下插件直接或间接依赖 {PluginName}：\n" + "\n".join(DepNames)
+            ) + "\n\n禁用后这些插件也将被禁用，是否继续？"
             Reply = QMessageBox.question(self, "依赖确认", Msg, QMessageBox.Yes | QMessageBox.Cancel)
             if Reply != QMessageBox.Yes:
                 # 确保状态恢复（对话框可能导致状态丢失）
@@ -631,28 +868,36 @@ class MainWindow(QMainWindow):
 
     def RestoreCheckbox(self, PluginName: str, Source):
         """恢复复选框状态"""
-        Plugin = self.Manager.GetPluginByName(PluginName, Source)
-        if Plugin:
-            if Plugin.EnabledInProject is True:
-                self.EnabledCheck.setChecked(True)
-            elif Plugin.EnabledInProject is False:
-                self.EnabledCheck.setChecked(False)
-            else:
-                self.EnabledCheck.setChecked(Plugin.EnabledByDefault)
+        if self.Manager.GetPluginByName(PluginName, Source):
+            self.EnabledCheck.setChecked(self.Manager.IsPluginEnabled(PluginName, Source))
 
+    @Traced("UI")
     def ApplyPluginChanges(self, Plugins: list, Enabled: bool):
-        """批量应用插件状态变更"""
-        Success = True
-        for Name, Source in Plugins:
-            if not self.Manager.SetPluginEnabled(Name, Source, Enabled):
-                Success = False
+        """批量应用插件状态变更（项目文件只写入一次）"""
+        Changes = ProjectChanges()
+        for Name, _ in Plugins:
+            Changes.SetEnabled(Name, Enabled)
 
+        Success, Error = self.Manager.ApplyChanges(Changes)
         if Success:
-            self.RefreshPluginList()
-            self.TryReselectOrFirst()
-            self.UpdateStatusBar()
+            self.OnPluginStatusChanged([Name for Name, _ in Plugins])
         else:
-            QMessageBox.warning(self, "错误", "部分插件修改失败")
+            QMessageBox.warning(self, "修改失败", Error)
+            if hasattr(self, "CurPluginName"):
+                self.RestoreCheckbox(self.CurPluginName, self.CurSource)
+
+    @Traced("UI")
+    def OnPluginStatusChanged(self, Names: list):
+        """插件启用状态变化后只刷新对应行、详情和状态栏"""
+        self.PluginModel.UpdatePlugins(Names)
+        Plugin = None
+        if hasattr(self, "CurPluginName"):
+            Plugin = self.Manager.GetPluginByName(self.CurPluginName, self.CurSource)
+        if Plugin:
+            self.ShowPluginDetail(Plugin)
+        else:
+            self.TryReselectOrFirst()
+        self.UpdateStatusBar()
 
     def OnResetDefault(self):
         """恢复插件默认状态"""
@@ -667,10 +912,13 @@ class MainWindow(QMainWindow):
         if Plugin.EnabledInProject is None:
             return
 
-        if self.Manager.ResetPluginToDefault(self.CurPluginName, self.CurSource):
-            self.RefreshPluginList()
-            self.TryReselectOrFirst()
-            self.UpdateStatusBar()
+        Changes = ProjectChanges()
+        Changes.Reset(self.CurPluginName)
+        Success, Error = self.Manager.ApplyChanges(Changes)
+        if Success:
+            self.OnPluginStatusChanged([self.CurPluginName])
+        else:
+            QMessageBox.warning(self, "修改失败", Error)
 
     def OnMovePlugin(self):
         """移动插件"""
@@ -701,7 +949,8 @@ class MainWindow(QMainWindow):
         Reply = QMessageBox.question(
             self, "确认移动",
             f"将插件 {self.CurPluginName} 移动到{TargetName}目录？\n\n"
-            f"源目录: {Plugin.Path}",
+            f"源目录: {Plugin.Path}"
+            + self.FormatImpact(self.CurPluginName, self.CurSource),
             QMessageBox.Yes | QMessageBox.Cancel
         )
 
@@ -710,6 +959,8 @@ class MainWindow(QMainWindow):
 
         Success, Error = self.Manager.MovePlugin(self.CurPluginName, self.CurSource, TargetSource)
         if Success:
+            # 之前发起的搜索基于移动前的数据，丢弃其结果
+            self.CancelSearch()
             self.RefreshPluginList()
             self.SelectFirstOrClear()
             self.UpdateStatusBar()
@@ -717,6 +968,15 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.warning(self, "移动失败", Error)
 
+    def FormatImpact(self, PluginName: str, Source) -> str:
+        """格式化受影响插件列表（直接或间接依赖此插件的插件），全部来源加载完成前附加临时结果说明"""
+        Impact = self.Manager.GetImpactSet(PluginName, Source)
+        Text = ""
+        if Impact:
+            Names = [f"  - {Name}" for Name, _ in Impact]
+            Text = "\n\n以下插件直接或间接依赖此插件：\n" + "\n".join(Names)
+        return self.AppendProvisionalNote(Text)
+
     def OnDeletePlugin(self):
         """删除插件"""
         if not hasattr(self, "CurPluginName"):
@@ -735,7 +995,8 @@ class MainWindow(QMainWindow):
 
         Reply = QMessageBox.warning(
             self, "确认删除",
-            f"确定要删除{SourceName}插件 {self.CurPluginName} 吗？\n\n路径: {Plugin.Path}\n\n此操作会将插件移至回收站。",
+            f"确定要删除{SourceName}插件 {self.CurPluginName} 吗？\n\n路径: {Plugin.Path}\n\n此操作会将插件移至回收站。"
+            + self.FormatImpact(self.CurPluginName, self.CurSource),
             QMessageBox.Yes | QMessageBox.Cancel
         )
 
@@ -744,6 +1005,7 @@ class MainWindow(QMainWindow):
 
         Success, Error = self.Manager.DeletePlugin(self.CurPluginName, self.CurSource)
         if Success:
+            self.CancelSearch()
             self.RefreshPluginList()
             self.SelectFirstOrClear()
             self.UpdateStatusBar()
@@ -803,26 +1065,37 @@ class MainWindow(QMainWindow):
         import subprocess
         subprocess.Popen(['explorer', str(self.Manager.ProjectInfo.EnginePath)])
 
+    @Traced("UI")
     def UpdateStatusBar(self):
         """更新状态栏"""
         Stats = self.Manager.GetStats()
         self.StatusLeftLabel.setText(
             f"共 {Stats['Total']} 个插件 | "
             f"项目: {Stats['Project']} | 商城: {Stats['Fab']} | 引擎: {Stats['Engine']}"
+            + ("" if self.Manager.IsComplete() else "（加载中，统计为临时结果）")
         )
         self.StatusRightLabel.setText(
             f"已启用: {Stats['Enabled']} | 已禁用: {Stats['Disabled']}"
         )
 
+        # 解析失败的插件文件
+        Errors = self.Manager.GetLoadErrors()
+        if Errors:
+            self.StatusLeftLabel.setText(self.StatusLeftLabel.text() + f" | 解析失败: {len(Errors)}")
+            self.StatusLeftLabel.setToolTip("\n".join(f"{File} - {Error}" for File, Error in Errors))
+        else:
+            self.StatusLeftLabel.setToolTip("")
+
     def OnReload(self):
-        """重新加载插件"""
-        if not self.Manager.ProjectInfo:
-            return
-        PrevPluginName = getattr(self, "CurPluginName", None)
-        self.LoadProject(self.Manager.ProjectInfo.Path, AutoSelect=False)
-        if PrevPluginName:
-            self.CurPluginName = PrevPluginName
-        self.TryReselectOrFirst()
+        """重新加载插件（增量刷新全部来源，保持选中）"""
+        self.RefreshFromDisk()
+
+    def closeEvent(self, Event):
+        """关闭窗口时取消后台加载"""
+        self.LoadGeneration += 1
+        if self.Manager.Reader:
+            self.Manager.Reader.Cancel()
+        super().closeEvent(Event)
 
     def OnCloseProject(self):
         """关闭项目（尝试关闭 UE 编辑器）"""
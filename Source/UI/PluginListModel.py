@@ -0,0 +1,121 @@
+# 插件列表模型
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor, QBrush
+
+from Source.Data.PluginReader import PluginInfo
+
+
+class PluginListModel(QAbstractTableModel):
+    """插件列表模型，直接引用管理器中的插件数据，视图只请求可见行"""
+
+    Headers = ["名称", "作者", "分类", "状态"]
+
+    def __init__(self, Manager, Parent=None):
+        super().__init__(Parent)
+        self.Manager = Manager
+        self.Plugins: list[PluginInfo] = []
+        self.SortColumn = 0
+        self.SortOrder = Qt.AscendingOrder
+        self.ConflictBrush = QBrush(QColor(220, 50, 50))
+
+    def SetPlugins(self, Plugins: list[PluginInfo]):
+        """替换列表内容（按当前排序列排序）"""
+        self.beginResetModel()
+        self.Plugins = self.SortPlugins(Plugins)
+        self.endResetModel()
+
+    def GetPlugin(self, Row: int):
+        """获取指定行的插件"""
+        if 0 <= Row < len(self.Plugins):
+            return self.Plugins[Row]
+        return None
+
+    def FindRow(self, Name: str) -> int:
+        """查找插件所在行，不存在时返回 -1"""
+        for Row, Plugin in enumerate(self.Plugins):
+            if Plugin.Name == Name:
+                return Row
+        return -1
+
+    def UpdatePlugins(self, Names):
+        """插件状态变化后只刷新对应行"""
+        Names = set(Names)
+        for Row, Plugin in enumerate(self.Plugins):
+            if Plugin.Name in Names:
+                self.dataChanged.emit(self.index(Row, 0), self.index(Row, len(self.Headers) - 1))
+
+    def GetText(self, Plugin: PluginInfo, Column: int) -> str:
+        """获取单元格文本"""
+        if Column == 0:
+            return Plugin.Name
+        if Column == 1:
+            return Plugin.CreatedBy or "-"
+        if Column == 2:
+            return Plugin.Category or "-"
+        return self.GetStatusText(Plugin)
+
+    def GetStatusText(self, Plugin: PluginInfo) -> str:
+        """获取状态文本"""
+        return self.Manager.GetStatusText(Plugin)
+
+    def rowCount(self, Parent=QModelIndex()) -> int:
+        return 0 if Parent.isValid() else len(self.Plugins)
+
+    def columnCount(self, Parent=QModelIndex()) -> int:
+        return 0 if Parent.isValid() else len(self.Headers)
+
+    def data(self, Index: QModelIndex, Role=Qt.DisplayRole):
+        if not Index.isValid():
+            return None
+        Plugin = self.Plugins[Index.row()]
+        Column = Index.column()
+        if Role == Qt.DisplayRole:
+            return self.GetText(Plugin, Column)
+        if Role == Qt.ForegroundRole and Column == 3 and self.Manager.HasConflict(Plugin.Name):
+            return self.ConflictBrush
+        if Role == Qt.UserRole and Column == 0:
+            return Plugin.Name
+        return None
+
+    def headerData(self, Section: int, Orientation, Role=Qt.DisplayRole):
+        if Orientation != Qt.Horizontal or Role != Qt.DisplayRole:
+            return None
+        Name = self.Headers[Section]
+        if Section == self.SortColumn:
+            return Name + (" ↑" if self.SortOrder == Qt.AscendingOrder else " ↓")
+        return Name
+
+    def SetSortIndicator(self, Column: int, Order):
+        """更新列标题排序箭头"""
+        self.SortColumn = Column
+        self.SortOrder = Order
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.Headers) - 1)
+
+    def SortPlugins(self, Plugins: list[PluginInfo]) -> list[PluginInfo]:
+        """按当前排序列生成排序键并排序"""
+        Column = self.SortColumn
+        Keys = [self.GetText(P, Column) for P in Plugins]
+        Order = sorted(range(len(Plugins)), key=Keys.__getitem__,
+                       reverse=self.SortOrder == Qt.DescendingOrder)
+        return [Plugins[i] for i in Order]
+
+    def sort(self, Column: int, Order=Qt.AscendingOrder):
+        """排序（保持选中项）"""
+        self.SortColumn = Column
+        self.SortOrder = Order
+        self.layoutAboutToBeChanged.emit()
+
+        OldRows = {id(P): Row for Row, P in enumerate(self.Plugins)}
+        OldPlugins = self.Plugins
+        self.Plugins = self.SortPlugins(self.Plugins)
+        NewRows = [0] * len(self.Plugins)
+        for Row, P in enumerate(self.Plugins):
+            NewRows[OldRows[id(P)]] = Row
+
+        OldIndexes = self.persistentIndexList()
+        NewIndexes = [
+            self.index(NewRows[I.row()], I.column()) if I.row() < len(OldPlugins) else QModelIndex()
+            for I in OldIndexes
+        ]
+        self.changePersistentIndexList(OldIndexes, NewIndexes)
+        self.layoutChanged.emit()
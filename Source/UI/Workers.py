@@ -0,0 +1,86 @@
+# 后台任务
+from PySide6.QtCore import QObject, QRunnable, Signal
+from Source.Data.PluginReader import PluginSource
+
+
+class SearchSignals(QObject):
+    """搜索任务信号（在主线程创建，结果以排队方式回到主线程）"""
+    Finished = Signal(int, object)  # (搜索序号, SearchResult)
+
+
+class SearchTask(QRunnable):
+    """后台搜索任务"""
+
+    def __init__(self, Manager, Signals: SearchSignals, Generation: int,
+                 Keyword: str, Field: int, State: tuple, IsCancelled):
+        super().__init__()
+        self.Manager = Manager
+        self.Signals = Signals
+        self.Generation = Generation
+        self.Keyword = Keyword
+        self.Field = Field
+        self.State = State
+        self.IsCancelled = IsCancelled
+
+    def run(self):
+        """执行搜索，被新输入取消时不发送结果"""
+        if self.IsCancelled():
+            return
+        Result = self.Manager.QuerySearch(self.Keyword, self.Field, self.State, self.IsCancelled)
+        if Result is not None:
+            self.Signals.Finished.emit(self.Generation, Result)
+
+
+class LoadSignals(QObject):
+    """加载任务信号"""
+    Batch = Signal(int, object, int)  # (加载序号, 插件列表, 已扫描文件数)
+    SourceLoaded = Signal(int, object)  # (加载序号, 加载完成的来源)
+    Finished = Signal(int)  # 加载序号
+
+
+class LoadTask(QRunnable):
+    """后台插件加载任务，按管理器的优先级逐个根目录扫描（每个根目录只遍历一次），每解析完一批插件发送一次结果"""
+
+    def __init__(self, Manager, Reader, Signals: LoadSignals, Generation: int):
+        super().__init__()
+        self.Manager = Manager
+        self.Reader = Reader
+        self.Signals = Signals
+        self.Generation = Generation
+
+    def run(self):
+        """扫描并解析插件（每个根目录开始前按来源优先级重新选择，切换标签页后优先加载该来源；
+        解析缓存在全部根目录扫描完成后才保存和释放）"""
+        AllSources = set(PluginSource)
+        try:
+            while True:
+                for Source in self.Manager.TakeFinishedSources(self.Reader):
+                    self.Signals.SourceLoaded.emit(self.Generation, Source)
+                Root = self.Manager.TakePendingRoot(self.Reader)
+                if Root is None:
+                    break
+                for Batch in self.Reader.IterRootBatches(*Root, AllSources):
+                    self.Signals.Batch.emit(self.Generation, Batch, self.Reader.ScannedCount)
+        finally:
+            self.Reader.FinishScan()
+        self.Signals.Finished.emit(self.Generation)
+
+
+class RefreshSignals(QObject):
+    """增量刷新任务信号"""
+    Finished = Signal(int, object)  # (加载序号, RefreshScan，引擎关联变化时为 None)
+
+
+class RefreshTask(QRunnable):
+    """后台增量刷新任务：遍历插件目录并重新解析变化的文件，结果回到主线程合并"""
+
+    def __init__(self, Manager, Sources, Signals: RefreshSignals, Generation: int):
+        super().__init__()
+        self.Manager = Manager
+        self.Sources = Sources
+        self.Signals = Signals
+        self.Generation = Generation
+
+    def run(self):
+        """扫描变化（不持有管理器的锁）"""
+        self.Signals.Finished.emit(self.Generation, self.Manager.ScanRefresh(self.Sources))
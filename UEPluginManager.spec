@@ -10,7 +10,14 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # 只用到 QtCore/QtGui/QtWidgets，排除其余 Qt 模块和不需要的标准库，减小单文件解压量
+    excludes=[
+        'tkinter', 'unittest', 'pydoc', 'doctest', 'xmlrpc',
+        'PySide6.QtNetwork', 'PySide6.QtQml', 'PySide6.QtQuick', 'PySide6.QtQuickWidgets',
+        'PySide6.QtOpenGL', 'PySide6.QtOpenGLWidgets', 'PySide6.QtSvg', 'PySide6.QtPdf',
+        'PySide6.QtWebEngineCore', 'PySide6.QtWebEngineWidgets', 'PySide6.QtMultimedia',
+        'PySide6.Qt3DCore', 'PySide6.QtCharts', 'PySide6.QtDataVisualization',
+    ],
     noarchive=False,
     optimize=0,
 )
@@ -26,7 +33,8 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    # UPX 压缩的 Qt 库每次启动都要解压，关闭以缩短启动时间
+    upx=False,
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,
@@ -0,0 +1,5 @@
+# 测试公共配置：从仓库根目录导入 Source 和 Benchmark
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
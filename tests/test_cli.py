@@ -0,0 +1,63 @@
+# 命令行入口测试：冷启动导入预算、不导入 PySide6 和 winreg、list --json 输出
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+from Benchmark.BenchCli import ROOT_DIR, FORBIDDEN_MODULES, RunProbe
+from Benchmark.Fixture import BuildFixture, FixtureOptions
+from Source.Data.PluginReader import PluginSource
+
+# 导入 Cli 的耗时预算（毫秒），与 Benchmark/BenchCli.py 的默认预算一致
+IMPORT_BUDGET_MS = 300
+
+
+@pytest.fixture(scope="module")
+def Data(tmp_path_factory):
+    """小型模拟项目和引擎目录"""
+    return BuildFixture(tmp_path_factory.mktemp("Cli"), FixtureOptions(
+        ProjectPlugins=10, EnginePlugins=50, MarketplacePlugins=5, Seed=1
+    ))
+
+
+@pytest.fixture(scope="module")
+def Env(Data):
+    """子进程环境：缓存写入模拟目录，不开启追踪"""
+    Result = dict(os.environ, LOCALAPPDATA=str(Data.Root))
+    Result.pop("UEPM_TRACE", None)
+    return Result
+
+
+def GetListArgv(Data) -> list[str]:
+    """list --json 命令的参数（显式指定引擎目录，不查找注册表）"""
+    return ["--project", str(Data.ProjectPath), "--engine", str(Data.EnginePath), "list", "--json"]
+
+
+def test_import_budget(Data, Env):
+    """导入 Cli 在预算内（取多次最短，排除首次的磁盘缓存影响）"""
+    ImportTime = min(RunProbe(GetListArgv(Data), Env)["Import"] for _ in range(3)) * 1000
+    assert ImportTime < IMPORT_BUDGET_MS
+
+
+def test_no_gui_modules(Data, Env):
+    """指定引擎目录执行命令后未导入 PySide6、shiboken6 和 winreg"""
+    Probe = RunProbe(GetListArgv(Data), Env)
+    assert Probe["Code"] == 0
+    assert Probe["Loaded"] == [], f"导入了 {FORBIDDEN_MODULES} 中的模块"
+
+
+def test_list_json(Data, Env):
+    """list --json 按项目、商城、引擎的顺序列出全部插件"""
+    Output = subprocess.run(
+        [sys.executable, str(ROOT_DIR / "Cli.py")] + GetListArgv(Data),
+        env=Env, capture_output=True, text=True, encoding="utf-8", check=True
+    )
+    Plugins = json.loads(Output.stdout)
+
+    Expected = {(Name, Source.value) for Source, Names in Data.Names.items() for Name in Names}
+    assert {(Plugin["Name"], Plugin["Source"]) for Plugin in Plugins} == Expected
+    Order = [PluginSource.Project.value, PluginSource.Fab.value, PluginSource.Engine.value]
+    Sources = [Plugin["Source"] for Plugin in Plugins]
+    assert Sources == sorted(Sources, key=Order.index)
@@ -0,0 +1,44 @@
+# 插件读取器测试
+import json
+
+from Source.Data.PluginReader import PluginReader, PluginSource, ReadPluginFields
+
+
+def WriteProject(Root, Plugins: dict):
+    """创建只有项目插件的模拟项目，Plugins 为 插件名 -> 描述文件内容"""
+    (Root / "Test.uproject").write_text(json.dumps({"EngineAssociation": "5.3", "Plugins": []}), encoding="utf-8")
+    for Name, Descriptor in Plugins.items():
+        PluginDir = Root / "Plugins" / Name
+        PluginDir.mkdir(parents=True)
+        (PluginDir / f"{Name}.uplugin").write_text(json.dumps(Descriptor), encoding="utf-8")
+
+
+def test_null_and_non_string_fields(tmp_path):
+    """字段为 null 或类型不对时按缺省处理，不中断同批其他插件"""
+    WriteProject(tmp_path, {
+        "Broken": {
+            "Version": None,
+            "Description": None,
+            "Category": None,
+            "CreatedBy": 42,
+            "DocsURL": ["x"],
+            "Modules": None,
+            "Plugins": [{"Name": None}, {"Name": 7, "Enabled": True}, "Bad", {"Name": "Good"}]
+        },
+        "Good": {"Version": 2, "Category": "Misc", "CreatedBy": "Epic"}
+    })
+
+    Fields = ReadPluginFields(tmp_path / "Plugins" / "Broken" / "Broken.uplugin")
+    assert Fields["Version"] == ""
+    assert Fields["Description"] == "" and Fields["DocsURL"] == ""
+    assert Fields["Category"] == "" and Fields["CreatedBy"] == ""
+    assert Fields["Modules"] == []
+    assert Fields["Plugins"] == ["Good"]
+
+    Reader = PluginReader(tmp_path, Workers=1, EnginePath=tmp_path / "NoEngine")
+    Plugins = {Plugin.Name: Plugin for Batch in Reader.IterPluginBatches() for Plugin in Batch}
+    assert not Reader.Errors
+    assert set(Plugins) == {"Broken", "Good"}
+    assert Plugins["Broken"].Source == PluginSource.Project
+    assert Plugins["Broken"].Plugins == ["Good"]
+    assert Plugins["Good"].Version == "2" and Plugins["Good"].Category == "Misc"
@@ -0,0 +1,31 @@
+# 插件目录扫描测试
+from Source.Data.PluginScanner import IterPluginFiles
+
+
+def MakePlugin(Dir, Name: str):
+    """在 Dir/Name 下创建插件描述文件"""
+    PluginDir = Dir / Name
+    PluginDir.mkdir(parents=True)
+    (PluginDir / f"{Name}.uplugin").write_text("{}", encoding="utf-8")
+    return PluginDir
+
+
+def test_group_dirs_named_like_excluded_dirs(tmp_path):
+    """插件外名称在排除列表中或以 . 开头的分组目录照常遍历，插件内的排除目录跳过"""
+    MakePlugin(tmp_path / "Extras", "Foo")
+    MakePlugin(tmp_path / "Source" / "Content", "Bar")
+    MakePlugin(tmp_path / ".Group", "Baz")
+    Outer = MakePlugin(tmp_path, "Outer")
+    MakePlugin(Outer / "Content", "InContent")
+    MakePlugin(Outer / "Plugins" / "Misc", "Nested")
+    MakePlugin(Outer / "Plugins" / "Intermediate", "Skipped")
+
+    Found = {File.stem for File in IterPluginFiles(tmp_path)}
+    assert Found == {"Foo", "Bar", "Baz", "Outer", "Nested"}
+
+
+def test_skip_dirs(tmp_path):
+    """SkipDirs 在任何层级都跳过"""
+    MakePlugin(tmp_path / "Marketplace", "Fab")
+    MakePlugin(tmp_path, "Engine")
+    assert {File.stem for File in IterPluginFiles(tmp_path, SkipDirs=frozenset({"Marketplace"}))} == {"Engine"}